@@ -0,0 +1,231 @@
+"""
+Benchmark profil browser scraping (default vs lean) pada halaman yang disajikan lokal.
+
+Halaman listing diambil dari arsip HTML hasil scraping (``--archive-file``)
+atau, jika arsip tidak ada, dibuat dari korpus sintetis. Semua halaman
+disajikan oleh server HTTP lokal dengan path yang sama seperti Sinta, dan
+setiap URL aset (gambar, CSS, font, script) di dalamnya diarahkan ke server
+yang sama dengan latensi buatan (``--asset-delay``) agar bobot halaman asli
+tetap terasa tanpa akses jaringan. Halaman sintetis ditambah
+``--assets-per-page`` gambar serta stylesheet dengan font.
+
+Untuk setiap profil diukur waktu ``scrape_page`` per halaman (load, ready,
+parse), jumlah artikel yang di-parse (harus sama antar profil) dan jumlah
+request aset yang sampai ke server.
+
+Profil default membuka jendela Chrome biasa, sehingga di server tanpa
+display jalankan benchmark lewat ``xvfb-run``.
+
+Contoh:
+    python -m benchmarks.bench_browser --pages 20
+    xvfb-run python -m benchmarks.bench_browser --archive-file data/archive/sinta_pages --asset-delay 30
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.run_benchmarks import quiet_stdout
+from benchmarks.synthetic_corpus import ARTICLES_PER_PAGE, generate_articles, generate_listing_pages
+from interfaces.page_archive import ARCHIVE_FILE, PageArchive
+from usecases.scraper import BROWSER_PROFILES, LISTING_URL, make_driver, scrape_page
+
+LISTING_PATH = urlsplit(LISTING_URL).path
+ASSET_TYPES = {
+    'css': 'text/css', 'js': 'application/javascript', 'png': 'image/png', 'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg', 'gif': 'image/gif', 'svg': 'image/svg+xml', 'ico': 'image/x-icon',
+    'woff': 'font/woff', 'woff2': 'font/woff2', 'ttf': 'font/ttf',
+}
+ASSET_PATTERN = re.compile(
+    r'''(src|href)=(["'])([^"']+\.(%s))(\?[^"']*)?\2''' % '|'.join(ASSET_TYPES), re.IGNORECASE
+)
+ASSET_BYTES = 30 * 1024
+TIMING_FIELDS = ('load_seconds', 'ready_seconds', 'parse_seconds', 'total_seconds')
+
+
+def localize_assets(page_html):
+    """Mengarahkan semua URL aset di halaman ke /static/ server lokal."""
+    def replace(match):
+        digest = hashlib.md5(match.group(3).encode('utf-8')).hexdigest()[:16]
+        return f'{match.group(1)}={match.group(2)}/static/{digest}.{match.group(4).lower()}{match.group(2)}'
+    return ASSET_PATTERN.sub(replace, page_html)
+
+
+def add_synthetic_assets(page_html, page_num, count):
+    """Menambahkan gambar dan stylesheet ber-font ke halaman sintetis (meniru bobot halaman Sinta)."""
+    images = ''.join(f'<img src="/static/p{page_num}_{i}.png" width="64" height="64">' for i in range(count))
+    head = '<link rel="stylesheet" href="/static/app.css"><link rel="stylesheet" href="/static/icons.css">'
+    return page_html.replace('</head>', head + '</head>', 1).replace('</body>', images + '</body>', 1)
+
+
+def load_pages(archive_file, num_pages, assets_per_page, seed=42):
+    """
+    Halaman listing untuk benchmark: dari arsip jika ada, selain itu sintetis
+
+    Returns:
+        Tuple (dict nomor halaman -> HTML, nama sumber)
+    """
+    if archive_file and os.path.exists(f'{archive_file}.idx'):
+        archive = PageArchive(archive_file)
+        entries = sorted(archive.latest().items())[:num_pages]
+        if entries:
+            return {page: localize_assets(archive.get(entry)) for page, entry in entries}, archive_file
+    articles = generate_articles(num_pages * ARTICLES_PER_PAGE, seed=seed)
+    pages = {
+        page_num: add_synthetic_assets(localize_assets(page_html), page_num, assets_per_page)
+        for page_num, page_html in generate_listing_pages(articles)
+    }
+    return pages, 'synthetic'
+
+
+class PageServer(ThreadingHTTPServer):
+    """Server lokal yang menyajikan halaman listing dan aset dengan latensi buatan."""
+
+    daemon_threads = True
+
+    def __init__(self, pages, asset_delay):
+        super().__init__(('127.0.0.1', 0), PageRequestHandler)
+        self.pages = pages
+        self.asset_delay = asset_delay
+        self.asset_requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def listing_url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}{LISTING_PATH}?view=googlescholar&page={{}}'
+
+
+class PageRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path.startswith('/static/'):
+            with self.server.lock:
+                self.server.asset_requests += 1
+            time.sleep(self.server.asset_delay)
+            extension = url.path.rsplit('.', 1)[-1]
+            if extension == 'css':
+                body = ('@font-face{font-family:bench;src:url(/static/font.woff2)}'
+                        'body{font-family:bench}' + ' ' * ASSET_BYTES).encode('utf-8')
+            else:
+                body = b'\0' * ASSET_BYTES
+            self._send(200, ASSET_TYPES.get(extension, 'application/octet-stream'), body)
+            return
+        page = parse_qs(url.query).get('page', [''])[0]
+        if url.path.rstrip('/') == LISTING_PATH.rstrip('/') and page.isdigit() and int(page) in self.server.pages:
+            self._send(200, 'text/html; charset=utf-8', self.server.pages[int(page)].encode('utf-8'))
+        else:
+            self._send(404, 'text/plain', b'not found')
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def summarize(samples):
+    """Rata-rata, p50 dan p90 per komponen waktu (detik)."""
+    summary = {}
+    for field in TIMING_FIELDS:
+        values = sorted(sample[field] for sample in samples)
+        if not values:
+            continue
+        summary[field] = {
+            'mean': round(statistics.fmean(values), 4),
+            'p50': round(values[len(values) // 2], 4),
+            'p90': round(values[min(len(values) - 1, int(len(values) * 0.9))], 4),
+        }
+    return summary
+
+
+def benchmark_profile(profile, server, page_numbers):
+    """
+    Mengukur scrape_page untuk semua halaman dengan satu profil browser
+
+    Halaman pertama dimuat sekali sebagai pemanasan (start Chrome tidak diukur).
+    """
+    driver = make_driver(profile)
+    try:
+        with quiet_stdout():
+            scrape_page(driver, page_numbers[0], listing_url=server.listing_url)
+        server.asset_requests = 0
+        samples, articles = [], 0
+        start = time.perf_counter()
+        for page_num in page_numbers:
+            timings = {}
+            page_start = time.perf_counter()
+            with quiet_stdout():
+                articles += len(scrape_page(driver, page_num, listing_url=server.listing_url, timings=timings))
+            timings['total_seconds'] = time.perf_counter() - page_start
+            samples.append(timings)
+        elapsed = time.perf_counter() - start
+    finally:
+        driver.quit()
+    return {
+        'pages': len(page_numbers),
+        'articles': articles,
+        'asset_requests': server.asset_requests,
+        'pages_per_sec': round(len(page_numbers) / elapsed, 2) if elapsed > 0 else None,
+        'timings': summarize(samples),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark profil browser scraping pada halaman lokal.')
+    parser.add_argument('--archive-file', default=ARCHIVE_FILE, help=f'Arsip HTML sumber halaman (default: {ARCHIVE_FILE})')
+    parser.add_argument('--pages', type=int, default=20, help='Jumlah halaman yang diukur (default: 20)')
+    parser.add_argument('--profiles', nargs='+', default=list(BROWSER_PROFILES), choices=BROWSER_PROFILES,
+                        help='Profil browser yang dibandingkan (default: semua)')
+    parser.add_argument('--asset-delay', type=float, default=20.0, help='Latensi buatan per aset dalam ms (default: 20)')
+    parser.add_argument('--assets-per-page', type=int, default=20,
+                        help='Jumlah gambar tambahan per halaman sintetis (default: 20)')
+    parser.add_argument('--output', default='bench_browser.json', help='File JSON hasil benchmark')
+    args = parser.parse_args(argv)
+
+    pages, source = load_pages(args.archive_file, args.pages, args.assets_per_page)
+    page_numbers = sorted(pages)
+    server = PageServer(pages, args.asset_delay / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Menyajikan {len(pages)} halaman ({source}) di {server.listing_url.format('N')}")
+
+    results = {}
+    try:
+        for profile in args.profiles:
+            print(f"Mengukur profil {profile}...")
+            results[profile] = benchmark_profile(profile, server, page_numbers)
+    finally:
+        server.shutdown()
+
+    print(f"\n{'profil':<10}{'hal/detik':>10}{'load p50':>10}{'ready p50':>11}{'total p50':>11}{'total p90':>11}"
+          f"{'aset':>7}{'artikel':>9}")
+    for profile, result in results.items():
+        timings = result['timings']
+        print(f"{profile:<10}{result['pages_per_sec'] or 0:>10.2f}{timings['load_seconds']['p50']:>10.3f}"
+              f"{timings['ready_seconds']['p50']:>11.3f}{timings['total_seconds']['p50']:>11.3f}"
+              f"{timings['total_seconds']['p90']:>11.3f}{result['asset_requests']:>7}{result['articles']:>9}")
+    if len({result['articles'] for result in results.values()}) > 1:
+        print("Perhatian: jumlah artikel berbeda antar profil")
+    if 'default' in results and 'lean' in results:
+        default_total = results['default']['timings']['total_seconds']['mean']
+        lean_total = results['lean']['timings']['total_seconds']['mean']
+        print(f"Profil lean {default_total / lean_total:.2f}x lebih cepat per halaman")
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'source': source, 'asset_delay_ms': args.asset_delay, 'results': results}, file, indent=2)
+    print(f"Hasil ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark backend classifier SDGs pada ``label_sdgs.csv``.
+
+Setiap backend di ``interfaces.label_sdgs.CLASSIFIER_BACKENDS`` dilatih pada
+bagian latih (split stratified) dan diuji pada bagian uji. Yang diukur: waktu
+fitting (TF-IDF + classifier), waktu prediksi top-k, akurasi top-1 dan
+akurasi top-k. Jika file label tidak tersedia, dipakai korpus sintetis dengan
+label kata kunci seperti pada ``run_benchmarks``.
+
+Pembanding (``random_forest_serial``) adalah RandomForest seperti sebelum
+backend lain ditambahkan: ``n_jobs=None``, satu core. Semua backend, termasuk
+``random_forest`` dengan ``--n-jobs``, dibandingkan terhadapnya.
+
+Contoh:
+    python -m benchmarks.bench_label_sdgs
+    python -m benchmarks.bench_label_sdgs --backends random_forest sgd --n-jobs 4
+    python -m benchmarks.bench_label_sdgs --synthetic 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.model_selection import train_test_split
+
+from benchmarks.run_benchmarks import synthetic_label
+from benchmarks.synthetic_corpus import generate_articles
+from interfaces.label_sdgs import (
+    CLASSIFIER_BACKENDS, DEFAULT_N_JOBS, DEFAULT_TOP_K, LABEL_FILE,
+    build_classifier, engine_config, load_training_data, predict_top_k,
+)
+
+BASELINE = 'random_forest_serial'
+
+
+def load_dataset(label_file, synthetic_rows, seed=42):
+    """
+    Memuat data latih dari file label, atau membuat data sintetis
+
+    Returns:
+        Tuple (list judul, numpy array label, deskripsi sumber data)
+    """
+    if synthetic_rows is None and os.path.exists(label_file):
+        titles, labels = load_training_data(label_file)
+        return titles, np.asarray(labels.astype(str)), label_file
+    rows = synthetic_rows or 5000
+    titles = [article['Title'] for article in generate_articles(rows, seed=seed)]
+    return titles, np.asarray([synthetic_label(title) for title in titles]), f'sintetis ({rows} baris)'
+
+
+def split_dataset(titles, labels, test_size=0.2, seed=42):
+    """Split latih/uji, stratified jika setiap kelas memiliki minimal 2 contoh."""
+    _, counts = np.unique(labels, return_counts=True)
+    stratify = labels if counts.min() >= 2 else None
+    return train_test_split(titles, labels, test_size=test_size, random_state=seed, stratify=stratify)
+
+
+def benchmark_backend(backend, train_titles, train_labels, test_titles, test_labels, n_jobs, top_k):
+    """
+    Melatih dan menguji satu backend
+
+    Returns:
+        Dict metrik waktu dan akurasi
+    """
+    config = engine_config(backend)
+    start = time.perf_counter()
+    vectorizer = TfidfVectorizer(max_features=config['max_features'])
+    X_train = vectorizer.fit_transform(train_titles)
+    model = build_classifier(config, n_jobs)
+    model.fit(X_train, train_labels)
+    fit_seconds = time.perf_counter() - start
+
+    bundle = {'vectorizer': vectorizer, 'model': model}
+    start = time.perf_counter()
+    labels, _ = predict_top_k(bundle, test_titles, top_k)
+    predict_seconds = time.perf_counter() - start
+
+    expected = np.asarray(test_labels, dtype=object)
+    return {
+        'fit_seconds': round(fit_seconds, 4),
+        'predict_seconds': round(predict_seconds, 4),
+        'predict_rows_per_sec': round(len(test_titles) / predict_seconds, 1) if predict_seconds > 0 else None,
+        'accuracy': round(float(np.mean(labels[:, 0] == expected)), 4),
+        f'top{top_k}_accuracy': round(float(np.mean((labels == expected[:, None]).any(axis=1))), 4),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bandingkan backend classifier SDGs (waktu dan akurasi).')
+    parser.add_argument('--label-file', default=LABEL_FILE, help=f'File CSV data latih (default: {LABEL_FILE})')
+    parser.add_argument('--synthetic', type=int, help='Pakai korpus sintetis dengan jumlah baris ini')
+    parser.add_argument('--backends', nargs='+', default=list(CLASSIFIER_BACKENDS), choices=CLASSIFIER_BACKENDS,
+                        help='Backend yang dibandingkan (default: semua)')
+    parser.add_argument('--n-jobs', type=int, default=DEFAULT_N_JOBS, help='Jumlah core (default: -1, semua core)')
+    parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K, help='k untuk akurasi top-k (default: 3)')
+    parser.add_argument('--output', default='bench_label_sdgs.json', help='File JSON hasil benchmark')
+    args = parser.parse_args(argv)
+
+    titles, labels, source = load_dataset(args.label_file, args.synthetic)
+    train_titles, test_titles, train_labels, test_labels = split_dataset(titles, labels)
+    print(f"Data: {source}, {len(train_titles)} latih / {len(test_titles)} uji, {len(set(labels))} kelas")
+
+    results = {BASELINE: benchmark_backend(
+        'random_forest', train_titles, train_labels, test_titles, test_labels, None, args.top_k
+    )}
+    for backend in args.backends:
+        results[backend] = benchmark_backend(
+            backend, train_titles, train_labels, test_titles, test_labels, args.n_jobs, args.top_k
+        )
+
+    table = pd.DataFrame(results).T
+    print(table.to_string())
+    baseline = results[BASELINE]
+    for backend, stats in results.items():
+        if backend != BASELINE and stats['fit_seconds'] > 0:
+            print(f"{backend}: fit {baseline['fit_seconds'] / stats['fit_seconds']:.1f}x, "
+                  f"predict {baseline['predict_seconds'] / max(stats['predict_seconds'], 1e-9):.1f}x "
+                  f"dibanding {BASELINE} (n_jobs=None)")
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'source': source, 'n_jobs': args.n_jobs, 'top_k': args.top_k, 'results': results}, file, indent=2)
+    print(f"Hasil benchmark disimpan di {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Uji beban scraper terhadap server Sinta tiruan (``benchmarks.sinta_stub``).
+
+Setiap mode konkurensi dijalankan terhadap server baru dengan korpus yang
+sama:
+
+- ``single``: satu proses ``scrape_articles_with_login`` untuk seluruh rentang
+- ``sharded:N``: N proses worker ``scrape_shards_with_login`` dengan lease
+  shard di direktori sementara, lalu ``merge_shards``
+
+Worker berjalan di proses terpisah dan menulis metriknya ke JSON-lines.
+Dari sana dihitung halaman per detik, p50/p99 latensi halaman (termasuk
+retry dan login ulang, metrik ``page_total_seconds``), jumlah retry, login
+ulang, halaman gagal, serta tingkat duplikat: porsi artikel terambil yang
+tidak masuk hasil akhir (dibuang worker atau saat merge) dan porsi halaman
+yang diambil lebih dari sekali di server. Hasil akhir juga dibandingkan dengan
+artikel unik korpus (``missing`` = artikel yang tidak ikut tersimpan).
+
+Dengan ``--driver http`` Chrome diganti ``HttpDriver`` (tanpa JavaScript
+dan aset). Mode ini cepat untuk menyetel jeda antar halaman, retry dan
+jumlah worker. ``--driver chrome`` memakai ``make_driver`` dengan
+``--browser-profile``.
+
+Contoh:
+    python -m benchmarks.bench_scraper_load --pages 60 --modes single sharded:2 sharded:4 \\
+        --latency lognormal:0.15:0.6 --error-rate 0.02 --session-pages 40 --page-delay 0
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from benchmarks.sinta_stub import STUB_EMAIL, STUB_PASSWORD, HttpDriver, SintaStub, make_pages
+from entities.article import ArticleBatch
+from interfaces.metrics import metrics, percentile
+from interfaces.shard_leases import ShardLeases
+from usecases import scraper, sharding
+from usecases.scraper import BROWSER_PROFILES, article_keys, deduplicate_articles, parse_articles
+
+START_PAGE = 1
+COUNTERS = ('page_retries', 'relogins', 'pages_failed', 'articles_new', 'articles_duplicate')
+
+
+def expected_articles(pages):
+    """Artikel unik korpus dalam urutan halaman (hasil yang diharapkan dari scraping tanpa gagal)."""
+    articles = ArticleBatch.from_articles(
+        article for page_num in sorted(pages) for article in parse_articles(pages[page_num], verbose=False)
+    )
+    return deduplicate_articles(articles)
+
+
+def _run_worker(task):
+    """Menjalankan satu worker scraper di proses ini (target multiprocessing)."""
+    mode, work_dir, worker_index, options = task
+    if options['driver'] == 'http':
+        # Ganti Chrome dengan HttpDriver di modul yang membuat driver
+        scraper.make_driver = sharding.make_driver = lambda profile='default': HttpDriver()
+    os.chdir(work_dir)
+    metrics.configure(jsonl_path=os.path.join(work_dir, f'metrics_{worker_index}.jsonl'))
+    log_file = os.path.join(work_dir, f'worker_{worker_index}.log')
+    with open(log_file, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        if mode == 'single':
+            scraper.scrape_articles_with_login(
+                START_PAGE, START_PAGE + options['pages'] - 1, STUB_EMAIL, STUB_PASSWORD, archive_file=None,
+                browser_profile=options['browser_profile'], site_url=options['site_url'],
+                page_delay=options['page_delay'],
+            )
+        else:
+            sharding.scrape_shards_with_login(
+                os.path.join(work_dir, 'shards'), STUB_EMAIL, STUB_PASSWORD, worker_id=f'w{worker_index}',
+                archive=False, browser_profile=options['browser_profile'], site_url=options['site_url'],
+                page_delay=options['page_delay'],
+            )
+    metrics.flush()
+
+
+def read_worker_metrics(work_dir):
+    """Menggabungkan latensi halaman dan counter dari file JSON-lines semua worker."""
+    latencies, counters = [], dict.fromkeys(COUNTERS, 0)
+    for name in os.listdir(work_dir):
+        if not (name.startswith('metrics_') and name.endswith('.jsonl')):
+            continue
+        with open(os.path.join(work_dir, name), encoding='utf-8') as file:
+            for line in file:
+                event = json.loads(line)
+                if event['type'] == 'observation' and event['name'] == 'page_total_seconds':
+                    latencies.append(event['value'])
+                elif event['type'] == 'counter' and event['name'] in counters:
+                    counters[event['name']] += event['value']
+    return sorted(latencies), counters
+
+
+def run_mode(mode, server, options, expected):
+    """
+    Menjalankan satu mode konkurensi terhadap server dan mengukur hasilnya
+
+    Returns:
+        Dict hasil mode
+    """
+    workers = 1 if mode == 'single' else int(mode.split(':', 1)[1])
+    end_page = START_PAGE + options['pages'] - 1
+    work_dir = tempfile.mkdtemp(prefix='bench_scraper_')
+    server.reset_stats()
+    try:
+        if mode != 'single':
+            ShardLeases(os.path.join(work_dir, 'shards')).plan(START_PAGE, end_page, options['shard_pages'])
+        context = multiprocessing.get_context('spawn')
+        start = time.perf_counter()
+        processes = [context.Process(target=_run_worker, args=((mode, work_dir, index, options),))
+                     for index in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        output_file = os.path.join(work_dir, f'sinta_articles_{START_PAGE}_to_{end_page}.csv')
+        if mode != 'single':
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                sharding.merge_shards(os.path.join(work_dir, 'shards'), output_file)
+        elapsed = time.perf_counter() - start
+
+        latencies, counters = read_worker_metrics(work_dir)
+        output = ArticleBatch.read_csv(output_file) if os.path.exists(output_file) else ArticleBatch()
+        output_keys = article_keys(output)
+        fetched = counters['articles_new'] + counters['articles_duplicate']
+        stats = server.snapshot()
+        return {
+            'workers': workers,
+            'seconds': round(elapsed, 3),
+            'pages_per_sec': round(options['pages'] / elapsed, 2) if elapsed > 0 else None,
+            'page_p50': percentile(latencies, 0.5),
+            'page_p99': percentile(latencies, 0.99),
+            **counters,
+            # Duplikat yang dibuang worker ditambah duplikat antar shard yang dibuang saat merge
+            'duplicate_rate': round((fetched - len(output)) / fetched, 4) if fetched else None,
+            'page_refetch_rate': round(stats.get('pages_refetched', 0) / options['pages'], 4),
+            'articles': len(output),
+            'output_duplicates': len(output_keys) - len(set(output_keys)),
+            'missing': len(set(article_keys(expected)) - set(output_keys)),
+            'server': stats,
+            'exit_codes': [process.exitcode for process in processes],
+        }
+    finally:
+        if options['keep_dirs']:
+            print(f"  direktori kerja {mode}: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Uji beban mode konkurensi scraper terhadap server Sinta tiruan.')
+    parser.add_argument('--pages', type=int, default=60, help='Jumlah halaman listing (default: 60)')
+    parser.add_argument('--modes', nargs='+', default=['single', 'sharded:2', 'sharded:4'],
+                        help='Mode konkurensi: single dan/atau sharded:N (default: single sharded:2 sharded:4)')
+    parser.add_argument('--shard-pages', type=int, default=10, help='Jumlah halaman per shard (default: 10)')
+    parser.add_argument('--driver', default='http', choices=('http', 'chrome'),
+                        help='http (HttpDriver tanpa browser) atau chrome (default: http)')
+    parser.add_argument('--browser-profile', default='lean', choices=BROWSER_PROFILES,
+                        help='Profil Chrome untuk --driver chrome (default: lean)')
+    parser.add_argument('--page-delay', type=float, default=0.0, help='Jeda antar halaman per worker dalam detik (default: 0)')
+    parser.add_argument('--latency', default='lognormal:0.1:0.5', help='Distribusi latensi server (default: lognormal:0.1:0.5)')
+    parser.add_argument('--error-rate', type=float, default=0.02, help='Peluang HTTP 500 per halaman (default: 0.02)')
+    parser.add_argument('--empty-rate', type=float, default=0.01, help='Peluang halaman kosong (default: 0.01)')
+    parser.add_argument('--session-ttl', type=float, help='Umur sesi dalam detik')
+    parser.add_argument('--session-pages', type=int, default=40, help='Jumlah halaman per sesi (default: 40)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed korpus dan server (default: 42)')
+    parser.add_argument('--keep-dirs', action='store_true', help='Simpan direktori kerja (log worker, CSV, metrik)')
+    parser.add_argument('--output', default='bench_scraper_load.json', help='File JSON hasil benchmark')
+    args = parser.parse_args(argv)
+
+    for mode in args.modes:
+        if mode != 'single' and not (mode.startswith('sharded:') and mode.split(':', 1)[1].isdigit()):
+            parser.error(f"Mode tidak dikenal: {mode} (single atau sharded:N)")
+
+    pages = make_pages(args.pages, seed=args.seed, start_page=START_PAGE)
+    expected = expected_articles(pages)
+    options = {
+        'pages': args.pages, 'shard_pages': args.shard_pages, 'driver': args.driver,
+        'browser_profile': args.browser_profile, 'page_delay': args.page_delay, 'keep_dirs': args.keep_dirs,
+    }
+    results = {}
+    for mode in args.modes:
+        # Server baru per mode agar urutan latensi/error sama untuk setiap mode
+        server = SintaStub(pages, latency=args.latency, error_rate=args.error_rate, empty_rate=args.empty_rate,
+                           session_ttl=args.session_ttl, session_pages=args.session_pages, seed=args.seed)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        options['site_url'] = server.site_url
+        print(f"Mengukur mode {mode} ({args.pages} halaman, driver {args.driver})...")
+        try:
+            results[mode] = run_mode(mode, server, options, expected)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print(f"\n{'mode':<12}{'hal/detik':>10}{'p50':>8}{'p99':>8}{'retry':>7}{'relogin':>9}{'gagal':>7}"
+          f"{'dup%':>7}{'refetch%':>10}{'artikel':>9}{'hilang':>8}")
+    for mode, result in results.items():
+        p50 = f"{result['page_p50']:.3f}" if result['page_p50'] is not None else '-'
+        p99 = f"{result['page_p99']:.3f}" if result['page_p99'] is not None else '-'
+        print(f"{mode:<12}{result['pages_per_sec'] or 0:>10.2f}{p50:>8}{p99:>8}{result['page_retries']:>7}"
+              f"{result['relogins']:>9}{result['pages_failed']:>7}{(result['duplicate_rate'] or 0) * 100:>7.2f}"
+              f"{result['page_refetch_rate'] * 100:>10.2f}{result['articles']:>9}{result['missing']:>8}")
+        if result['output_duplicates'] or any(result['exit_codes']):
+            print(f"  Perhatian: {result['output_duplicates']} duplikat di hasil, exit code worker {result['exit_codes']}")
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'pages': args.pages, 'expected_articles': len(expected), 'latency': args.latency,
+                   'error_rate': args.error_rate, 'empty_rate': args.empty_rate,
+                   'session_pages': args.session_pages, 'session_ttl': args.session_ttl,
+                   'driver': args.driver, 'results': results}, file, indent=2)
+    print(f"Hasil ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
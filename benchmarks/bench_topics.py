@@ -0,0 +1,117 @@
+"""
+Benchmark topic modeling (online LDA / MiniBatchNMF) terhadap ukuran korpus.
+
+Untuk setiap ukuran dan metode diukur: waktu membangun vocabulary dan
+melatih model awal (fit penuh per mini-batch), waktu pembaruan inkremental
+``partial_fit`` dengan delta 10% data baru, waktu menghitung prevalensi
+topik per tahun, dan puncak memori (RSS). Setiap kombinasi dijalankan di
+proses anak tersendiri agar puncak RSS-nya tidak tercampur dengan ukuran
+lain (tracemalloc tidak dipakai karena memperlambat E-step LDA sekitar 10x).
+Judul diambil dari korpus sintetis dan hanya di-lowercase (tahap NLP diukur
+terpisah di ``run_benchmarks``).
+
+Contoh:
+    python -m benchmarks.bench_topics --sizes 1k 10k 100k
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.run_benchmarks import SIZES
+from benchmarks.synthetic_corpus import generate_articles
+from interfaces.topics import (
+    DEFAULT_N_TOPICS, TOPIC_METHODS, document_topics, topic_prevalence_by_year, update_model,
+)
+
+# Proporsi data yang ditahan sebagai delta scraping berikutnya
+DELTA_FRACTION = 0.1
+
+
+def synthetic_frame(num_rows, seed=42):
+    """DataFrame judul/link/tahun sintetis dengan format hasil NLP."""
+    articles = generate_articles(num_rows, seed=seed)
+    return pd.DataFrame({
+        'Title': [article['Title'].lower() for article in articles],
+        'Link': [article['Link'] for article in articles],
+        'Year': [article['Year'] if article['Year'] != '-' else 'Unknown' for article in articles],
+    })
+
+
+def max_rss_mb():
+    """Puncak RSS proses ini dalam MB (ru_maxrss: KB di Linux, byte di macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def measure(func):
+    """Menjalankan func dan mengembalikan (hasil, detik)."""
+    start = time.perf_counter()
+    result = func()
+    return result, round(time.perf_counter() - start, 4)
+
+
+def benchmark_method(num_rows, method, n_topics, work_dir):
+    """Mengukur fit awal, pembaruan delta dan agregasi tren untuk satu metode (di proses anak)."""
+    df = synthetic_frame(num_rows)
+    model_file = os.path.join(work_dir, f'topics_{method}_{num_rows}.joblib')
+    split = int(len(df) * (1 - DELTA_FRACTION))
+    initial, full = df.iloc[:split], df
+    baseline_rss = max_rss_mb()
+
+    _, fit_seconds = measure(lambda: update_model(initial, model_file, method, n_topics, retrain=True))
+    bundle, delta_seconds = measure(lambda: update_model(full, model_file, method, n_topics))
+
+    def trends():
+        texts = full['Title'].tolist()
+        return topic_prevalence_by_year(full['Year'], document_topics(bundle, texts))
+    _, trend_seconds = measure(trends)
+    peak_rss = max_rss_mb()
+    return {
+        'fit_seconds': fit_seconds,
+        'fit_rows_per_sec': round(split / fit_seconds, 1) if fit_seconds > 0 else None,
+        'delta_seconds': delta_seconds,
+        'trends_seconds': trend_seconds,
+        'peak_rss_mb': round(peak_rss, 1),
+        'rss_growth_mb': round(peak_rss - baseline_rss, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark topic modeling terhadap ukuran korpus.')
+    parser.add_argument('--sizes', nargs='+', default=['1k', '10k'], choices=list(SIZES),
+                        help='Ukuran korpus (default: 1k 10k)')
+    parser.add_argument('--methods', nargs='+', default=list(TOPIC_METHODS), choices=TOPIC_METHODS,
+                        help='Metode yang diukur (default: semua)')
+    parser.add_argument('--topics', type=int, default=DEFAULT_N_TOPICS, help='Jumlah topik (default: 10)')
+    parser.add_argument('--output', default='bench_topics.json', help='File JSON hasil benchmark')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='sinta_topics_') as work_dir:
+        # Satu proses anak per pengukuran agar puncak RSS terisolasi
+        with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+            for size in args.sizes:
+                for method in args.methods:
+                    print(f"Benchmark {method} ukuran {size}...")
+                    results.setdefault(size, {})[method] = pool.apply(
+                        benchmark_method, (SIZES[size], method, args.topics, work_dir)
+                    )
+
+    rows = [{'size': size, 'method': method, **stats} for size, methods in results.items() for method, stats in methods.items()]
+    print(pd.DataFrame(rows).to_string(index=False))
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'topics': args.topics, 'results': results}, file, indent=2)
+    print(f"Hasil benchmark disimpan di {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
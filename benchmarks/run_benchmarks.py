@@ -0,0 +1,261 @@
+"""
+Benchmark end-to-end pipeline Sinta di atas korpus sintetis.
+
+Setiap tahap diukur terpisah pada tiap ukuran korpus:
+
+- ``parse_pages``      : parsing HTML listing dengan ``parse_articles`` (isi ``scrape_page``)
+- ``preprocess_csv``   : pembersihan CSV hasil scraping
+- ``process_batch``    : preprocessing NLP kolom Title
+- ``process_nlp``      : preprocessing NLP seluruh file (tanpa vektorisasi)
+- ``tfidf_fit``        : fitting TfidfVectorizer(max_features=1000)
+- ``label_sdgs_predict``: prediksi SDGs seperti pada ``label_sdgs.py``
+
+Hasil ditulis sebagai JSON dan dibandingkan dengan baseline tersimpan. Jika ada
+tahap yang lebih lambat dari toleransi, skrip keluar dengan kode 1.
+
+Contoh:
+    python -m benchmarks.run_benchmarks --sizes 1k 10k
+    python -m benchmarks.run_benchmarks --sizes 1k --update-baseline
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from benchmarks.synthetic_corpus import (
+    generate_articles, generate_listing_pages, write_articles_csv,
+)
+from interfaces import nlp_processor
+from interfaces.csv_preprocessor import preprocess_csv
+from interfaces.nlp_processor import process_batch, process_nlp
+from usecases.scraper import parse_articles
+
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+DEFAULT_SIZES = ['1k', '10k']
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Tahap dianggap regresi jika lebih lambat dari baseline * (1 + tolerance)
+# dan selisihnya melebihi MIN_ABS_REGRESSION detik (menghindari noise tahap singkat)
+DEFAULT_TOLERANCE = 0.25
+MIN_ABS_REGRESSION = 0.05
+
+# Kata kunci sederhana untuk membuat label SDG sintetis bagi data latih
+SDG_KEYWORDS = [
+    ('SDG 1: Tanpa Kemiskinan', ('kemiskinan', 'poverty')),
+    ('SDG 2: Tanpa Kelaparan', ('padi', 'jagung', 'rice', 'maize', 'pertanian', 'agriculture')),
+    ('SDG 3: Kehidupan Sehat dan Sejahtera', ('kesehatan', 'health')),
+    ('SDG 4: Pendidikan Berkualitas', ('pendidikan', 'education', 'siswa', 'students', 'belajar')),
+    ('SDG 8: Pekerjaan Layak dan Pertumbuhan Ekonomi', ('ekonomi', 'economic', 'usaha', 'enterprises')),
+    ('SDG 15: Ekosistem Daratan', ('hutan', 'forest', 'tanah', 'soil')),
+]
+
+
+@contextlib.contextmanager
+def quiet_stdout():
+    """Membuang output print selama tahap diukur (tetap ikut terhitung waktunya)."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def clear_nlp_caches():
+    """Mengosongkan cache NLP agar setiap tahap diukur dalam kondisi dingin."""
+    nlp_processor.normalize_text.cache_clear()
+    nlp_processor.stem_word.cache_clear()
+    nlp_processor.stem_cache.clear()
+    # Worker pool yang dipakai ulang juga menyimpan cache
+    nlp_processor.shutdown_executor()
+    # Stemmer Sastrawi menyimpan cache kata sendiri (CachedStemmer)
+    stemmer = nlp_processor.get_stemmer('id')
+    if hasattr(stemmer, 'get_cache'):
+        stemmer.get_cache().data.clear()
+
+
+def timed(func, rows):
+    """Menjalankan func dan mengembalikan (hasil, metrik waktu)."""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    return result, {
+        'seconds': round(seconds, 4),
+        'rows': rows,
+        'rows_per_sec': round(rows / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def synthetic_label(title):
+    """Memberi label SDG sintetis berdasarkan kata kunci judul."""
+    lowered = title.lower()
+    for label, keywords in SDG_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return label
+    return 'SDG 9: Industri, Inovasi, dan Infrastruktur'
+
+
+def benchmark_size(num_rows, work_dir, seed=42):
+    """
+    Menjalankan semua tahap benchmark untuk satu ukuran korpus
+
+    Args:
+        num_rows: Jumlah artikel sintetis
+        work_dir: Direktori kerja untuk file sementara
+        seed: Seed generator korpus
+
+    Returns:
+        Dict nama tahap -> metrik waktu
+    """
+    results = {}
+    articles = generate_articles(num_rows, seed=seed)
+    pages = generate_listing_pages(articles)
+
+    # 1. Parsing halaman listing
+    def parse_all():
+        with quiet_stdout():
+            return sum(len(parse_articles(page_html)) for _, page_html in pages)
+    _, results['parse_pages'] = timed(parse_all, num_rows)
+    del pages
+
+    # 2. Pembersihan CSV
+    raw_file = write_articles_csv(articles, os.path.join(work_dir, f'synthetic_{num_rows}.csv'))
+    del articles
+    with quiet_stdout():
+        processed_file, results['preprocess_csv'] = timed(lambda: preprocess_csv(raw_file), num_rows)
+    processed = pd.read_csv(processed_file)
+
+    # 3. NLP kolom Title (pemuatan kamus Sastrawi dan resource NLTK tidak ikut diukur)
+    nlp_processor.download_nltk_resources()
+    nlp_processor.get_stemmer('id')
+    titles = processed['Title'].fillna('').astype(str).tolist()
+    clear_nlp_caches()
+    nlp_titles, results['process_batch'] = timed(lambda: process_batch(titles), len(titles))
+
+    # 4. NLP seluruh file
+    clear_nlp_caches()
+    _, results['process_nlp'] = timed(lambda: process_nlp(processed_file, vectorize=False), len(processed))
+
+    # 5. Fitting TF-IDF
+    texts = [text for text in nlp_titles if text.strip()]
+    _, results['tfidf_fit'] = timed(lambda: TfidfVectorizer(max_features=1000).fit(texts), len(texts))
+
+    # 6. Prediksi SDGs (pola yang sama dengan label_sdgs.py)
+    train_size = min(len(texts), 2000)
+    train_texts = texts[:train_size]
+    train_labels = [synthetic_label(text) for text in train_texts]
+    vectorizer = TfidfVectorizer(max_features=1000)
+    model = RandomForestClassifier(random_state=42)
+    model.fit(vectorizer.fit_transform(train_texts), train_labels)
+    _, results['label_sdgs_predict'] = timed(
+        lambda: model.predict(vectorizer.transform(texts)), len(texts)
+    )
+    return results
+
+
+def compare_with_baseline(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Membandingkan hasil benchmark dengan baseline
+
+    Args:
+        current: Dict hasil (ukuran -> tahap -> metrik)
+        baseline: Dict baseline dengan struktur yang sama
+        tolerance: Toleransi relatif perlambatan
+
+    Returns:
+        List pesan regresi (kosong jika tidak ada regresi)
+    """
+    regressions = []
+    for size, stages in current.items():
+        for stage, metrics in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            limit = base['seconds'] * (1 + tolerance)
+            if metrics['seconds'] > limit and metrics['seconds'] - base['seconds'] > MIN_ABS_REGRESSION:
+                regressions.append(
+                    f"{size}/{stage}: {metrics['seconds']:.3f}s vs baseline {base['seconds']:.3f}s "
+                    f"(+{(metrics['seconds'] / base['seconds'] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark pipeline Sinta pada korpus sintetis.')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, choices=list(SIZES),
+                        help='Ukuran korpus yang diukur (default: 1k 10k)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed generator korpus (default: 42)')
+    parser.add_argument('--output', default='bench_results.json', help='File JSON hasil benchmark')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='File JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Toleransi perlambatan relatif sebelum dianggap regresi (default: 0.25)')
+    parser.add_argument('--update-baseline', action='store_true', help='Simpan hasil sebagai baseline baru')
+    parser.add_argument('--keep-data', help='Simpan korpus sintetis di direktori ini')
+    args = parser.parse_args(argv)
+
+    work_dir = args.keep_data or tempfile.mkdtemp(prefix='sinta_bench_')
+    os.makedirs(work_dir, exist_ok=True)
+
+    results = {}
+    try:
+        for size in args.sizes:
+            print(f"Benchmark ukuran {size} ({SIZES[size]} baris)...")
+            results[size] = benchmark_size(SIZES[size], work_dir, seed=args.seed)
+            for stage, metrics in results[size].items():
+                print(f"  {stage:<20} {metrics['seconds']:>9.3f}s  {metrics['rows_per_sec'] or 0:>12.1f} baris/detik")
+    finally:
+        if not args.keep_data:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"Hasil benchmark disimpan di {args.output}")
+
+    if args.update_baseline:
+        baseline = {'meta': report['meta'], 'results': {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as file:
+                baseline = json.load(file)
+            baseline['meta'] = report['meta']
+        baseline['results'].update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2)
+        print(f"Baseline diperbarui: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline {args.baseline} tidak ditemukan, perbandingan dilewati")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+    regressions = compare_with_baseline(results, baseline.get('results', {}), args.tolerance)
+    if regressions:
+        print("\n!!! REGRESI PERFORMA TERDETEKSI !!!")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+
+    print("Tidak ada regresi dibanding baseline.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
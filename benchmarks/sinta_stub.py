@@ -0,0 +1,352 @@
+"""
+Server tiruan situs Sinta untuk uji beban scraper tanpa menyentuh situs asli.
+
+Server meniru bagian Sinta yang dipakai scraper:
+
+- ``/logins``: form login (``username``, ``password``, tombol submit); login
+  yang benar membuat sesi (cookie) lalu redirect ke ``/profile``
+- ``/affiliations/profile/398/?view=googlescholar&page=N``: halaman listing
+  dari korpus sintetis (``benchmarks.synthetic_corpus``)
+- sesi kedaluwarsa (setelah ``session_ttl`` detik atau ``session_pages``
+  halaman) dan request tanpa sesi di-redirect ke homepage ``/``, seperti
+  Sinta asli, sehingga jalur login ulang di ``fetch_page`` ikut teruji
+
+Latensi halaman listing diambil dari distribusi yang bisa diatur
+(``fixed:S``, ``uniform:MIN:MAX``, ``lognormal:MEDIAN:SIGMA``), dan error
+sesekali disuntikkan: HTTP 500 (``error_rate``) atau halaman tanpa artikel
+(``empty_rate``). Server mencatat jumlah request, login, redirect sesi
+habis, error yang disuntikkan dan berapa kali setiap halaman diambil.
+
+``HttpDriver`` adalah pengganti minimal webdriver Selenium berbasis urllib
+(tanpa JavaScript maupun aset) untuk menjalankan ``login``, ``scrape_page``
+dan ``fetch_page`` terhadap server ini tanpa Chrome.
+
+Contoh:
+    python -m benchmarks.sinta_stub --pages 100 --latency lognormal:0.2:0.5 --error-rate 0.02
+"""
+
+import argparse
+import html
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.cookiejar import CookieJar
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, urlencode, urljoin, urlsplit
+from urllib.request import HTTPCookieProcessor, build_opener
+
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from benchmarks.synthetic_corpus import ARTICLES_PER_PAGE, generate_articles, generate_listing_pages
+from usecases.scraper import LISTING_PATH, LOGIN_PATH
+
+STUB_EMAIL = 'stub@unila.ac.id'
+STUB_PASSWORD = 'stub'
+SESSION_COOKIE = 'sinta_stub_session'
+
+LOGIN_PAGE = (
+    '<!DOCTYPE html><html><head><title>SINTA - Login</title></head><body>{error}'
+    '<form method="post" action="' + LOGIN_PATH + '">'
+    '<input type="text" name="username"><input type="password" name="password">'
+    '<button type="submit">Login</button></form></body></html>'
+)
+HOME_PAGE = '<!DOCTYPE html><html><head><title>SINTA</title></head><body><a href="/logins">Login</a></body></html>'
+PROFILE_PAGE = '<!DOCTYPE html><html><head><title>SINTA - Profile</title></head><body>Profile</body></html>'
+ERROR_PAGE = '<!DOCTYPE html><html><head><title>500</title></head><body>Internal Server Error</body></html>'
+
+
+def parse_latency(spec):
+    """
+    Distribusi latensi dari spesifikasi teks
+
+    Args:
+        spec: 'none', 'fixed:S', 'uniform:MIN:MAX' atau 'lognormal:MEDIAN:SIGMA' (detik)
+
+    Returns:
+        Fungsi rng -> latensi dalam detik
+    """
+    kind, *values = spec.split(':')
+    try:
+        values = [float(value) for value in values]
+    except ValueError:
+        raise ValueError(f"Spesifikasi latensi tidak valid: {spec}") from None
+    if kind == 'none' and not values:
+        return lambda rng: 0.0
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'lognormal' and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"Spesifikasi latensi tidak valid: {spec} (none, fixed:S, uniform:MIN:MAX, lognormal:MEDIAN:SIGMA)")
+
+
+def make_pages(num_pages, seed=42, duplicate_rate=0.02, start_page=1):
+    """Halaman listing sintetis: dict nomor halaman -> HTML."""
+    articles = generate_articles(num_pages * ARTICLES_PER_PAGE, seed=seed, duplicate_rate=duplicate_rate)
+    return dict(generate_listing_pages(articles, start_page=start_page))
+
+
+class SintaStub(ThreadingHTTPServer):
+    """Server Sinta tiruan dengan login, sesi kedaluwarsa, latensi dan error yang bisa diatur."""
+
+    daemon_threads = True
+
+    def __init__(self, pages, latency='none', error_rate=0.0, empty_rate=0.0, session_ttl=None, session_pages=None,
+                 email=STUB_EMAIL, password=STUB_PASSWORD, seed=42, host='127.0.0.1', port=0):
+        super().__init__((host, port), StubRequestHandler)
+        self.pages = pages
+        self.latency = parse_latency(latency) if isinstance(latency, str) else latency
+        self.error_rate = error_rate
+        self.empty_rate = empty_rate
+        self.session_ttl = session_ttl
+        self.session_pages = session_pages
+        self.credentials = (email, password)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.stats = Counter()
+        self.page_hits = Counter()
+
+    @property
+    def site_url(self):
+        return f'http://{self.server_address[0]}:{self.server_address[1]}'
+
+    def draw(self):
+        """Latensi dan jenis respons (ok/error/empty) untuk satu request listing."""
+        with self.lock:
+            delay = max(0.0, self.latency(self.rng))
+            roll = self.rng.random()
+        if roll < self.error_rate:
+            return delay, 'error'
+        if roll < self.error_rate + self.empty_rate:
+            return delay, 'empty'
+        return delay, 'ok'
+
+    def new_session(self):
+        with self.lock:
+            token = f'{self.rng.getrandbits(64):016x}'
+            self.sessions[token] = {'created': time.monotonic(), 'pages': 0}
+        return token
+
+    def use_session(self, token):
+        """
+        Memakai sesi untuk satu halaman listing
+
+        Returns:
+            'ok', 'expired' (sesi habis, dihapus) atau 'missing'
+        """
+        with self.lock:
+            session = self.sessions.get(token)
+            if session is None:
+                return 'missing'
+            expired = (self.session_ttl is not None and time.monotonic() - session['created'] > self.session_ttl) or \
+                      (self.session_pages is not None and session['pages'] >= self.session_pages)
+            if expired:
+                del self.sessions[token]
+                return 'expired'
+            session['pages'] += 1
+            return 'ok'
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.stats[name] += value
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+            self.page_hits.clear()
+            self.sessions.clear()
+
+    def snapshot(self):
+        """Statistik server: counter request dan jumlah halaman yang diambil lebih dari sekali."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['pages_served'] = len(self.page_hits)
+            stats['pages_refetched'] = sum(1 for hits in self.page_hits.values() if hits > 1)
+        return stats
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.server.count('requests')
+        if url.path == LOGIN_PATH:
+            self._send(200, LOGIN_PAGE.format(error=''))
+        elif url.path == '/':
+            self._send(200, HOME_PAGE)
+        elif url.path == '/profile':
+            self._send(200, PROFILE_PAGE)
+        elif url.path == urlsplit(LISTING_PATH).path:
+            self._listing(parse_qs(url.query).get('page', [''])[0])
+        else:
+            self._send(404, 'not found')
+
+    def do_POST(self):
+        self.server.count('requests')
+        if urlsplit(self.path).path != LOGIN_PATH:
+            self._send(404, 'not found')
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8'))
+        credentials = (form.get('username', [''])[0], form.get('password', [''])[0])
+        if credentials != self.server.credentials:
+            self.server.count('failed_logins')
+            self._send(200, LOGIN_PAGE.format(error='<div class="alert">Login gagal</div>'))
+            return
+        self.server.count('logins')
+        token = self.server.new_session()
+        self._redirect('/profile', cookie=token)
+
+    def _listing(self, page):
+        self.server.count('listing_requests')
+        token = SimpleCookie(self.headers.get('Cookie', '')).get(SESSION_COOKIE)
+        state = self.server.use_session(token.value if token else None)
+        if state != 'ok':
+            # Sinta mengarahkan sesi yang habis ke homepage
+            self.server.count('expired_redirects' if state == 'expired' else 'unauthenticated_redirects')
+            self._redirect('/')
+            return
+        delay, outcome = self.server.draw()
+        time.sleep(delay)
+        if outcome == 'error':
+            self.server.count('injected_errors')
+            self._send(500, ERROR_PAGE)
+            return
+        page_num = int(page) if page.isdigit() else None
+        with self.server.lock:
+            self.server.page_hits[page_num] += 1
+        if outcome == 'empty' or page_num not in self.server.pages:
+            self.server.count('empty_pages')
+            self._send(200, f'<!DOCTYPE html><html><body><div class="content">page {html.escape(page)}</div></body></html>')
+            return
+        self._send(200, self.server.pages[page_num])
+
+    def _redirect(self, location, cookie=None):
+        self.send_response(303)
+        self.send_header('Location', location)
+        if cookie:
+            self.send_header('Set-Cookie', f'{SESSION_COOKIE}={cookie}; Path=/')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _send(self, status, body):
+        body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpElement:
+    """Elemen hasil HttpDriver.find_element (hanya send_keys dan click untuk form login)."""
+
+    def __init__(self, driver, tag):
+        self.driver = driver
+        self.tag = tag
+
+    @property
+    def text(self):
+        return self.tag.get_text()
+
+    def send_keys(self, value):
+        self.driver.form_values[self.tag.get('name')] = value
+
+    def click(self):
+        form = self.tag.find_parent('form')
+        if form is None:
+            return
+        values = dict(self.driver.form_values)
+        self.driver.request(urljoin(self.driver.current_url, form.get('action') or ''),
+                            data=urlencode(values).encode('utf-8'))
+
+
+class HttpDriver:
+    """
+    Pengganti minimal webdriver Selenium berbasis urllib (cookie, redirect, find_element)
+
+    Cukup untuk login, scrape_page dan fetch_page terhadap SintaStub; tidak
+    menjalankan JavaScript dan tidak memuat aset.
+    """
+
+    def __init__(self, timeout=30):
+        self.opener = build_opener(HTTPCookieProcessor(CookieJar()))
+        self.timeout = timeout
+        self.current_url = 'about:blank'
+        self.page_source = ''
+        self.form_values = {}
+        self._soup = None
+
+    def request(self, url, data=None):
+        try:
+            with self.opener.open(url, data=data, timeout=self.timeout) as response:
+                self.current_url = response.geturl()
+                self.page_source = response.read().decode('utf-8')
+        except HTTPError as e:
+            self.current_url = url
+            self.page_source = e.read().decode('utf-8', errors='replace')
+        self.form_values = {}
+        self._soup = None
+
+    def get(self, url):
+        self.request(url)
+
+    def find_element(self, by, value):
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.page_source, 'html.parser')
+        if by == By.NAME:
+            tag = self._soup.find(attrs={'name': value})
+        elif by == By.CSS_SELECTOR:
+            tag = self._soup.select_one(value)
+        else:
+            raise ValueError(f"HttpDriver tidak mendukung locator {by}")
+        if tag is None:
+            raise NoSuchElementException(f"{by}={value}")
+        return HttpElement(self, tag)
+
+    def quit(self):
+        self.opener = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Server Sinta tiruan untuk uji beban scraper.')
+    parser.add_argument('--pages', type=int, default=100, help='Jumlah halaman listing sintetis (default: 100)')
+    parser.add_argument('--start-page', type=int, default=1, help='Nomor halaman pertama (default: 1)')
+    parser.add_argument('--port', type=int, default=8700, help='Port server (default: 8700)')
+    parser.add_argument('--latency', default='none', help='Distribusi latensi halaman listing (default: none)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Peluang HTTP 500 per halaman listing')
+    parser.add_argument('--empty-rate', type=float, default=0.0, help='Peluang halaman listing tanpa artikel')
+    parser.add_argument('--session-ttl', type=float, help='Umur sesi dalam detik sebelum diarahkan ke homepage')
+    parser.add_argument('--session-pages', type=int, help='Jumlah halaman listing per sesi sebelum kedaluwarsa')
+    parser.add_argument('--seed', type=int, default=42, help='Seed korpus dan latensi (default: 42)')
+    args = parser.parse_args(argv)
+
+    server = SintaStub(make_pages(args.pages, seed=args.seed, start_page=args.start_page), latency=args.latency,
+                       error_rate=args.error_rate, empty_rate=args.empty_rate, session_ttl=args.session_ttl,
+                       session_pages=args.session_pages, seed=args.seed, port=args.port)
+    print(f"Sinta tiruan di {server.site_url} (login {STUB_EMAIL} / {STUB_PASSWORD}, "
+          f"halaman {args.start_page}-{args.start_page + args.pages - 1})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Statistik: {server.snapshot()}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+"""
+Generator korpus sintetis yang meniru data Sinta Unila.
+
+Menghasilkan halaman listing HTML (struktur ``div.ar-list-item.mb-5`` seperti
+yang di-parse oleh ``scrape_page``) dan file CSV artikel mentah (kolom Title,
+Link, Authors, Year, Cited) dengan judul campuran Indonesia/Inggris, awalan
+``Authors :`` dan pola ``N cited``. Semua keluaran deterministik untuk seed
+yang sama sehingga hasil benchmark bisa dibandingkan antar run.
+"""
+
+import csv
+import html
+import os
+import random
+
+ARTICLES_PER_PAGE = 10
+
+INDONESIAN_WORDS = [
+    'analisis', 'pengaruh', 'pendidikan', 'kemiskinan', 'pertanian', 'kesehatan',
+    'masyarakat', 'pembelajaran', 'siswa', 'sekolah', 'ekonomi', 'daerah', 'lampung',
+    'pengembangan', 'sistem', 'informasi', 'berbasis', 'evaluasi', 'kinerja', 'petani',
+    'produksi', 'tanaman', 'padi', 'jagung', 'kopi', 'lada', 'ikan', 'budidaya',
+    'penerapan', 'model', 'metode', 'peningkatan', 'kemampuan', 'hasil', 'belajar',
+    'perbandingan', 'efektivitas', 'kebijakan', 'pemerintah', 'desa', 'kabupaten',
+    'kota', 'bandar', 'hutan', 'mangrove', 'pesisir', 'lingkungan', 'limbah', 'air',
+    'tanah', 'pupuk', 'organik', 'karakteristik', 'pemanfaatan', 'strategi', 'usaha',
+    'kecil', 'menengah', 'keuangan', 'perbankan', 'hukum', 'pidana', 'perdata',
+    'terhadap', 'dalam', 'pada', 'dengan', 'untuk', 'di', 'dan', 'yang', 'sebagai',
+]
+
+ENGLISH_WORDS = [
+    'analysis', 'effect', 'education', 'poverty', 'agriculture', 'health', 'community',
+    'learning', 'students', 'school', 'economic', 'regional', 'development', 'system',
+    'information', 'based', 'evaluation', 'performance', 'farmers', 'production',
+    'rice', 'maize', 'coffee', 'pepper', 'fish', 'aquaculture', 'implementation',
+    'model', 'method', 'improvement', 'comparison', 'effectiveness', 'policy',
+    'government', 'village', 'district', 'forest', 'coastal', 'environment', 'waste',
+    'water', 'soil', 'fertilizer', 'characteristics', 'utilization', 'strategy',
+    'small', 'medium', 'enterprises', 'financial', 'banking', 'law', 'criminal',
+    'the', 'of', 'in', 'on', 'and', 'for', 'with', 'a', 'an', 'to', 'at',
+]
+
+PLACES = ['Lampung', 'Bandar Lampung', 'Pesawaran', 'Tanggamus', 'Way Kanan', 'Indonesia', 'Sumatera']
+
+FIRST_INITIALS = 'ABCDEFGHIJKLMNOPRSTUWY'
+SURNAMES = [
+    'Suryanto', 'Setiawan', 'Wahyuni', 'Pratama', 'Saputra', 'Lestari', 'Hidayat',
+    'Rahmawati', 'Nugroho', 'Kurniawan', 'Sari', 'Wijaya', 'Susanto', 'Hartono',
+    'Fitriani', 'Iqbal', 'Hasanah', 'Firmansyah', 'Yulianti', 'Ramadhan', 'Utomo',
+]
+
+
+def _make_title(rng):
+    """Membuat satu judul dengan campuran kata Indonesia/Inggris."""
+    words = INDONESIAN_WORDS if rng.random() < 0.6 else ENGLISH_WORDS
+    length = rng.randint(5, 16)
+    tokens = [rng.choice(words) for _ in range(length)]
+    if rng.random() < 0.4:
+        tokens.insert(rng.randint(1, len(tokens)), rng.choice(PLACES))
+    title = ' '.join(tokens)
+    title = title[0].upper() + title[1:]
+    # Sebagian judul membawa tanda baca dan kutipan seperti data asli
+    roll = rng.random()
+    if roll < 0.15:
+        title = f'{title}: studi kasus di {rng.choice(PLACES)}'
+    elif roll < 0.25:
+        title = f'"{title}"'
+    elif roll < 0.3:
+        title = f'{title} ({rng.randint(2000, 2024)})'
+    return title
+
+
+def _make_authors(rng):
+    """Membuat daftar penulis dengan awalan ``Authors :``."""
+    count = rng.randint(1, 6)
+    names = [f'{rng.choice(FIRST_INITIALS)} {rng.choice(SURNAMES)}' for _ in range(count)]
+    return 'Authors : ' + ', '.join(names)
+
+
+def generate_articles(num_rows, seed=42, duplicate_rate=0.02):
+    """
+    Menghasilkan baris artikel sintetis dalam format hasil scraping mentah
+
+    Args:
+        num_rows: Jumlah baris yang dihasilkan
+        seed: Seed random agar hasil deterministik
+        duplicate_rate: Proporsi baris yang merupakan duplikat baris sebelumnya
+
+    Returns:
+        List of dict dengan kunci Title, Link, Authors, Year, Cited
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(num_rows):
+        if rows and rng.random() < duplicate_rate:
+            rows.append(dict(rng.choice(rows)))
+            continue
+        year = str(rng.randint(1995, 2024)) if rng.random() > 0.03 else '-'
+        cited = int(rng.paretovariate(1.3)) - 1
+        rows.append({
+            'Title': _make_title(rng),
+            'Link': f'https://scholar.google.com/scholar?cluster={rng.getrandbits(60)}&hl=en&oi=scholarr',
+            'Authors': _make_authors(rng),
+            'Year': year,
+            'Cited': f'{cited} cited',
+        })
+    return rows
+
+
+def render_listing_page(articles, page_num):
+    """
+    Merender satu halaman listing Sinta (view=googlescholar) dari daftar artikel
+
+    Args:
+        articles: List of dict artikel (hasil generate_articles)
+        page_num: Nomor halaman yang dirender
+
+    Returns:
+        String HTML halaman
+    """
+    items = []
+    for article in articles:
+        items.append(
+            '<div class="ar-list-item mb-5">\n'
+            f'  <div class="ar-title"><a href="{html.escape(article["Link"])}" target="_blank">'
+            f'{html.escape(article["Title"])}</a></div>\n'
+            f'  <div class="ar-meta"><a href="#!" class="ar-pub">{html.escape(article["Authors"])}</a></div>\n'
+            '  <div class="ar-meta">\n'
+            f'    <a class="ar-year" href="#!"><i class="zmdi zmdi-calendar"></i> {article["Year"]}</a>\n'
+            f'    <a class="ar-cited" href="#!"><i class="zmdi zmdi-comment-text"></i> {article["Cited"]}</a>\n'
+            '  </div>\n'
+            '</div>'
+        )
+    return (
+        '<!DOCTYPE html>\n<html lang="id">\n<head><meta charset="utf-8">'
+        f'<title>Universitas Lampung - Google Scholar - page {page_num}</title>'
+        '<link rel="stylesheet" href="/assets/css/app.css"></head>\n<body>\n'
+        '<nav class="navbar"><a href="/">SINTA</a></nav>\n'
+        '<div class="content"><div class="profile-article">\n'
+        + '\n'.join(items) +
+        f'\n</div><ul class="pagination"><li class="active">{page_num}</li></ul></div>\n'
+        '</body>\n</html>\n'
+    )
+
+
+def generate_listing_pages(articles, start_page=1):
+    """
+    Memecah artikel menjadi halaman listing HTML berisi 10 artikel per halaman
+
+    Args:
+        articles: List of dict artikel
+        start_page: Nomor halaman pertama
+
+    Returns:
+        List of tuple (page_num, html)
+    """
+    pages = []
+    for offset in range(0, len(articles), ARTICLES_PER_PAGE):
+        page_num = start_page + offset // ARTICLES_PER_PAGE
+        pages.append((page_num, render_listing_page(articles[offset:offset + ARTICLES_PER_PAGE], page_num)))
+    return pages
+
+
+def write_articles_csv(articles, output_file):
+    """
+    Menyimpan artikel sintetis ke CSV dengan format yang sama seperti hasil scraping
+
+    Args:
+        articles: List of dict artikel
+        output_file: Path file CSV tujuan
+
+    Returns:
+        Path file CSV
+    """
+    with open(output_file, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=['Title', 'Link', 'Authors', 'Year', 'Cited'])
+        writer.writeheader()
+        writer.writerows(articles)
+    return output_file
+
+
+def write_listing_pages(pages, output_dir):
+    """
+    Menyimpan halaman listing HTML ke direktori (satu file per halaman)
+
+    Args:
+        pages: List of tuple (page_num, html)
+        output_dir: Direktori tujuan
+
+    Returns:
+        List path file HTML
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for page_num, page_html in pages:
+        path = os.path.join(output_dir, f'page_{page_num}.html')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(page_html)
+        paths.append(path)
+    return paths
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Buat korpus Sinta sintetis untuk benchmark.')
+    parser.add_argument('--rows', type=int, default=1000, help='Jumlah artikel (default: 1000)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed random (default: 42)')
+    parser.add_argument('--output-dir', default=os.path.join('benchmarks', 'data'), help='Direktori keluaran')
+    parser.add_argument('--html', action='store_true', help='Tulis juga halaman listing HTML')
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    articles = generate_articles(args.rows, seed=args.seed)
+    csv_file = write_articles_csv(articles, os.path.join(args.output_dir, f'synthetic_{args.rows}.csv'))
+    print(f"CSV sintetis disimpan di {csv_file}")
+    if args.html:
+        page_dir = os.path.join(args.output_dir, f'pages_{args.rows}')
+        write_listing_pages(generate_listing_pages(articles), page_dir)
+        print(f"Halaman HTML disimpan di {page_dir}")
@@ -1,4 +1,15 @@
+import csv
+
+import pandas as pd
+
+# Article attributes and the matching CSV/DataFrame column names
+FIELDS = ('title', 'link', 'authors', 'year', 'cited')
+COLUMNS = ('Title', 'Link', 'Authors', 'Year', 'Cited')
+
+
 class Article:
+    __slots__ = FIELDS
+
     def __init__(self, title, link, authors, year, cited):
         self.title = title
         self.link = link
@@ -14,3 +25,111 @@ class Article:
             'Year': self.year,
             'Cited': self.cited
         }
+
+    def to_row(self):
+        return (self.title, self.link, self.authors, self.year, self.cited)
+
+
+class ArticleBatch:
+    """
+    Columnar container of articles: one list per field instead of one object per article
+
+    Rows are written and loaded in bulk, and the columns become DataFrame
+    columns directly without building a dict per row.
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, title=None, link=None, authors=None, year=None, cited=None):
+        self.title = list(title) if title is not None else []
+        self.link = list(link) if link is not None else []
+        self.authors = list(authors) if authors is not None else []
+        self.year = list(year) if year is not None else []
+        self.cited = list(cited) if cited is not None else []
+        if len({len(getattr(self, field)) for field in FIELDS}) > 1:
+            raise ValueError("All ArticleBatch columns must have the same length")
+
+    @classmethod
+    def from_articles(cls, articles):
+        batch = cls()
+        batch.extend(articles)
+        return batch
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a batch from (Title, Link, Authors, Year, Cited) tuples."""
+        columns = list(zip(*rows))
+        return cls(*columns) if columns else cls()
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """Build a batch from the Title, Link, Authors, Year and Cited columns of a DataFrame."""
+        return cls(*(df[column].tolist() for column in COLUMNS))
+
+    @classmethod
+    def read_csv(cls, csv_file):
+        """
+        Load every row of a scraped CSV file in one pass (values stay strings)
+
+        Like csv.DictReader, blank lines are skipped, short rows are padded with
+        empty values and extra fields are dropped; the number of such rows is printed.
+        """
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return cls()
+            missing = [column for column in COLUMNS if column not in header]
+            if missing:
+                raise ValueError(f"Missing columns in {csv_file}: {', '.join(missing)}")
+            positions = [header.index(column) for column in COLUMNS]
+            width = len(header)
+            rows = []
+            ragged = 0
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != width:
+                    ragged += 1
+                    row = (row + [''] * width)[:width]
+                rows.append(row)
+        if ragged:
+            print(f"{ragged} rows in {csv_file} had a field count different from the header and were padded/truncated")
+        return cls(*([row[position] for row in rows] for position in positions))
+
+    def __len__(self):
+        return len(self.title)
+
+    def __getitem__(self, index):
+        return Article(self.title[index], self.link[index], self.authors[index], self.year[index], self.cited[index])
+
+    def __iter__(self):
+        return map(Article, self.title, self.link, self.authors, self.year, self.cited)
+
+    def append(self, article):
+        self.title.append(article.title)
+        self.link.append(article.link)
+        self.authors.append(article.authors)
+        self.year.append(article.year)
+        self.cited.append(article.cited)
+
+    def extend(self, articles):
+        if isinstance(articles, ArticleBatch):
+            for field in FIELDS:
+                getattr(self, field).extend(getattr(articles, field))
+        else:
+            for article in articles:
+                self.append(article)
+
+    def take(self, indices):
+        """New batch with the rows at the given positions, in that order."""
+        indices = list(indices)
+        return ArticleBatch(*([getattr(self, field)[i] for i in indices] for field in FIELDS))
+
+    def rows(self):
+        """Iterate (Title, Link, Authors, Year, Cited) tuples without creating Article objects."""
+        return zip(self.title, self.link, self.authors, self.year, self.cited)
+
+    def to_dataframe(self):
+        """DataFrame with the Title, Link, Authors, Year and Cited columns."""
+        return pd.DataFrame({column: getattr(self, field) for column, field in zip(COLUMNS, FIELDS)},
+                            columns=list(COLUMNS))
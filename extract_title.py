@@ -1,13 +1,24 @@
+import argparse
+
 import pandas as pd
 
-# Baca file CSV dari path yang diberikan
-df = pd.read_csv("data/sinta_articles_2503_to_3336_processed_nlp.csv")
+INPUT_FILE = "data/sinta_articles_2503_to_3336_processed_nlp.csv"
+OUTPUT_FILE = "data/judul_saja.csv"
+
 
-# Ambil hanya kolom 'Title'
-df_title = df[["Title"]].copy()
+def extract_titles(input_file=INPUT_FILE, output_file=OUTPUT_FILE):
+    """Menyimpan hanya kolom 'Title' dari file CSV ke file baru."""
+    # Baca hanya kolom 'Title' dari file CSV
+    df_title = pd.read_csv(input_file, usecols=["Title"])
 
+    # Simpan ke file baru
+    df_title.to_csv(output_file, index=False)
+    return output_file
 
-# Simpan ke file baru
-df_title.to_csv("data/judul_saja.csv", index=False)
 
-print("File 'judul_saja.csv' berhasil dibuat di folder 'data/'")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ambil kolom Title dari file CSV.")
+    parser.add_argument("input_file", nargs="?", default=INPUT_FILE, help=f"File CSV sumber (default: {INPUT_FILE})")
+    parser.add_argument("output_file", nargs="?", default=OUTPUT_FILE, help=f"File hasil (default: {OUTPUT_FILE})")
+    args = parser.parse_args()
+    print(f"File '{extract_titles(args.input_file, args.output_file)}' berhasil dibuat")
@@ -0,0 +1,252 @@
+"""
+Cube analitik: agregat artikel per Year, per label SDG dan per cluster.
+
+Setiap run pipeline memperbarui cube secara inkremental. State per baris
+(hash baris, dimensi, sitasi) disimpan di ``cube_state.npz``; hanya baris
+baru atau yang nilainya berubah yang mengubah histogram sitasi per grup
+(``cube_histogram.npz``: dimensi, nilai, sitasi, jumlah). Histogram ini dapat dijumlah-kurangkan
+sehingga kuantil sitasi tetap tepat tanpa memindai ulang seluruh CSV.
+
+Ringkasan per grup (jumlah artikel, total/rata-rata/median/p90/maks sitasi)
+ditulis ke ``cube.npz`` (satu array per kolom). ``main.py report`` hanya
+membaca file kecil ini.
+
+Contoh:
+    from interfaces.analytics import update_cube, load_cube
+    update_cube('data/csv/sinta_articles_2503_to_3336_labeled.csv')
+    load_cube().query("dimension == 'Year'")
+"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from interfaces.metrics import metrics
+from interfaces.row_keys import row_hashes
+
+ANALYTICS_DIR = os.path.join('data', 'analytics')
+CUBE_FILE = os.path.join(ANALYTICS_DIR, 'cube.npz')
+
+# State inkremental disimpan di samping file cube
+STATE_NAME = 'cube_state.npz'
+HISTOGRAM_NAME = 'cube_histogram.npz'
+
+# Dimensi cube: kolom input -> nama dimensi
+DIMENSIONS = {'Year': 'Year', 'predicted_sdgs': 'SDG', 'cluster': 'cluster'}
+UNKNOWN = 'Unknown'
+QUANTILES = (0.5, 0.9)
+
+
+def _save_npz(path, **columns):
+    """Menyimpan array kolom ke file .npz secara atomik."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_file = f'{path}.tmp'
+    with open(tmp_file, 'wb') as file:
+        np.savez(file, **columns)
+    os.replace(tmp_file, path)
+
+
+def _load_npz(path):
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def _labels(series):
+    """Nilai dimensi sebagai string (kosong/NaN menjadi Unknown, 2020.0 menjadi 2020)."""
+    values = series.astype(object).where(series.notna(), UNKNOWN)
+    numeric = pd.to_numeric(values, errors='coerce')
+    integral = numeric.notna() & (numeric == numeric.round())
+    values = values.astype(str).where(~integral, numeric.where(integral).astype('Int64').astype(str))
+    return values.str.strip().replace('', UNKNOWN).to_numpy(dtype=str)
+
+
+def row_values(df, cluster_df=None):
+    """
+    Nilai dimensi dan sitasi per baris artikel unik
+
+    Args:
+        df: DataFrame hasil NLP atau hasil labeling
+        cluster_df: DataFrame hasil clustering (opsional), dicocokkan lewat hash baris
+
+    Returns:
+        DataFrame kolom hash, Year, SDG, cluster, Cited (dimensi yang tidak ada
+        di input bernilai NaN)
+    """
+    hashes = row_hashes(df)
+    rows = pd.DataFrame({'hash': hashes})
+    for column, dimension in DIMENSIONS.items():
+        rows[dimension] = _labels(df[column]) if column in df.columns else None
+    if cluster_df is not None and 'cluster' in cluster_df.columns:
+        clusters = pd.Series(_labels(cluster_df['cluster']), index=row_hashes(cluster_df))
+        clusters = clusters[~clusters.index.duplicated()]
+        rows['cluster'] = clusters.reindex(hashes).to_numpy()
+    cited = pd.to_numeric(df['Cited'], errors='coerce') if 'Cited' in df.columns else pd.Series(0, index=df.index)
+    rows['Cited'] = cited.fillna(0).astype(np.int64).to_numpy()
+    return rows.drop_duplicates('hash', ignore_index=True)
+
+
+def _histogram(rows, sign=1):
+    """Histogram (dimension, key, cited) -> jumlah baris untuk setiap dimensi."""
+    parts = [
+        pd.DataFrame({'dimension': dimension, 'key': rows[dimension].to_numpy(dtype=str),
+                      'cited': rows['Cited'].to_numpy()})
+        for dimension in DIMENSIONS.values()
+    ]
+    table = pd.concat(parts, ignore_index=True)
+    counts = table.groupby(['dimension', 'key', 'cited'], sort=False).size().rename('count').reset_index()
+    counts['count'] *= sign
+    return counts
+
+
+def merge_histograms(*histograms):
+    """Menjumlahkan histogram (termasuk delta negatif) dan membuang grup kosong."""
+    merged = pd.concat(histograms, ignore_index=True)
+    merged = merged.astype({'cited': np.int64, 'count': np.int64})
+    merged = merged.groupby(['dimension', 'key', 'cited'], sort=False)['count'].sum().reset_index()
+    return merged[merged['count'] > 0].reset_index(drop=True)
+
+
+def summarize(histogram):
+    """
+    Ringkasan per grup dari histogram sitasi
+
+    Returns:
+        DataFrame dimension, key, articles, cited_sum, cited_mean, cited_p50,
+        cited_p90, cited_max
+    """
+    table = histogram.sort_values(['dimension', 'key', 'cited'], ignore_index=True)
+    table['weighted'] = table['cited'] * table['count']
+    groups = table.groupby(['dimension', 'key'], sort=False)
+    summary = groups.agg(articles=('count', 'sum'), cited_sum=('weighted', 'sum'), cited_max=('cited', 'max'))
+    summary['cited_mean'] = (summary['cited_sum'] / summary['articles']).round(2)
+
+    # Kuantil tepat dari distribusi kumulatif (nilai pertama dengan kumulatif >= q * total)
+    cumulative = groups['count'].cumsum()
+    totals = groups['count'].transform('sum')
+    for q in QUANTILES:
+        reached = table[cumulative >= q * totals]
+        summary[f'cited_p{int(q * 100)}'] = reached.groupby(['dimension', 'key'], sort=False)['cited'].first()
+
+    columns = ['articles', 'cited_sum', 'cited_mean'] + [f'cited_p{int(q * 100)}' for q in QUANTILES] + ['cited_max']
+    return summary[columns].reset_index()
+
+
+def load_cube(cube_file=CUBE_FILE):
+    """Memuat ringkasan cube sebagai DataFrame."""
+    columns = _load_npz(cube_file)
+    columns.pop('meta', None)
+    return pd.DataFrame(columns)
+
+
+def cube_meta(cube_file=CUBE_FILE):
+    """Metadata cube (sumber dan waktu pembaruan terakhir)."""
+    with np.load(cube_file) as data:
+        return json.loads(str(data['meta']))
+
+
+def _empty_state():
+    return pd.DataFrame({
+        'hash': np.array([], dtype=np.uint64),
+        **{dimension: np.array([], dtype=str) for dimension in DIMENSIONS.values()},
+        'Cited': np.array([], dtype=np.int64),
+    })
+
+
+def update_cube(input_file, cluster_file=None, cube_file=CUBE_FILE, rebuild=False):
+    """
+    Memperbarui cube analitik dengan baris baru atau yang berubah dari input
+
+    Baris yang sudah ada di state tetapi tidak ada di input dibiarkan (input
+    boleh berupa data susulan saja). Dimensi yang tidak ada di input (misalnya
+    belum dilabeli) mempertahankan nilai sebelumnya; baris baru bernilai Unknown.
+
+    Args:
+        input_file: File CSV hasil NLP atau hasil labeling
+        cluster_file: File CSV hasil clustering (opsional)
+        cube_file: Path file ringkasan cube
+        rebuild: Abaikan state lama dan hitung ulang dari input
+
+    Returns:
+        Path file cube
+    """
+    state_dir = os.path.dirname(cube_file)
+    state_file = os.path.join(state_dir, STATE_NAME)
+    histogram_file = os.path.join(state_dir, HISTOGRAM_NAME)
+    df = pd.read_csv(input_file)
+    cluster_df = pd.read_csv(cluster_file) if cluster_file else None
+
+    with metrics.stage('analytics_cube', len(df)) as stage:
+        rows = row_values(df, cluster_df)
+        if os.path.exists(state_file) and os.path.exists(histogram_file) and not rebuild:
+            state = pd.DataFrame(_load_npz(state_file))
+            histogram = pd.DataFrame(_load_npz(histogram_file))
+        else:
+            state = _empty_state()
+            histogram = _histogram(state)
+
+        previous = rows[['hash']].merge(state, on='hash', how='left')
+        known = rows['hash'].isin(state['hash']).to_numpy()
+        for dimension in DIMENSIONS.values():
+            missing = rows[dimension].isna().to_numpy()
+            rows.loc[missing, dimension] = previous.loc[missing, dimension].fillna(UNKNOWN).to_numpy()
+
+        # Baris yang sudah dihitung dan tidak berubah dilewati
+        value_columns = list(DIMENSIONS.values()) + ['Cited']
+        unchanged = known & (rows[value_columns].astype(str).to_numpy()
+                             == previous[value_columns].astype(str).to_numpy()).all(axis=1)
+        changed = known & ~unchanged
+        delta = rows[~unchanged]
+        stage['rows'] = len(delta)
+        histogram = merge_histograms(histogram, _histogram(previous[changed], sign=-1), _histogram(delta))
+
+        state = pd.concat([state[~state['hash'].isin(delta['hash'])], delta], ignore_index=True)
+        summary = summarize(histogram)
+
+        _save_npz(state_file, hash=state['hash'].to_numpy(dtype=np.uint64), Cited=state['Cited'].to_numpy(dtype=np.int64),
+                  **{dimension: state[dimension].to_numpy(dtype=str) for dimension in DIMENSIONS.values()})
+        _save_npz(histogram_file, dimension=histogram['dimension'].to_numpy(dtype=str),
+                  key=histogram['key'].to_numpy(dtype=str), cited=histogram['cited'].to_numpy(dtype=np.int64),
+                  count=histogram['count'].to_numpy(dtype=np.int64))
+        meta = {'source': os.path.abspath(input_file), 'articles': len(state),
+                'updated_at': datetime.now().isoformat(timespec='seconds')}
+        _save_npz(cube_file, meta=np.array(json.dumps(meta)),
+                  **{column: summary[column].to_numpy(dtype=str if column in ('dimension', 'key') else None)
+                     for column in summary.columns})
+
+    print(f"Cube analitik diperbarui: {int((~known).sum())} artikel baru, {int(changed.sum())} berubah "
+          f"(total {len(state)} artikel) dalam {stage['wall_seconds']:.2f} detik: {cube_file}")
+    return cube_file
+
+
+def _year_order(keys):
+    return pd.to_numeric(keys, errors='coerce').fillna(np.inf)
+
+
+def report(cube_file=CUBE_FILE, top=10):
+    """
+    Mencetak ringkasan cube: publikasi dan sitasi per tahun, per SDG dan per cluster
+
+    Returns:
+        Dict nama dimensi -> DataFrame ringkasan
+    """
+    cube = load_cube(cube_file)
+    meta = cube_meta(cube_file)
+    print(f"Ringkasan {meta['articles']} artikel (sumber: {meta['source']}, diperbarui {meta['updated_at']})")
+    tables = {}
+    for dimension in DIMENSIONS.values():
+        table = cube[cube['dimension'] == dimension].drop(columns='dimension').rename(columns={'key': dimension})
+        if dimension == 'Year':
+            table = table.sort_values(dimension, key=_year_order)
+            title = "Publikasi dan sitasi per tahun"
+        else:
+            table = table.sort_values(['articles', dimension], ascending=[False, True]).head(top)
+            title = f"{top} {dimension} teratas menurut jumlah artikel"
+        tables[dimension] = table.reset_index(drop=True)
+        print(f"\n{title}:")
+        print(tables[dimension].to_string(index=False))
+    return tables
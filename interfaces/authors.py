@@ -0,0 +1,234 @@
+"""
+Index penulis: entitas penulis ternormalisasi dan graf co-authorship.
+
+Kolom ``Authors`` hasil preprocessing (satu string "A Nama, B Nama, ...")
+dipecah menjadi entitas penulis dengan kunci ternormalisasi (huruf kecil,
+tanpa aksen dan tanda baca, inisial digabung: "A. B. Santoso" dan
+"AB Santoso" menjadi ``ab santoso``) lalu diberi id integer. Index menyimpan:
+
+- matriks insiden sparse artikel x penulis
+- matriks adjacency co-authorship penulis x penulis (bobot = jumlah artikel bersama)
+- tahun dan jumlah sitasi per artikel
+
+Sehingga pertanyaan seperti penulis paling produktif, kolaborator seorang
+penulis, atau output per tahun dijawab dengan operasi matriks sparse tanpa
+memecah ulang string per baris.
+
+Gunakan file hasil ``preprocess_csv`` (bukan hasil NLP, karena kolom Authors
+di sana sudah di-stem).
+
+Contoh:
+    from interfaces.authors import build_author_index, AuthorIndex
+    build_author_index('data/csv/sinta_articles_2503_to_3336_processed.csv')
+    AuthorIndex().top_authors(by='citations', n=10)
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from interfaces.metrics import metrics
+
+AUTHORS_DIR = os.path.join('data', 'authors')
+RANKING_FIELDS = ('articles', 'citations')
+
+# Penanda daftar penulis terpotong dan nilai kosong dari scraping
+TRUNCATION_MARKERS = r'\.\.\.|…'
+UNKNOWN_AUTHORS = {'', 'unknown', 'nan'}
+
+
+def normalize_names(names):
+    """
+    Kunci ternormalisasi untuk Series nama penulis (operasi string vektor)
+
+    Returns:
+        Series kunci (string kosong untuk nama yang tidak valid)
+    """
+    keys = (names.astype(str)
+            .str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('ascii')
+            .str.lower()
+            .str.replace(r'[^a-z0-9]+', ' ', regex=True)
+            .str.strip())
+    # Gabungkan inisial yang berurutan: "a b santoso" -> "ab santoso"
+    keys = keys.str.replace(r'\b([a-z]) (?=[a-z]\b)', r'\1', regex=True)
+    return keys.where(~keys.isin(UNKNOWN_AUTHORS), '')
+
+
+def parse_authors(authors):
+    """
+    Memecah kolom Authors menjadi pasangan (baris artikel, nama penulis)
+
+    Args:
+        authors: Series string "Nama A, Nama B, ..." per artikel
+
+    Returns:
+        DataFrame kolom article (posisi baris), name (nama asli), key (kunci ternormalisasi)
+    """
+    names = (authors.reset_index(drop=True).fillna('').astype(str)
+             .str.replace(r'^Authors\s*:\s*', '', regex=True)
+             .str.replace(TRUNCATION_MARKERS, ',', regex=True)
+             .str.split(r'\s*[,;]\s*|\s+(?:and|dan|&)\s+', regex=True)
+             .explode())
+    pairs = pd.DataFrame({
+        'article': names.index.to_numpy(),
+        'name': names.fillna('').str.strip(' .').to_numpy(),
+    })
+    # Normalisasi cukup sekali per variasi nama unik
+    codes, uniques = pd.factorize(pairs['name'])
+    pairs['key'] = normalize_names(pd.Series(uniques, dtype=object)).to_numpy()[codes]
+    return pairs[pairs['key'] != ''].reset_index(drop=True)
+
+
+def _article_columns(df):
+    """Tahun (0 jika tidak diketahui) dan sitasi per artikel sebagai array numerik."""
+    years = pd.to_numeric(df['Year'], errors='coerce') if 'Year' in df.columns else pd.Series(np.nan, index=df.index)
+    cited = pd.to_numeric(df['Cited'], errors='coerce') if 'Cited' in df.columns else pd.Series(0, index=df.index)
+    return years.fillna(0).astype(np.int32).to_numpy(), cited.fillna(0).astype(np.int64).to_numpy()
+
+
+def build_author_index(input_file, index_dir=AUTHORS_DIR):
+    """
+    Membangun index penulis dari file CSV hasil preprocessing
+
+    Args:
+        input_file: Path file CSV hasil preprocessing (kolom Authors, Year, Cited)
+        index_dir: Direktori index penulis
+
+    Returns:
+        AuthorIndex yang sudah dibuka
+    """
+    df = pd.read_csv(input_file)
+    with metrics.stage('author_index', len(df)) as stage:
+        pairs = parse_authors(df['Authors'])
+        # Penulis yang sama dua kali di satu artikel dihitung sekali
+        pairs = pairs.drop_duplicates(['article', 'key'])
+        author_ids, keys = pd.factorize(pairs['key'])
+        num_articles, num_authors = len(df), len(keys)
+
+        incidence = sparse.csr_matrix(
+            (np.ones(len(pairs), dtype=np.int32), (pairs['article'].to_numpy(), author_ids)),
+            shape=(num_articles, num_authors),
+        )
+        # Bobot co-authorship = jumlah artikel bersama, tanpa diagonal
+        coauthors = (incidence.T @ incidence).tocsr()
+        coauthors.setdiag(0)
+        coauthors.eliminate_zeros()
+
+        years, cited = _article_columns(df)
+        # Nama tampilan: variasi penulisan yang paling sering muncul
+        names = (pairs.assign(author_id=author_ids)
+                 .groupby(['author_id', 'name']).size().rename('count').reset_index()
+                 .sort_values(['author_id', 'count'], ascending=[True, False])
+                 .drop_duplicates('author_id')['name'].to_numpy())
+        authors = pd.DataFrame({
+            'author_id': np.arange(num_authors),
+            'key': np.asarray(keys),
+            'name': names,
+            'articles': np.asarray(incidence.sum(axis=0)).ravel(),
+            'citations': incidence.T @ cited,
+        })
+
+        os.makedirs(index_dir, exist_ok=True)
+        authors.to_csv(os.path.join(index_dir, 'authors.csv'), index=False)
+        sparse.save_npz(os.path.join(index_dir, 'incidence.npz'), incidence)
+        sparse.save_npz(os.path.join(index_dir, 'coauthors.npz'), coauthors)
+        np.savez(os.path.join(index_dir, 'articles.npz'), years=years, cited=cited)
+        with open(os.path.join(index_dir, 'meta.json'), 'w', encoding='utf-8') as file:
+            json.dump({
+                'source': os.path.abspath(input_file),
+                'num_articles': num_articles,
+                'num_authors': num_authors,
+                'num_links': len(pairs),
+                'num_coauthor_edges': int(coauthors.nnz // 2),
+            }, file, indent=2)
+    print(f"Index penulis ({num_authors} penulis dari {num_articles} artikel, "
+          f"{coauthors.nnz // 2} relasi co-authorship) dibangun dalam {stage['wall_seconds']:.2f} detik: {index_dir}")
+    return AuthorIndex(index_dir)
+
+
+class AuthorIndex:
+    """Query agregat penulis di atas matriks sparse yang tersimpan di direktori."""
+
+    def __init__(self, index_dir=AUTHORS_DIR):
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, 'meta.json'), encoding='utf-8') as file:
+            self.meta = json.load(file)
+        self.authors = pd.read_csv(os.path.join(index_dir, 'authors.csv'), dtype={'key': str, 'name': str})
+        self.incidence = sparse.load_npz(os.path.join(index_dir, 'incidence.npz')).tocsr()
+        # Transpose CSR: artikel milik satu penulis = satu baris
+        self.author_articles = self.incidence.T.tocsr()
+        self.coauthors = sparse.load_npz(os.path.join(index_dir, 'coauthors.npz')).tocsr()
+        articles = np.load(os.path.join(index_dir, 'articles.npz'))
+        self.years = articles['years']
+        self.cited = articles['cited']
+        self._ids = pd.Series(self.authors['author_id'].to_numpy(), index=self.authors['key'])
+
+    def lookup(self, name):
+        """
+        Id penulis untuk sebuah nama (kunci persis, atau kunci yang memuat nama
+        tersebut dengan jumlah artikel terbanyak)
+
+        Raises:
+            KeyError: Jika tidak ada penulis yang cocok
+        """
+        key = normalize_names(pd.Series([name])).iloc[0]
+        if key and key in self._ids.index:
+            return int(self._ids[key])
+        matches = self.authors[self.authors['key'].str.contains(key, regex=False)] if key else self.authors.iloc[:0]
+        if matches.empty:
+            raise KeyError(f"Penulis '{name}' tidak ditemukan di index")
+        return int(matches.sort_values('articles', ascending=False)['author_id'].iloc[0])
+
+    def _ranked(self, ids, scores, column, n):
+        if len(ids) > n:
+            top = np.argpartition(-scores, n - 1)[:n]
+            ids, scores = ids[top], scores[top]
+        order = np.lexsort((ids, -scores))
+        result = self.authors.iloc[ids[order]][['author_id', 'name', 'articles', 'citations']].reset_index(drop=True)
+        if column not in result.columns:
+            result[column] = scores[order]
+        return result
+
+    def top_authors(self, by='articles', n=10):
+        """
+        Penulis teratas menurut jumlah artikel atau total sitasi
+
+        Returns:
+            DataFrame author_id, name, articles, citations
+        """
+        if by not in RANKING_FIELDS:
+            raise ValueError(f"Urutan tidak dikenal: {by} (pilihan: {', '.join(RANKING_FIELDS)})")
+        scores = self.authors[by].to_numpy()
+        return self._ranked(np.arange(len(scores)), scores, by, n)
+
+    def collaborators(self, name, n=10):
+        """
+        Kolaborator seorang penulis, diurutkan menurut jumlah artikel bersama
+
+        Returns:
+            DataFrame author_id, name, articles, citations, shared_articles
+        """
+        row = self.coauthors[self.lookup(name)]
+        return self._ranked(row.indices, row.data, 'shared_articles', n)
+
+    def yearly_output(self, name):
+        """
+        Jumlah artikel dan sitasi seorang penulis per tahun
+
+        Returns:
+            DataFrame kolom Year, articles, citations (tahun tidak diketahui = 0)
+        """
+        articles = self.author_articles[self.lookup(name)].indices
+        years, inverse = np.unique(self.years[articles], return_inverse=True)
+        return pd.DataFrame({
+            'Year': years,
+            'articles': np.bincount(inverse, minlength=len(years)),
+            'citations': np.bincount(inverse, weights=self.cited[articles], minlength=len(years)).astype(np.int64),
+        })
+
+    def display_name(self, name):
+        """Nama tampilan penulis hasil lookup."""
+        return self.authors['name'].iloc[self.lookup(name)]
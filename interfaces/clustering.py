@@ -0,0 +1,237 @@
+"""
+Clustering artikel berdasarkan matriks TF-IDF hasil preprocessing NLP.
+
+Memuat ``[namafile]_tfidf_features.pkl`` (matriks sparse yang disimpan oleh
+``process_nlp``), memilih jumlah cluster k lewat sweep paralel (inertia dan
+silhouette) pada sampel, lalu melatih ``MiniBatchKMeans`` per mini-batch
+sehingga memori tetap terbatas meskipun jumlah judul ratusan ribu. Hasil
+cluster ditulis kembali per baris artikel, dan visualisasi 2D dibuat dengan
+``TruncatedSVD`` yang bekerja langsung pada matriks sparse (tanpa PCA dense).
+
+Contoh:
+    from interfaces.clustering import cluster_articles
+    output_file = cluster_articles('data/sinta_articles_2503_to_3336_processed_nlp.csv')
+"""
+
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.metrics import silhouette_score
+
+from interfaces.metrics import metrics
+
+CLUSTER_COLUMN = 'cluster'
+
+# Rentang k yang dicoba saat k tidak ditentukan
+DEFAULT_K_RANGE = range(2, 16)
+
+# Jumlah baris sampel untuk sweep k dan perhitungan silhouette
+SWEEP_SAMPLE_SIZE = 10000
+SILHOUETTE_SAMPLE_SIZE = 5000
+
+# Ukuran mini-batch MiniBatchKMeans dan batch prediksi
+KMEANS_BATCH_SIZE = 4096
+PREDICT_BATCH_SIZE = 50000
+
+# Jumlah titik maksimal yang digambar di visualisasi
+PLOT_SAMPLE_SIZE = 20000
+TOP_TERMS = 10
+RANDOM_STATE = 42
+
+
+def feature_files(nlp_file):
+    """Path file vectorizer dan matriks fitur TF-IDF milik file hasil NLP."""
+    base = os.path.splitext(nlp_file)[0]
+    return f"{base}_tfidf_vectorizer.pkl", f"{base}_tfidf_features.pkl"
+
+
+def load_features(nlp_file):
+    """
+    Memuat hasil NLP beserta matriks TF-IDF-nya
+
+    Baris matriks fitur hanya mencakup judul yang tidak kosong (sesuai
+    preprocess_dataframe). Jika jumlah barisnya tidak cocok (misalnya CSV diubah
+    setelah vektorisasi), judul ditransformasi ulang dengan vectorizer tersimpan.
+
+    Args:
+        nlp_file: Path file CSV hasil preprocessing NLP
+
+    Returns:
+        Tuple (DataFrame artikel, matriks sparse, mask baris yang punya vektor, vectorizer)
+    """
+    vectorizer_file, feature_file = feature_files(nlp_file)
+    if not os.path.exists(vectorizer_file):
+        raise FileNotFoundError(
+            f"Vectorizer {vectorizer_file} tidak ditemukan; jalankan preprocessing NLP dengan vektorisasi terlebih dahulu"
+        )
+    df = pd.read_csv(nlp_file)
+    titles = df['Title'].fillna('').astype(str)
+    mask = (titles.str.strip() != '').to_numpy()
+    vectorizer = joblib.load(vectorizer_file)
+
+    X = joblib.load(feature_file) if os.path.exists(feature_file) else None
+    if X is None or X.shape[0] != int(mask.sum()):
+        print(f"Matriks fitur tidak cocok dengan {nlp_file}, melakukan transformasi ulang...")
+        X = vectorizer.transform(titles[mask].tolist())
+    return df, X.tocsr(), mask, vectorizer
+
+
+def _sample_rows(X, size, random_state=RANDOM_STATE):
+    """Sampel baris matriks tanpa pengembalian (seluruh matriks jika lebih kecil)."""
+    if X.shape[0] <= size:
+        return X
+    rng = np.random.default_rng(random_state)
+    return X[np.sort(rng.choice(X.shape[0], size, replace=False))]
+
+
+def _score_k(X_sample, k, random_state):
+    """Melatih MiniBatchKMeans untuk satu k pada sampel dan menghitung skornya."""
+    model = MiniBatchKMeans(n_clusters=k, batch_size=KMEANS_BATCH_SIZE, n_init=3, random_state=random_state)
+    labels = model.fit_predict(X_sample)
+    silhouette = None
+    if len(set(labels)) > 1:
+        silhouette = float(silhouette_score(
+            X_sample, labels, sample_size=min(SILHOUETTE_SAMPLE_SIZE, X_sample.shape[0]), random_state=random_state
+        ))
+    return {'k': k, 'inertia': float(model.inertia_), 'silhouette': silhouette}
+
+
+def sweep_k(X, k_range=DEFAULT_K_RANGE, sample_size=SWEEP_SAMPLE_SIZE, n_jobs=-1, random_state=RANDOM_STATE):
+    """
+    Mencoba beberapa nilai k secara paralel pada sampel
+
+    Args:
+        X: Matriks fitur sparse
+        k_range: Nilai k yang dicoba
+        sample_size: Jumlah baris sampel
+        n_jobs: Jumlah proses paralel (-1 = semua core)
+
+    Returns:
+        List dict {k, inertia, silhouette} terurut menurut k
+    """
+    X_sample = _sample_rows(X, sample_size, random_state)
+    ks = [k for k in k_range if 1 < k < X_sample.shape[0]]
+    return Parallel(n_jobs=n_jobs)(delayed(_score_k)(X_sample, k, random_state) for k in ks)
+
+
+def best_k(scores):
+    """Memilih k dengan silhouette tertinggi dari hasil sweep_k."""
+    scored = [score for score in scores if score['silhouette'] is not None]
+    if not scored:
+        raise ValueError("Tidak ada nilai k yang valid untuk data ini")
+    return max(scored, key=lambda score: score['silhouette'])['k']
+
+
+def fit_clusters(X, k, random_state=RANDOM_STATE):
+    """
+    Melatih MiniBatchKMeans sampai konvergen lalu memprediksi per batch
+
+    ``fit`` tetap memproses mini-batch berukuran KMEANS_BATCH_SIZE, tetapi
+    mengulang epoch acak sampai centroid berhenti bergeser, sama seperti model
+    yang dinilai saat sweep k.
+
+    Returns:
+        Tuple (model, array label cluster per baris X)
+    """
+    model = MiniBatchKMeans(n_clusters=k, batch_size=KMEANS_BATCH_SIZE, n_init=3, random_state=random_state)
+    model.fit(X)
+    labels = np.concatenate([
+        model.predict(X[start:start + PREDICT_BATCH_SIZE]) for start in range(0, X.shape[0], PREDICT_BATCH_SIZE)
+    ])
+    return model, labels
+
+
+def cluster_terms(model, vectorizer, top_n=TOP_TERMS):
+    """Kata dengan bobot centroid tertinggi untuk setiap cluster."""
+    terms = np.asarray(vectorizer.get_feature_names_out())
+    top = np.argsort(-model.cluster_centers_, axis=1)[:, :top_n]
+    return {cluster: terms[indices].tolist() for cluster, indices in enumerate(top)}
+
+
+def plot_clusters(X, labels, plot_file, sample_size=PLOT_SAMPLE_SIZE, random_state=RANDOM_STATE):
+    """
+    Visualisasi 2D cluster dengan TruncatedSVD (langsung pada matriks sparse)
+
+    Returns:
+        Path file gambar, atau None jika matplotlib tidak tersedia
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib tidak terpasang, visualisasi cluster dilewati")
+        return None
+
+    svd = TruncatedSVD(n_components=2, random_state=random_state)
+    # SVD dilatih pada sampel, lalu hanya titik sampel yang digambar
+    rng = np.random.default_rng(random_state)
+    rows = np.arange(X.shape[0])
+    if X.shape[0] > sample_size:
+        rows = np.sort(rng.choice(X.shape[0], sample_size, replace=False))
+    points = svd.fit_transform(X[rows])
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    scatter = ax.scatter(points[:, 0], points[:, 1], c=labels[rows], cmap='tab20', s=6, alpha=0.7)
+    ax.set_title(f'Cluster artikel (TruncatedSVD 2D, {len(rows)} dari {X.shape[0]} judul)')
+    ax.set_xlabel('Komponen 1')
+    ax.set_ylabel('Komponen 2')
+    fig.colorbar(scatter, ax=ax, label='Cluster')
+    fig.tight_layout()
+    fig.savefig(plot_file, dpi=150)
+    plt.close(fig)
+    return plot_file
+
+
+def cluster_articles(nlp_file, output_file=None, k=None, k_range=DEFAULT_K_RANGE,
+                     n_jobs=-1, plot_file=None):
+    """
+    Mengelompokkan artikel dan menyimpan label cluster per baris
+
+    Args:
+        nlp_file: Path file CSV hasil preprocessing NLP (dengan file TF-IDF-nya)
+        output_file: Path file hasil (default: [namafile]_clustered.csv)
+        k: Jumlah cluster (None = dipilih lewat sweep silhouette)
+        k_range: Nilai k yang dicoba saat sweep
+        n_jobs: Jumlah proses paralel untuk sweep
+        plot_file: Path gambar visualisasi (default: [namafile]_clusters.png, '' = tidak dibuat)
+
+    Returns:
+        Path file hasil clustering
+    """
+    if output_file is None:
+        output_file = f"{os.path.splitext(nlp_file)[0]}_clustered.csv"
+    if plot_file is None:
+        plot_file = f"{os.path.splitext(nlp_file)[0]}_clusters.png"
+
+    df, X, mask, vectorizer = load_features(nlp_file)
+
+    if k is None:
+        with metrics.stage('cluster_sweep', min(X.shape[0], SWEEP_SAMPLE_SIZE)):
+            scores = sweep_k(X, k_range, n_jobs=n_jobs)
+        print(pd.DataFrame(scores).to_string(index=False))
+        k = best_k(scores)
+        print(f"k terbaik berdasarkan silhouette: {k}")
+
+    with metrics.stage('cluster_fit', X.shape[0]):
+        model, labels = fit_clusters(X, k)
+
+    # Judul kosong tidak punya vektor dan diberi cluster -1
+    clusters = np.full(len(df), -1, dtype=int)
+    clusters[mask] = labels
+    df[CLUSTER_COLUMN] = clusters
+    df.to_csv(output_file, index=False)
+    print(f"Hasil clustering ({k} cluster) disimpan di: {output_file}")
+
+    for cluster, terms in cluster_terms(model, vectorizer).items():
+        print(f"  Cluster {cluster} ({int((labels == cluster).sum())} artikel): {', '.join(terms)}")
+
+    if plot_file:
+        if plot_clusters(X, labels, plot_file):
+            print(f"Visualisasi cluster disimpan di: {plot_file}")
+    return output_file
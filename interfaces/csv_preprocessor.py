@@ -1,16 +1,39 @@
 import pandas as pd
 import re
 import os
+import hashlib
+import multiprocessing
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from datetime import datetime
+from interfaces.frame_dtypes import compact_articles, report_memory, to_cited, to_csv, to_year
+from interfaces.metrics import metrics
 
-def preprocess_csv(input_file, output_file=None):
+COLUMNS_TO_KEEP = ['Title', 'Link', 'Authors', 'Year', 'Cited']
+DEDUP_COLUMNS = ['Title', 'Year']
+# Kolom yang ditampilkan dari input NLP karena hasil NLP-nya sudah di-stem atau di-lowercase
+DISPLAY_COLUMNS = ['Title', 'Link', 'Authors']
+
+# Mode streaming (out-of-core): ukuran chunk, jumlah worker dan partisi spill dedup
+DEFAULT_CHUNK_ROWS = 100000
+NUM_WORKERS = max(1, multiprocessing.cpu_count() - 1)
+DEDUP_PARTITIONS = 64
+# Satu record spill dedup: nomor baris global + blake2b-128 dari (Title, Year)
+KEY_DTYPE = np.dtype([('row', '<i8'), ('key', 'S16')])
+
+def preprocess_csv(input_file, output_file=None, chunk_rows=None, workers=None, spill_dir=None):
     """
     Melakukan preprocessing pada file CSV hasil scraping
     
     Args:
         input_file: Path ke file CSV yang akan dipreprocessing
         output_file: Path untuk menyimpan hasil preprocessing (jika None, akan menggunakan nama input + '_processed')
+        chunk_rows: Jika diisi, file diproses per chunk sebanyak ini (mode streaming, lihat preprocess_csv_streaming)
+        workers: Jumlah proses worker untuk mode streaming (default: jumlah CPU - 1)
+        spill_dir: Direktori file sementara mode streaming (default: direktori temp sistem)
     
     Returns:
         Path ke file hasil preprocessing
@@ -23,87 +46,354 @@ def preprocess_csv(input_file, output_file=None):
         filename, ext = os.path.splitext(input_file)
         output_file = f"{filename}_processed{ext}"
     
+    if chunk_rows:
+        return preprocess_csv_streaming(input_file, output_file, chunk_rows=chunk_rows, workers=workers,
+                                        spill_dir=spill_dir)
+    
     print(f"Memulai preprocessing file {input_file}...")
     
+    with metrics.stage('preprocess_csv') as stage:
+        df = read_raw_csv(input_file)
+    
+        # Tampilkan informasi awal
+        stage['rows'] = df.shape[0]
+        print(f"Data awal: {df.shape[0]} baris, {df.shape[1]} kolom")
+        print(f"Kolom: {', '.join(df.columns)}")
+    
+        df = clean_articles(df)
+    
+        # Simpan hasil preprocessing
+        to_csv(df, output_file)
+    print(f"Preprocessing selesai dalam {stage['wall_seconds']:.2f} detik. Data akhir: {df.shape[0]} baris, {df.shape[1]} kolom")
+    print(f"Hasil preprocessing disimpan di {output_file}")
+    
+    return output_file
+
+def read_raw_csv(input_file):
+    """Membaca CSV hasil scraping (semua kolom sebagai string) dengan parser yang toleran."""
     # Baca file CSV dengan parameter yang lebih toleran terhadap format yang tidak standar
     try:
         # Coba berbagai opsi parsingnya
-        df = pd.read_csv(input_file, on_bad_lines='warn', encoding='utf-8', engine='python')
+        return pd.read_csv(input_file, on_bad_lines='warn', encoding='utf-8', engine='python', dtype=str)
     except Exception as e:
         print(f"Error membaca CSV: {e}")
         print("Mencoba metode alternatif...")
         # Jika gagal, gunakan delimiter yang lebih spesifik
-        df = pd.read_csv(input_file, delimiter=',', on_bad_lines='skip', encoding='utf-8', engine='python')
+        return pd.read_csv(input_file, delimiter=',', on_bad_lines='skip', encoding='utf-8', engine='python', dtype=str)
+
+def clean_articles(df, chunk_rows=None, workers=1, stage='preprocess_csv'):
+    """
+    Pembersihan, deduplikasi (Title, Year) dan pemilihan kolom di memori
     
-    # Tampilkan informasi awal
-    print(f"Data awal: {df.shape[0]} baris, {df.shape[1]} kolom")
-    print(f"Kolom: {', '.join(df.columns)}")
+    Args:
+        df: DataFrame hasil read_raw_csv
+        chunk_rows: Ukuran chunk untuk pembersihan paralel
+        workers: Jumlah proses worker (1 = sekuensial di proses ini)
+        stage: Nama tahap untuk laporan memori
+    
+    Returns:
+        DataFrame bersih dengan kolom COLUMNS_TO_KEEP dan dtype ringkas
+    """
+    if workers > 1 and chunk_rows and len(df) > chunk_rows:
+        print(f"Membersihkan {len(df)} baris dalam chunk {chunk_rows} baris dengan {workers} worker...")
+        chunks = [df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows)]
+        with _worker_pool(workers) as executor:
+            df = pd.concat(executor.map(_clean_frame_quiet, chunks))
+    else:
+        df = clean_frame(df)
+    report_memory(df, stage)
+    
+    # 8. Hapus duplikat terakhir (jika ada)
+    print("Memeriksa duplikat...")
+    duplicate_count = df.duplicated(subset=DEDUP_COLUMNS).sum()
+    print(f"Menemukan {duplicate_count} duplikat")
+    
+    if duplicate_count > 0:
+        df = df.drop_duplicates(subset=DEDUP_COLUMNS, keep='first')
+    
+    # 9. Urutkan berdasarkan tahun dan sitasi (jika diminta)
+    # Menghapus pengurutan untuk mempertahankan urutan asli
+    # print("Mengurutkan data...")
+    # df = df.sort_values(by=['Year', 'Cited'], ascending=[False, False])
+    
+    # 10. Pastikan hanya kolom yang diinginkan yang disimpan
+    return select_columns(df)
+
+def clean_frame(df, verbose=True):
+    """
+    Membersihkan kolom Title, Authors, Year dan Cited (langkah 1-5 preprocessing)
+    
+    Args:
+        df: DataFrame hasil pembacaan CSV (diubah di tempat)
+        verbose: Tampilkan pesan per langkah
+    
+    Returns:
+        DataFrame yang sudah dibersihkan
+    """
+    log = print if verbose else (lambda *_: None)
     
     # 1. Penanganan nilai kosong
-    print("Memeriksa nilai kosong...")
-    null_counts = df.isnull().sum()
-    print(f"Nilai kosong per kolom: {null_counts.to_dict()}")
+    log("Memeriksa nilai kosong...")
+    if verbose:
+        null_counts = df.isnull().sum()
+        print(f"Nilai kosong per kolom: {null_counts.to_dict()}")
     
     # Isi nilai kosong
     df['Authors'] = df['Authors'].fillna('Unknown')
     df['Year'] = df['Year'].fillna('Unknown')
     df['Cited'] = df['Cited'].fillna('0')
     
-    # 2. Normalisasi kolom Title
-    print("Normalisasi kolom Title...")
+    # Operasi string di bawah berjalan per kolom (vectorized), bukan .apply per baris
+    # 2. Normalisasi kolom Title (judul kosong tetap <NA>, bukan string "nan")
+    log("Normalisasi kolom Title...")
     # Hapus whitespace berlebih
     df['Title'] = df['Title'].str.strip()
-    # Standarisasi kutipan
-    df['Title'] = df['Title'].apply(lambda x: re.sub(r'["""]', '"', str(x)))
     
     # 3. Normalisasi kolom Authors
-    print("Normalisasi kolom Authors...")
+    log("Normalisasi kolom Authors...")
     # Hapus awalan "Authors : " dari kolom Authors
-    df['Authors'] = df['Authors'].apply(lambda x: re.sub(r'^Authors\s*:\s*', '', str(x)))
+    df['Authors'] = df['Authors'].str.replace(r'^Authors\s*:\s*', '', regex=True)
     # Standardisasi format penulis
-    df['Authors'] = df['Authors'].apply(lambda x: re.sub(r'\s+', ' ', str(x)).strip())
+    df['Authors'] = df['Authors'].str.replace(r'\s+', ' ', regex=True).str.strip()
     
     # 4. Konversi kolom Year ke format standar
-    print("Konversi kolom Year...")
-    # Ekstrak tahun dari format yang mungkin berbeda
-    df['Year'] = df['Year'].apply(extract_year)
+    log("Konversi kolom Year...")
+    # Ekstrak tahun pertama (19xx/20xx) seperti extract_year; Int16, tahun tidak dikenal menjadi <NA>
+    df['Year'] = to_year(df['Year'].str.extract(r'((?:19|20)\d{2})', expand=False))
     
     # 5. Konversi kolom Cited ke numerik
-    print("Konversi kolom Cited...")
-    # Hapus kata 'cited' dan ubah ke numerik
-    df['Cited'] = df['Cited'].apply(lambda x: str(x).replace('cited', '').strip())
-    df['Cited'] = pd.to_numeric(df['Cited'].str.replace(r'[^\d]', '', regex=True), errors='coerce').fillna(0).astype(int)
+    log("Konversi kolom Cited...")
+    # Hapus kata 'cited' dan semua karakter non-digit lalu ubah ke numerik
+    df['Cited'] = to_cited(df['Cited'].str.replace(r'[^\d]', '', regex=True))
+    return compact_articles(df)
+
+def _clean_frame_quiet(df):
+    return clean_frame(df, verbose=False)
+
+def select_columns(df, verbose=True):
+    """Menyisakan kolom COLUMNS_TO_KEEP, menambahkan kolom 'Unknown' untuk yang tidak ada."""
+    for col in COLUMNS_TO_KEEP:
+        if col not in df.columns:
+            if verbose:
+                print(f"Perhatian: Kolom {col} tidak ditemukan dalam data. Menambahkan kolom kosong.")
+            df[col] = 'Unknown'
+    return df[COLUMNS_TO_KEEP]
+
+def dedup_keys(df):
+    """Digest blake2b-128 dari kunci dedup (Title, Year) per baris, sebagai array numpy S16."""
+    keys = [hashlib.blake2b(f"{title}\x1f{year}".encode('utf-8'), digest_size=16).digest()
+            for title, year in zip(df['Title'], df['Year'])]
+    return np.array(keys, dtype='S16')
+
+def _read_chunks(input_file, chunk_rows, on_bad_lines):
+    return pd.read_csv(input_file, on_bad_lines=on_bad_lines, encoding='utf-8', engine='python', dtype=str,
+                       chunksize=chunk_rows)
+
+def _worker_pool(workers):
+    """ProcessPoolExecutor dengan initializer worker yang sama seperti pool NLP (misalnya profiler)."""
+    # Impor lokal: nlp_processor sendiri mengimpor modul ini
+    from interfaces import nlp_processor
+    return ProcessPoolExecutor(max_workers=workers, initializer=nlp_processor.worker_initializer,
+                               initargs=nlp_processor.worker_initargs)
+
+def _clean_chunk(task):
+    """Worker: membersihkan satu chunk, menyimpannya ke file spill dan mengembalikan kunci dedup-nya."""
+    df, spill_file = task
+    df = select_columns(clean_frame(df, verbose=False), verbose=False)
+    df.to_pickle(spill_file)
+    return len(df), dedup_keys(df)
+
+def _spill_chunks(input_file, work_dir, chunk_rows, workers, on_bad_lines):
+    """
+    Tahap 1 mode streaming: membersihkan chunk di pool proses lalu menulis hasilnya
+    dan kunci dedup ke disk
     
-    # 8. Hapus duplikat terakhir (jika ada)
-    print("Memeriksa duplikat...")
-    duplicate_count = df.duplicated(subset=['Title', 'Year']).sum()
-    print(f"Menemukan {duplicate_count} duplikat")
+    Kunci setiap baris ditulis ke salah satu DEDUP_PARTITIONS file partisi
+    (berdasarkan hash kunci), berurutan menurut nomor baris global.
     
-    if duplicate_count > 0:
-        df = df.drop_duplicates(subset=['Title', 'Year'], keep='first')
+    Returns:
+        List (path file chunk, jumlah baris) sesuai urutan input
+    """
+    chunk_files = []
+    partition_files = [open(os.path.join(work_dir, f'keys_{i:03d}.bin'), 'wb') for i in range(DEDUP_PARTITIONS)]
+    next_row = 0
     
-    # 9. Urutkan berdasarkan tahun dan sitasi (jika diminta)
-    # Menghapus pengurutan untuk mempertahankan urutan asli
-    # print("Mengurutkan data...")
-    # df = df.sort_values(by=['Year', 'Cited'], ascending=[False, False])
+    def spill_keys(keys):
+        nonlocal next_row
+        records = np.empty(len(keys), dtype=KEY_DTYPE)
+        records['row'] = np.arange(next_row, next_row + len(keys))
+        records['key'] = keys
+        next_row += len(keys)
+        partitions = keys.view('<u8')[::2] % DEDUP_PARTITIONS if len(keys) else np.empty(0, dtype='<u8')
+        for partition in np.unique(partitions):
+            partition_files[partition].write(records[partitions == partition].tobytes())
     
-    # 10. Pastikan hanya kolom yang diinginkan yang disimpan
-    # Hapus kolom yang tidak diinginkan jika ada
-    columns_to_keep = ['Title', 'Link', 'Authors', 'Year', 'Cited']
-    for col in columns_to_keep:
-        if col not in df.columns:
-            print(f"Perhatian: Kolom {col} tidak ditemukan dalam data. Menambahkan kolom kosong.")
-            df[col] = 'Unknown'
+    def tasks():
+        for index, chunk in enumerate(_read_chunks(input_file, chunk_rows, on_bad_lines)):
+            if index == 0:
+                missing = [col for col in COLUMNS_TO_KEEP if col not in chunk.columns]
+                if missing:
+                    print(f"Perhatian: Kolom {', '.join(missing)} tidak ditemukan dalam data. Menambahkan kolom kosong.")
+            spill_file = os.path.join(work_dir, f'chunk_{index:06d}.pkl')
+            chunk_files.append(spill_file)
+            yield chunk, spill_file
+    
+    sizes = []
+    try:
+        if workers <= 1:
+            for task in tasks():
+                rows, keys = _clean_chunk(task)
+                sizes.append(rows)
+                spill_keys(keys)
+        else:
+            # Jumlah chunk yang sedang diproses dibatasi agar memori tidak ikut membesar dengan ukuran file
+            with _worker_pool(workers) as executor:
+                pending = deque()
+                for task in tasks():
+                    pending.append(executor.submit(_clean_chunk, task))
+                    while len(pending) >= workers * 2:
+                        rows, keys = pending.popleft().result()
+                        sizes.append(rows)
+                        spill_keys(keys)
+                while pending:
+                    rows, keys = pending.popleft().result()
+                    sizes.append(rows)
+                    spill_keys(keys)
+    finally:
+        for file in partition_files:
+            file.close()
+    return list(zip(chunk_files, sizes)), next_row
+
+def _dedup_partitions(work_dir, total_rows):
+    """
+    Tahap 2 mode streaming: menandai baris yang dipertahankan (kemunculan pertama
+    setiap kunci), satu partisi kunci per langkah
+    
+    Returns:
+        Mask boolean memmap sepanjang total_rows
+    """
+    keep = np.lib.format.open_memmap(os.path.join(work_dir, 'keep.npy'), mode='w+', dtype=bool,
+                                     shape=(total_rows,))
+    for i in range(DEDUP_PARTITIONS):
+        records = np.fromfile(os.path.join(work_dir, f'keys_{i:03d}.bin'), dtype=KEY_DTYPE)
+        if len(records):
+            # Record dalam partisi sudah urut nomor baris, jadi indeks pertama = kemunculan pertama
+            _, first = np.unique(records['key'], return_index=True)
+            keep[records['row'][first]] = True
+    keep.flush()
+    return keep
+
+def preprocess_csv_streaming(input_file, output_file=None, chunk_rows=DEFAULT_CHUNK_ROWS, workers=None, spill_dir=None):
+    """
+    Preprocessing out-of-core: file dibaca dan dibersihkan per chunk di pool proses,
+    sehingga memori puncak ditentukan ukuran chunk, bukan ukuran file
+    
+    Deduplikasi (Title, Year) memakai partisi hash yang di-spill ke disk: kunci
+    setiap baris (digest blake2b-128) ditulis ke file partisi, setiap partisi
+    dideduplikasi terpisah, lalu chunk yang sudah bersih ditulis ulang tanpa
+    baris duplikat. Urutan kemunculan pertama tetap terjaga dan hasilnya sama
+    dengan preprocess_csv biasa.
     
-    df = df[columns_to_keep]
+    Args:
+        input_file: Path ke file CSV yang akan dipreprocessing
+        output_file: Path hasil (jika None, akan menggunakan nama input + '_processed')
+        chunk_rows: Jumlah baris per chunk
+        workers: Jumlah proses worker (default: jumlah CPU - 1)
+        spill_dir: Direktori file sementara (default: direktori temp sistem)
+    
+    Returns:
+        Path ke file hasil preprocessing
+    """
+    if not os.path.exists(input_file):
+        raise FileNotFoundError(f"File {input_file} tidak ditemukan")
+    
+    if output_file is None:
+        filename, ext = os.path.splitext(input_file)
+        output_file = f"{filename}_processed{ext}"
+    workers = workers or NUM_WORKERS
     
-    # Simpan hasil preprocessing
-    df.to_csv(output_file, index=False)
-    print(f"Preprocessing selesai. Data akhir: {df.shape[0]} baris, {df.shape[1]} kolom")
+    print(f"Memulai preprocessing streaming file {input_file} (chunk {chunk_rows} baris, {workers} worker)...")
+    
+    if spill_dir:
+        os.makedirs(spill_dir, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix='preprocess_', dir=spill_dir)
+    tmp_file = f"{output_file}.tmp"
+    try:
+        with metrics.stage('preprocess_csv') as stage:
+            try:
+                chunks, total_rows = _spill_chunks(input_file, work_dir, chunk_rows, workers, 'warn')
+            except Exception as e:
+                print(f"Error membaca CSV: {e}")
+                print("Mencoba metode alternatif...")
+                shutil.rmtree(work_dir, ignore_errors=True)
+                os.makedirs(work_dir)
+                chunks, total_rows = _spill_chunks(input_file, work_dir, chunk_rows, workers, 'skip')
+            stage['rows'] = total_rows
+            print(f"Data awal: {total_rows} baris dalam {len(chunks)} chunk")
+            
+            print("Memeriksa duplikat...")
+            keep = _dedup_partitions(work_dir, total_rows)
+            kept_rows = int(keep.sum())
+            print(f"Menemukan {total_rows - kept_rows} duplikat")
+            
+            # Tulis ulang chunk yang sudah bersih tanpa duplikat, sesuai urutan input
+            start = 0
+            with open(tmp_file, 'w', encoding='utf-8', newline='') as file:
+                if not chunks:
+                    to_csv(pd.DataFrame(columns=COLUMNS_TO_KEEP), file)
+                for index, (chunk_file, rows) in enumerate(chunks):
+                    df = pd.read_pickle(chunk_file)
+                    if index == 0:
+                        report_memory(df, 'preprocess_csv_chunk')
+                    to_csv(df[keep[start:start + rows]], file, header=index == 0)
+                    start += rows
+                    os.remove(chunk_file)
+            del keep
+            os.replace(tmp_file, output_file)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    print(f"Preprocessing selesai dalam {stage['wall_seconds']:.2f} detik. Data akhir: {kept_rows} baris, {len(COLUMNS_TO_KEEP)} kolom")
     print(f"Hasil preprocessing disimpan di {output_file}")
     
     return output_file
 
+def display_articles(nlp_file, num_rows=None):
+    """
+    Kolom artikel asli (sebelum case folding dan stemming) yang sejajar baris per baris dengan file hasil NLP
+
+    Hasil NLP menyimpan Title dan Authors yang sudah di-stem dan Link huruf kecil.
+    Untuk ditampilkan dipakai input NLP-nya, ``[nama]_processed.csv`` (urutan baris
+    sama). Jika file itu tidak disimpan (mode fused tanpa --keep-processed), file
+    hasil scraping dibersihkan ulang dengan clean_articles.
+
+    Args:
+        nlp_file: Path file CSV hasil NLP ([nama]_nlp.csv)
+        num_rows: Jumlah baris file hasil NLP; sumber dengan jumlah baris lain ditolak
+
+    Returns:
+        DataFrame COLUMNS_TO_KEEP, atau None jika sumbernya tidak ditemukan atau tidak sejajar
+    """
+    base, ext = os.path.splitext(nlp_file)
+    if not base.endswith('_nlp'):
+        return None
+    processed_file = base[:-len('_nlp')] + ext
+    raw_file = base[:-len('_processed_nlp')] + ext if base.endswith('_processed_nlp') else None
+    if os.path.exists(processed_file):
+        df = select_columns(pd.read_csv(processed_file, dtype=str), verbose=False)
+    elif raw_file and os.path.exists(raw_file):
+        print(f"File {processed_file} tidak ada, membersihkan ulang {raw_file} untuk kolom tampilan...")
+        df = clean_articles(read_raw_csv(raw_file), stage='display_articles')
+    else:
+        print(f"Perhatian: input NLP untuk {nlp_file} tidak ditemukan, Title dan Authors ditampilkan hasil stemming")
+        return None
+    if num_rows is not None and len(df) != num_rows:
+        print(f"Perhatian: {len(df)} baris sumber tampilan tidak sejajar dengan {num_rows} baris {nlp_file}, "
+              "Title dan Authors ditampilkan hasil stemming")
+        return None
+    return df.reset_index(drop=True)
+
 def extract_year(year_str):
     """
     Ekstrak tahun dari berbagai format
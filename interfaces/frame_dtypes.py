@@ -0,0 +1,97 @@
+"""
+Dtype ringkas untuk DataFrame artikel dan laporan pemakaian memori per tahap.
+
+Kolom teks (Title, Link, Authors) disimpan sebagai ``string[pyarrow]`` (satu
+buffer Arrow per kolom, bukan satu objek Python per sel), Year sebagai
+``Int16`` nullable (tahun tidak dikenal menjadi <NA>, bukan string
+"Unknown"), Cited sebagai ``Int32`` dan label SDGs sebagai categorical.
+Format file CSV tidak berubah: ``to_csv`` menulis tahun kosong kembali
+sebagai "Unknown".
+
+Contoh:
+    from interfaces.frame_dtypes import compact_articles, report_memory, to_csv
+    df = compact_articles(pd.read_csv('data/sinta_articles_processed.csv'))
+    report_memory(df, 'process_nlp')
+    to_csv(df, 'data/hasil.csv')
+"""
+
+import pandas as pd
+
+from interfaces.metrics import metrics
+
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:
+    TEXT_DTYPE = 'string'
+
+YEAR_DTYPE = 'Int16'
+CITED_DTYPE = 'Int32'
+UNKNOWN_YEAR = 'Unknown'
+TEXT_COLUMNS = ('Title', 'Link', 'Authors')
+CATEGORY_COLUMNS = ('predicted_sdgs', 'sdgs_model')
+
+
+def to_year(values):
+    """Series tahun sebagai Int16 nullable; nilai bukan angka (misalnya "Unknown") menjadi <NA>."""
+    numeric = pd.to_numeric(pd.Series(values), errors='coerce')
+    return numeric.where(numeric.between(0, 9999)).round().astype(YEAR_DTYPE)
+
+
+def to_cited(values):
+    """Series jumlah sitasi sebagai Int32 (nilai kosong/tidak valid menjadi 0)."""
+    return pd.to_numeric(pd.Series(values), errors='coerce').fillna(0).astype(CITED_DTYPE)
+
+
+def compact_articles(df, categories=CATEGORY_COLUMNS):
+    """
+    Mengubah kolom artikel yang ada di df ke dtype ringkas (di tempat, tanpa salinan frame)
+
+    Args:
+        df: DataFrame artikel
+        categories: Kolom yang diubah menjadi categorical jika ada
+
+    Returns:
+        DataFrame yang sama
+    """
+    for column in TEXT_COLUMNS:
+        if column in df.columns and df[column].dtype != TEXT_DTYPE:
+            df[column] = df[column].astype(TEXT_DTYPE)
+    if 'Year' in df.columns and df['Year'].dtype != YEAR_DTYPE:
+        df['Year'] = to_year(df['Year'])
+    if 'Cited' in df.columns and df['Cited'].dtype != CITED_DTYPE:
+        df['Cited'] = to_cited(df['Cited'])
+    for column in categories:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+
+def to_csv(df, path_or_buf, **kwargs):
+    """Menulis DataFrame ke CSV (tanpa index) dengan tahun <NA> ditulis sebagai "Unknown"."""
+    if 'Year' in df.columns and df['Year'].dtype == YEAR_DTYPE:
+        df = df.assign(Year=df['Year'].astype(TEXT_DTYPE).fillna(UNKNOWN_YEAR))
+    df.to_csv(path_or_buf, index=False, **kwargs)
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def report_memory(df, stage):
+    """
+    Mencetak pemakaian memori DataFrame (memory_usage(deep=True)) per kolom untuk satu tahap
+
+    Returns:
+        Total byte
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    total = int(usage.sum())
+    metrics.observe(f'{stage}_frame_bytes', total)
+    columns = ', '.join(f"{column} {format_bytes(size)}" for column, size in usage.items())
+    print(f"[memori] {stage}: {len(df)} baris, {format_bytes(total)} ({columns})")
+    return total
@@ -1,49 +1,81 @@
-import pandas as pd
-import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
+"""
+Engine pelabelan SDGs otomatis untuk artikel Sinta.
+
+Vectorizer TF-IDF dan model dilatih sekali dari ``label_sdgs.csv`` lalu
+disimpan (joblib) bersama fingerprint data latih. Model dilatih ulang hanya
+jika isi file label atau konfigurasi engine berubah. Prediksi dilakukan per
+batch dan hanya untuk baris yang belum punya prediksi dari model yang sama,
+sehingga menjalankan ulang pelabelan setelah scraping tambahan hanya
+memproses artikel baru.
+
+Contoh:
+    from interfaces.label_sdgs import label_articles
+    output_file = label_articles('data/sinta_articles_2503_to_3336_processed_nlp.csv')
+
+atau dari command line:
+    python -m interfaces.label_sdgs
+"""
+
+import hashlib
+import json
 import os
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from interfaces.frame_dtypes import compact_articles, report_memory, to_csv
+from interfaces.metrics import metrics
 
 # Path file
 LABEL_FILE = os.path.join('data', 'label_sdgs.csv')
 UNLABELED_FILE = os.path.join('data', 'sinta_articles_2503_to_3336_processed_nlp.csv')
 OUTPUT_FILE = os.path.join('data', 'sinta_articles_2503_to_3336_labeled.csv')
+REVIEW_FILE = os.path.join('data', 'unlabeled_for_review.csv')
+MODEL_DIR = os.path.join('data', 'models')
 
-# 1. Load data label (data latih)
-df_labeled = pd.read_csv(LABEL_FILE)
-# 2. Load data artikel yang akan dilabeli
-df_unlabeled = pd.read_csv(UNLABELED_FILE)
+# Kolom hasil prediksi dan versi model yang menghasilkannya
+PREDICTION_COLUMN = 'predicted_sdgs'
+CONFIDENCE_COLUMN = 'sdgs_confidence'
+TOP_K_COLUMN = 'predicted_sdgs_top_k'
+MODEL_COLUMN = 'sdgs_model'
+RESULT_COLUMNS = [PREDICTION_COLUMN, CONFIDENCE_COLUMN, TOP_K_COLUMN, MODEL_COLUMN]
 
-# 3. Siapkan fitur dan label (gunakan kolom Title)
-vectorizer = TfidfVectorizer(max_features=1000)
-X_labeled = vectorizer.fit_transform(df_labeled['Title'].astype(str))
-y_labeled = df_labeled['label'] if 'label' in df_labeled.columns else df_labeled['annotation_id']
+# Jumlah baris per batch prediksi (membatasi ukuran matriks TF-IDF di memori)
+PREDICT_BATCH_SIZE = 10000
 
-# 4. Latih model
-model = RandomForestClassifier(random_state=42)
-model.fit(X_labeled, y_labeled)
+# Backend classifier yang tersedia:
+# - random_forest: RandomForestClassifier (perilaku awal), pelatihan paralel lewat n_jobs
+# - sgd          : one-vs-rest SGDClassifier (log loss) langsung pada matriks sparse, paling cepat
+# - logistic     : one-vs-rest LogisticRegression (liblinear) pada matriks sparse
+CLASSIFIER_BACKENDS = ('random_forest', 'sgd', 'logistic')
+DEFAULT_BACKEND = 'random_forest'
 
-# 5. Transformasi data yang belum berlabel
-X_unlabeled = vectorizer.transform(df_unlabeled['Title'].astype(str))
 
-# 6. Prediksi label SDGs
-predicted_labels = model.predict(X_unlabeled)
-df_unlabeled['predicted_sdgs'] = predicted_labels
+def model_path(backend=None):
+    """Path default bundle model untuk sebuah backend (setiap backend punya file sendiri)."""
+    return os.path.join(MODEL_DIR, f"sdg_model_{backend or DEFAULT_BACKEND}.joblib")
 
-# 7. Simpan hasil ke file baru
-df_unlabeled.to_csv(OUTPUT_FILE, index=False)
-print(f"Hasil labeling otomatis disimpan di: {OUTPUT_FILE}")
 
-# ======================
-# EXPORT UNLABELED DATA
-# ======================
+MODEL_FILE = model_path()
 
-import pandas as pd
-import os
+# Jumlah core untuk pelatihan/prediksi (-1 = semua core)
+DEFAULT_N_JOBS = -1
+
+# Jumlah label SDG teratas (beserta probabilitasnya) yang disimpan per artikel
+DEFAULT_TOP_K = 3
+
+# Prediksi dengan probabilitas di bawah ambang ini masuk antrean review manual
+REVIEW_CONFIDENCE_THRESHOLD = 0.5
 
-# File hasil labeling otomatis
-LABELED_FILE = os.path.join('data', 'sinta_articles_2503_to_3336_labeled.csv')
-OUTPUT_FILE = os.path.join('data', 'unlabeled_for_review.csv')
+# Konfigurasi engine; perubahan nilai di sini memicu pelatihan ulang
+ENGINE_CONFIG = {
+    'format': 2,
+    'max_features': 1000,
+    'classifier': DEFAULT_BACKEND,
+    'random_state': 42,
+}
 
 # Daftar label SDGs yang valid (bisa diupdate sesuai kebutuhan)
 VALID_SDGS = [
@@ -65,23 +97,407 @@ VALID_SDGS = [
     'SDG 16: Perdamaian, Keadilan, dan Kelembagaan yang Tangguh',
     'SDG 17: Kemitraan untuk Mencapai Tujuan'
 ]
+VALID_SDG_SET = frozenset(VALID_SDGS)
+
+# Awalan label hasil anotasi berupa string JSON (pilihan/list SDG)
+JSON_LABEL_PREFIXES = ('{"choices"', '["SDG')
+
+
+def training_fingerprint(label_file=LABEL_FILE, config=None):
+    """
+    Fingerprint data latih: hash SHA-256 isi file label ditambah konfigurasi engine
+
+    Args:
+        label_file: Path file CSV data latih
+        config: Konfigurasi engine (default: ENGINE_CONFIG)
+
+    Returns:
+        String hex fingerprint
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(config or ENGINE_CONFIG, sort_keys=True).encode('utf-8'))
+    with open(label_file, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_training_data(label_file=LABEL_FILE):
+    """
+    Membaca data latih dari file label
+
+    Returns:
+        Tuple (list judul, Series label)
+    """
+    df_labeled = pd.read_csv(label_file)
+    labels = df_labeled['label'] if 'label' in df_labeled.columns else df_labeled['annotation_id']
+    return df_labeled['Title'].astype(str).tolist(), labels
+
+
+def engine_config(backend=None):
+    """Konfigurasi engine untuk backend tertentu (bagian dari fingerprint model)."""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in CLASSIFIER_BACKENDS:
+        raise ValueError(f"Backend classifier tidak dikenal: {backend} (pilihan: {', '.join(CLASSIFIER_BACKENDS)})")
+    return dict(ENGINE_CONFIG, classifier=backend)
+
+
+def build_classifier(config=None, n_jobs=DEFAULT_N_JOBS):
+    """
+    Membuat classifier sesuai konfigurasi engine
+
+    Args:
+        config: Konfigurasi engine (default: ENGINE_CONFIG)
+        n_jobs: Jumlah core untuk pelatihan paralel (tidak memengaruhi hasil model)
+
+    Returns:
+        Estimator scikit-learn dengan predict_proba
+    """
+    # Impor lokal: scikit-learn hanya dimuat saat melatih, bukan saat modul diimpor (main.py, serve)
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression, SGDClassifier
+    from sklearn.multiclass import OneVsRestClassifier
+
+    config = config or ENGINE_CONFIG
+    backend = config['classifier']
+    random_state = config['random_state']
+    if backend == 'sgd':
+        return OneVsRestClassifier(
+            SGDClassifier(loss='log_loss', alpha=1e-5, max_iter=50, tol=1e-4, random_state=random_state),
+            n_jobs=n_jobs,
+        )
+    if backend == 'logistic':
+        return OneVsRestClassifier(LogisticRegression(solver='liblinear', C=10.0), n_jobs=n_jobs)
+    return RandomForestClassifier(random_state=random_state, n_jobs=n_jobs)
+
+
+def load_model(model_file=MODEL_FILE):
+    """
+    Memuat bundle model tersimpan
+
+    Returns:
+        Dict bundle (vectorizer, model, fingerprint, ...) atau None jika belum ada/rusak
+    """
+    if not os.path.exists(model_file):
+        return None
+    try:
+        return joblib.load(model_file)
+    except Exception as e:
+        print(f"Gagal memuat model {model_file}: {e}")
+        return None
+
+
+def train(label_file=LABEL_FILE, model_file=None, force=False, backend=None, n_jobs=DEFAULT_N_JOBS):
+    """
+    Melatih vectorizer dan model, atau memakai model tersimpan jika data latih tidak berubah
+
+    Args:
+        label_file: Path file CSV data latih
+        model_file: Path file bundle model (default: model_path(backend))
+        force: Latih ulang meskipun fingerprint sama
+        backend: Backend classifier (lihat CLASSIFIER_BACKENDS)
+        n_jobs: Jumlah core untuk pelatihan
+
+    Returns:
+        Dict bundle berisi vectorizer, model, fingerprint, trained_at dan n_samples
+    """
+    config = engine_config(backend)
+    model_file = model_file or model_path(config['classifier'])
+    fingerprint = training_fingerprint(label_file, config)
+    if not force:
+        bundle = load_model(model_file)
+        if bundle and bundle.get('fingerprint') == fingerprint:
+            print(f"Data latih tidak berubah, memakai model tersimpan: {model_file}")
+            return bundle
+
+    with metrics.stage('label_train') as stage:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        titles, labels = load_training_data(label_file)
+        vectorizer = TfidfVectorizer(max_features=config['max_features'])
+        X_labeled = vectorizer.fit_transform(titles)
+        model = build_classifier(config, n_jobs)
+        model.fit(X_labeled, labels)
+        stage['rows'] = len(titles)
+
+    bundle = {
+        'vectorizer': vectorizer,
+        'model': model,
+        'fingerprint': fingerprint,
+        'config': config,
+        'trained_at': datetime.now().isoformat(timespec='seconds'),
+        'n_samples': len(titles),
+    }
+    directory = os.path.dirname(model_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Tulis ke file sementara dulu agar model lama tidak rusak jika proses terhenti
+    tmp_file = f'{model_file}.tmp'
+    joblib.dump(bundle, tmp_file)
+    os.replace(tmp_file, model_file)
+    print(f"Model {config['classifier']} dilatih dari {len(titles)} data dalam {stage['wall_seconds']:.2f} detik, disimpan di: {model_file}")
+    return bundle
+
+
+def model_version(bundle):
+    """Versi singkat model (12 karakter pertama fingerprint) untuk kolom hasil."""
+    return bundle['fingerprint'][:12]
+
+
+def predict(bundle, texts, batch_size=PREDICT_BATCH_SIZE):
+    """
+    Memprediksi label SDGs per batch
+
+    Args:
+        bundle: Bundle model dari train() atau load_model()
+        texts: List judul
+        batch_size: Jumlah baris per batch
+
+    Returns:
+        numpy array label prediksi
+    """
+    vectorizer = bundle['vectorizer']
+    model = bundle['model']
+    predictions = []
+    for start in range(0, len(texts), batch_size):
+        X_batch = vectorizer.transform(texts[start:start + batch_size])
+        predictions.append(model.predict(X_batch))
+    if not predictions:
+        return np.array([], dtype=object)
+    return np.concatenate(predictions)
+
+
+def predict_top_k(bundle, texts, k=DEFAULT_TOP_K, batch_size=PREDICT_BATCH_SIZE):
+    """
+    Memprediksi k label SDGs teratas beserta probabilitasnya, per batch
+
+    Args:
+        bundle: Bundle model dari train() atau load_model()
+        texts: List judul
+        k: Jumlah label teratas per artikel
+        batch_size: Jumlah baris per batch
+
+    Returns:
+        Tuple (array label indeks [n, k], array probabilitas [n, k]); kolom pertama adalah label terbaik
+    """
+    vectorizer = bundle['vectorizer']
+    model = bundle['model']
+    classes = np.asarray(model.classes_, dtype=object)
+    k = max(1, min(k, len(classes)))
+    labels, probabilities = [], []
+    for start in range(0, len(texts), batch_size):
+        proba = model.predict_proba(vectorizer.transform(texts[start:start + batch_size]))
+        # argpartition lalu urutkan hanya k kolom teratas (lebih murah dari argsort penuh)
+        if k < proba.shape[1]:
+            top = np.argpartition(-proba, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(proba.shape[1]), proba.shape)
+        top_proba = np.take_along_axis(proba, top, axis=1)
+        order = np.argsort(-top_proba, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        labels.append(classes[top])
+        probabilities.append(np.take_along_axis(top_proba, order, axis=1))
+    if not labels:
+        return np.empty((0, k), dtype=object), np.empty((0, k))
+    return np.vstack(labels), np.vstack(probabilities)
+
+
+def format_top_k(labels, probabilities):
+    """Mengubah hasil predict_top_k menjadi string JSON per baris: [[label, probabilitas], ...]."""
+    return [
+        json.dumps([[str(label), round(float(prob), 4)] for label, prob in zip(row_labels, row_proba)], ensure_ascii=False)
+        for row_labels, row_proba in zip(labels, probabilities)
+    ]
+
+
+def _row_key(df):
+    """Kunci baris untuk mencocokkan prediksi lama: Link, atau Title jika Link kosong."""
+    if 'Link' not in df.columns:
+        return df['Title'].astype(str)
+    return df['Link'].where(df['Link'].notna() & (df['Link'].astype(str) != ''), df['Title']).astype(str)
+
+
+def _reuse_predictions(df, previous_file):
+    """Mengisi kolom prediksi dari file hasil sebelumnya (berdasarkan kunci baris)."""
+    if not previous_file or not os.path.exists(previous_file):
+        return df
+    previous = pd.read_csv(previous_file, dtype={MODEL_COLUMN: str})
+    if any(column not in previous.columns for column in RESULT_COLUMNS):
+        return df
+    previous = previous.assign(_key=_row_key(previous)).drop_duplicates('_key').set_index('_key')
+    keys = _row_key(df)
+    # Hasil sebelumnya lebih baru daripada kolom prediksi (jika ada) di file input
+    found = keys.map(previous[PREDICTION_COLUMN]).notna()
+    for column in RESULT_COLUMNS:
+        existing = df[column] if column in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+        df[column] = keys.map(previous[column]).where(found, existing)
+    return df
+
+
+def label_articles(input_file=UNLABELED_FILE, output_file=None, label_file=LABEL_FILE,
+                   model_file=None, batch_size=PREDICT_BATCH_SIZE, retrain=False,
+                   backend=None, n_jobs=DEFAULT_N_JOBS, top_k=DEFAULT_TOP_K,
+                   review_file=None, review_threshold=REVIEW_CONFIDENCE_THRESHOLD):
+    """
+    Melabeli artikel secara inkremental dan menyimpan hasilnya
+
+    Baris yang sudah memiliki prediksi dari model yang sama (di file input maupun
+    di file output sebelumnya) tidak diprediksi ulang.
+
+    Args:
+        input_file: Path file CSV artikel (biasanya hasil preprocessing NLP)
+        output_file: Path file hasil (default: [namafile]_labeled.csv)
+        label_file: Path file CSV data latih
+        model_file: Path file bundle model (default: model_path(backend))
+        batch_size: Jumlah baris per batch prediksi
+        retrain: Paksa pelatihan ulang model
+        backend: Backend classifier (lihat CLASSIFIER_BACKENDS)
+        n_jobs: Jumlah core untuk pelatihan
+        top_k: Jumlah label teratas yang disimpan di kolom predicted_sdgs_top_k
+        review_file: Jika diisi, artikel dengan label tidak valid atau probabilitas
+            rendah ditulis ke file ini (langsung dari data di memori)
+        review_threshold: Ambang probabilitas untuk antrean review
+
+    Returns:
+        Path file hasil pelabelan
+    """
+    if output_file is None:
+        base = os.path.splitext(input_file)[0]
+        if base.endswith('_processed_nlp'):
+            base = base[:-len('_processed_nlp')]
+        output_file = f"{base}_labeled.csv"
+
+    bundle = train(label_file, model_file, force=retrain, backend=backend, n_jobs=n_jobs)
+    version = model_version(bundle)
+
+    with metrics.stage('label_predict') as stage:
+        df = compact_articles(pd.read_csv(input_file, dtype={MODEL_COLUMN: str}), categories=())
+        df = _reuse_predictions(df, output_file)
+        for column in RESULT_COLUMNS:
+            if column not in df.columns:
+                df[column] = np.nan
+            df[column] = df[column].astype(object)
+
+        # Hanya baris tanpa prediksi atau dengan prediksi dari model lain
+        pending = df[PREDICTION_COLUMN].isna() | (df[MODEL_COLUMN].astype(str) != version)
+        num_pending = int(pending.sum())
+        if num_pending:
+            titles = df.loc[pending, 'Title'].fillna('').astype(str).tolist()
+            labels, probabilities = predict_top_k(bundle, titles, top_k, batch_size)
+            df.loc[pending, PREDICTION_COLUMN] = labels[:, 0]
+            df.loc[pending, CONFIDENCE_COLUMN] = np.round(probabilities[:, 0], 4)
+            df.loc[pending, TOP_K_COLUMN] = format_top_k(labels, probabilities)
+            df.loc[pending, MODEL_COLUMN] = version
+        # Label dan versi model hanya punya sedikit nilai unik: simpan sebagai categorical
+        compact_articles(df)
+        stage['rows'] = num_pending
+        metrics.incr('labels_predicted', num_pending)
+        metrics.incr('labels_reused', len(df) - num_pending)
+
+    report_memory(df, 'label_predict')
+    to_csv(df, output_file)
+    print(f"{num_pending} artikel diprediksi, {len(df) - num_pending} memakai prediksi sebelumnya")
+    print(f"Hasil labeling otomatis disimpan di: {output_file}")
+
+    if review_file:
+        export_review_queue(df, review_file, review_threshold)
+    return output_file
+
+
+# ======================
+# EXPORT UNLABELED DATA
+# ======================
 
 def is_valid_label(label):
     if pd.isna(label) or str(label).strip() == '':
         return False
     # Cek jika label adalah salah satu SDG atau string JSON list SDG
-    if label in VALID_SDGS:
-        return True
-    if label.startswith('{"choices"') or label.startswith('["SDG'):
-        return True
-    return False
+    label = str(label)
+    return label in VALID_SDG_SET or label.startswith(JSON_LABEL_PREFIXES)
+
+
+def valid_label_mask(labels):
+    """
+    Mask validitas label tanpa apply per baris
+
+    Label diubah menjadi categorical sehingga is_valid_label hanya dievaluasi
+    sekali per nilai unik (jumlah SDG), lalu hasilnya disebar lewat kode kategori.
+
+    Args:
+        labels: Series label prediksi
+
+    Returns:
+        numpy array boolean (True jika label valid)
+    """
+    categorical = pd.Categorical(labels)
+    valid_categories = np.fromiter(
+        (is_valid_label(category) for category in categorical.categories), dtype=bool, count=len(categorical.categories)
+    )
+    codes = categorical.codes
+    # Kode -1 berarti NaN (tidak valid)
+    return (codes >= 0) & np.append(valid_categories, False)[codes]
+
+
+def review_mask(df, threshold=REVIEW_CONFIDENCE_THRESHOLD):
+    """
+    Baris yang perlu ditinjau manual: label tidak valid atau probabilitas di bawah ambang
+
+    Returns:
+        numpy array boolean
+    """
+    mask = ~valid_label_mask(df[PREDICTION_COLUMN])
+    if threshold and CONFIDENCE_COLUMN in df.columns:
+        confidence = pd.to_numeric(df[CONFIDENCE_COLUMN], errors='coerce').to_numpy()
+        # Baris tanpa nilai probabilitas (misalnya hasil model lama) tidak dianggap rendah
+        with np.errstate(invalid='ignore'):
+            mask |= confidence < threshold
+    return mask
+
+
+def export_review_queue(df, output_file=REVIEW_FILE, threshold=REVIEW_CONFIDENCE_THRESHOLD):
+    """
+    Menyimpan artikel yang perlu ditinjau manual dari DataFrame hasil pelabelan
+
+    Args:
+        df: DataFrame hasil label_articles (di memori)
+        output_file: Path file review
+        threshold: Ambang probabilitas prediksi
+
+    Returns:
+        Path file review
+    """
+    with metrics.stage('label_review_export', len(df)):
+        mask = review_mask(df, threshold)
+        to_csv(df[mask], output_file)
+    metrics.incr('labels_for_review', int(mask.sum()))
+    print(f"{int(mask.sum())} artikel belum terlabeli SDGs dengan benar atau probabilitasnya < {threshold}, "
+          f"disimpan di: {output_file}")
+    return output_file
+
+
+def export_unlabeled_for_review(labeled_file=OUTPUT_FILE, output_file=REVIEW_FILE,
+                                threshold=REVIEW_CONFIDENCE_THRESHOLD):
+    """
+    Menyimpan artikel yang perlu ditinjau manual dari file hasil labeling yang sudah ada
+
+    Returns:
+        Path file review
+    """
+    return export_review_queue(pd.read_csv(labeled_file), output_file, threshold)
 
-# Load data hasil labeling
-df = pd.read_csv(LABELED_FILE)
 
-# Filter data yang belum terlabeli SDGs dengan benar
-unlabeled = df[~df['predicted_sdgs'].apply(is_valid_label)]
+if __name__ == '__main__':
+    import argparse
 
-# Simpan ke file baru
-unlabeled.to_csv(OUTPUT_FILE, index=False)
-print(f"Data yang belum terlabeli SDGs disimpan di: {OUTPUT_FILE}")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Pelabelan SDGs otomatis pada file hasil NLP.')
+    parser.add_argument('input_file', nargs='?', default=UNLABELED_FILE, help=f'File hasil NLP (default: {UNLABELED_FILE})')
+    parser.add_argument('--output', default=None, help='File hasil (default: [namafile]_labeled.csv)')
+    parser.add_argument('--label-file', default=LABEL_FILE, help=f'File CSV data latih (default: {LABEL_FILE})')
+    parser.add_argument('--model-file', default=None, help=f'File model tersimpan (default: {MODEL_FILE})')
+    parser.add_argument('--review-file', default=REVIEW_FILE, help=f'File antrean review (default: {REVIEW_FILE})')
+    cli_args = parser.parse_args()
+    output = cli_args.output
+    if output is None and cli_args.input_file == UNLABELED_FILE:
+        output = OUTPUT_FILE
+    label_articles(cli_args.input_file, output, label_file=cli_args.label_file,
+                   model_file=cli_args.model_file, review_file=cli_args.review_file)
@@ -0,0 +1,238 @@
+"""
+Instrumentasi terstruktur untuk pipeline Sinta.
+
+Mencatat waktu wall/CPU per tahap, jumlah baris per detik, counter (retry,
+login ulang, dsb.), observasi latensi (misalnya waktu fetch halaman) dan hit
+rate cache NLP. Event tahap dan observasi ditulis langsung ke file JSON-lines
+(jika dikonfigurasi), sedangkan ringkasan counter/latensi/cache ditulis saat
+``flush()``, ditambah textfile Prometheus (opsional) untuk node_exporter.
+
+Contoh:
+    from interfaces.metrics import metrics
+
+    with metrics.stage('preprocess_csv') as stage:
+        ...
+        stage['rows'] = len(df)
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PROMETHEUS_PREFIX = 'sinta'
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def percentile(sorted_values, q):
+    """Menghitung persentil (nearest-rank) dari list yang sudah terurut."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _cpu_seconds():
+    """Waktu CPU proses ini ditambah proses anak yang sudah selesai."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class MetricsRecorder:
+    """Pengumpul metrik per tahap, counter, latensi dan statistik cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.jsonl_path = None
+        self.prometheus_path = None
+        self.reset()
+
+    def reset(self):
+        """Menghapus semua metrik yang sudah terkumpul."""
+        with self._lock:
+            self.stages = {}
+            self.counters = {}
+            self.observations = {}
+            self.caches = {}
+
+    def configure(self, jsonl_path=None, prometheus_path=None):
+        """
+        Mengatur tujuan ekspor metrik
+
+        Args:
+            jsonl_path: Path file JSON-lines (event ditambahkan di akhir file)
+            prometheus_path: Path textfile Prometheus (ditulis ulang saat flush)
+        """
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        for path in (jsonl_path, prometheus_path):
+            directory = os.path.dirname(path) if path else ''
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def _emit(self, event):
+        if not self.jsonl_path:
+            return
+        event = {'ts': datetime.now().isoformat(timespec='milliseconds'), **event}
+        with open(self.jsonl_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(event) + '\n')
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        """
+        Context manager untuk mengukur satu tahap
+
+        Args:
+            name: Nama tahap
+            rows: Jumlah baris yang diproses (bisa diisi belakangan lewat stage['rows'])
+
+        Yields:
+            Dict tahap; setelah blok selesai berisi wall_seconds, cpu_seconds dan rows_per_sec
+        """
+        record = {'rows': rows}
+        wall_start = time.perf_counter()
+        cpu_start = _cpu_seconds()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall_start
+            record['cpu_seconds'] = _cpu_seconds() - cpu_start
+            rows = record.get('rows')
+            record['rows_per_sec'] = rows / record['wall_seconds'] if rows and record['wall_seconds'] > 0 else None
+            with self._lock:
+                total = self.stages.setdefault(name, {'runs': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'rows': 0})
+                total['runs'] += 1
+                total['wall_seconds'] += record['wall_seconds']
+                total['cpu_seconds'] += record['cpu_seconds']
+                total['rows'] += rows or 0
+            self._emit({
+                'type': 'stage',
+                'name': name,
+                'wall_seconds': round(record['wall_seconds'], 6),
+                'cpu_seconds': round(record['cpu_seconds'], 6),
+                'rows': rows,
+                'rows_per_sec': round(record['rows_per_sec'], 2) if record['rows_per_sec'] else None,
+            })
+
+    def incr(self, name, value=1):
+        """Menambah counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value, **labels):
+        """Mencatat satu observasi (misalnya latensi dalam detik)."""
+        with self._lock:
+            self.observations.setdefault(name, []).append(value)
+        self._emit({'type': 'observation', 'name': name, 'value': round(value, 6), **labels})
+
+    def record_cache(self, name, hits, misses):
+        """Menambahkan jumlah hit/miss untuk sebuah cache."""
+        with self._lock:
+            cache = self.caches.setdefault(name, {'hits': 0, 'misses': 0})
+            cache['hits'] += hits
+            cache['misses'] += misses
+
+    def summary(self):
+        """
+        Ringkasan seluruh metrik
+
+        Returns:
+            Dict berisi stages, counters, observations (persentil) dan caches (hit rate)
+        """
+        with self._lock:
+            stages = {}
+            for name, total in self.stages.items():
+                stages[name] = dict(total)
+                stages[name]['rows_per_sec'] = (
+                    total['rows'] / total['wall_seconds'] if total['rows'] and total['wall_seconds'] > 0 else None
+                )
+            observations = {}
+            for name, values in self.observations.items():
+                ordered = sorted(values)
+                observations[name] = {
+                    'count': len(ordered),
+                    'sum': sum(ordered),
+                    'max': ordered[-1],
+                    **{f'p{int(q * 100)}': percentile(ordered, q) for q in SUMMARY_QUANTILES},
+                }
+            caches = {}
+            for name, cache in self.caches.items():
+                lookups = cache['hits'] + cache['misses']
+                caches[name] = dict(cache, hit_rate=cache['hits'] / lookups if lookups else None)
+            return {
+                'stages': stages,
+                'counters': dict(self.counters),
+                'observations': observations,
+                'caches': caches,
+            }
+
+    def flush(self):
+        """Menulis ringkasan ke JSON-lines dan textfile Prometheus (jika dikonfigurasi)."""
+        summary = self.summary()
+        if self.jsonl_path:
+            for name, value in summary['counters'].items():
+                self._emit({'type': 'counter', 'name': name, 'value': value})
+            for name, stats in summary['observations'].items():
+                self._emit({'type': 'summary', 'name': name, **stats})
+            for name, stats in summary['caches'].items():
+                self._emit({'type': 'cache', 'name': name, **stats})
+        self.export_prometheus(summary)
+        return summary
+
+    def export_prometheus(self, summary=None):
+        """Menulis ulang textfile Prometheus jika dikonfigurasi (aman dipanggil berkala)."""
+        if self.prometheus_path:
+            self.write_prometheus(self.prometheus_path, summary)
+
+    def write_prometheus(self, path, summary=None):
+        """
+        Menulis metrik dalam format textfile Prometheus (ditulis atomik)
+
+        Args:
+            path: Path file tujuan (biasanya berakhiran .prom)
+            summary: Ringkasan metrik (jika None, dihitung ulang)
+        """
+        summary = summary or self.summary()
+        prefix = PROMETHEUS_PREFIX
+        lines = []
+
+        stage_metrics = [
+            ('stage_runs_total', 'runs', 'counter', 'Jumlah eksekusi tahap'),
+            ('stage_wall_seconds_total', 'wall_seconds', 'counter', 'Total waktu wall per tahap'),
+            ('stage_cpu_seconds_total', 'cpu_seconds', 'counter', 'Total waktu CPU per tahap'),
+            ('stage_rows_total', 'rows', 'counter', 'Total baris yang diproses per tahap'),
+        ]
+        for metric, key, kind, help_text in stage_metrics:
+            lines.append(f'# HELP {prefix}_{metric} {help_text}')
+            lines.append(f'# TYPE {prefix}_{metric} {kind}')
+            for name, stats in summary['stages'].items():
+                lines.append(f'{prefix}_{metric}{{stage="{name}"}} {stats[key]}')
+
+        for name, value in summary['counters'].items():
+            lines.append(f'# TYPE {prefix}_{name}_total counter')
+            lines.append(f'{prefix}_{name}_total {value}')
+
+        for name, stats in summary['observations'].items():
+            lines.append(f'# TYPE {prefix}_{name} summary')
+            for q in SUMMARY_QUANTILES:
+                lines.append(f'{prefix}_{name}{{quantile="{q}"}} {stats[f"p{int(q * 100)}"]}')
+            lines.append(f'{prefix}_{name}_sum {stats["sum"]}')
+            lines.append(f'{prefix}_{name}_count {stats["count"]}')
+
+        for key in ('hits', 'misses'):
+            if summary['caches']:
+                lines.append(f'# TYPE {prefix}_cache_{key}_total counter')
+            for name, stats in summary['caches'].items():
+                lines.append(f'{prefix}_cache_{key}_total{{cache="{name}"}} {stats[key]}')
+
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, path)
+
+
+# Recorder global yang dipakai seluruh pipeline
+metrics = MetricsRecorder()
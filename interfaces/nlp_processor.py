@@ -14,9 +14,14 @@ import os
 import time
 from tqdm import tqdm
 import concurrent.futures
+import atexit
 import logging
 from functools import lru_cache
 import multiprocessing
+from interfaces.csv_preprocessor import clean_articles, read_raw_csv
+from interfaces.frame_dtypes import CITED_DTYPE, TEXT_DTYPE, YEAR_DTYPE, compact_articles, report_memory, to_cited, to_csv, to_year
+from interfaces.metrics import metrics
+from interfaces.shared_text import SharedTextBatch, run_task
 
 # Konfigurasi logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -25,8 +30,29 @@ logger = logging.getLogger(__name__)
 # Batas jumlah proses dan thread
 NUM_PROCESSES = max(1, multiprocessing.cpu_count() - 1)
 NUM_THREADS = min(multiprocessing.cpu_count() * 2, 16)
+
+# Kirim teks ke worker lewat shared memory (tanpa pickle per string)
+USE_SHARED_MEMORY = True
+
+# Parameter scheduler adaptif process_batch
+CALIBRATION_SAMPLE = 200       # jumlah teks awal yang diproses sekuensial untuk mengukur biaya
+TARGET_CHUNK_SECONDS = 0.25    # target durasi satu chunk di worker
+CHUNKS_PER_WORKER = 4          # minimal chunk per worker agar ekor pekerjaan seimbang
+POOL_STARTUP_SECONDS = 0.5     # estimasi biaya start pool sebelum pernah diukur
+PARALLEL_MARGIN = 1.2          # paralel hanya jika estimasi lebih cepat minimal 20%
+OUTER_CHUNK_ROWS = 50000       # jumlah baris per bagian di process_nlp untuk dataset besar
 logger.info(f"Menggunakan {NUM_PROCESSES} proses dan {NUM_THREADS} thread untuk paralelisasi")
 
+# Initializer opsional untuk worker ProcessPoolExecutor (misalnya profiler)
+worker_initializer = None
+worker_initargs = ()
+
+def set_worker_initializer(initializer, initargs=()):
+    """Mengatur fungsi yang dijalankan sekali di setiap worker proses saat dibuat."""
+    global worker_initializer, worker_initargs
+    worker_initializer = initializer
+    worker_initargs = tuple(initargs)
+
 # Flag untuk menghindari pesan warning berulang
 shown_tokenize_warning = False
 
@@ -295,9 +321,169 @@ def process_chunk(texts_chunk):
     """Memproses satu batch/chunk teks."""
     return [nlp_preprocess(text) for text in texts_chunk]
 
+def cache_counts():
+    """Mengambil jumlah hit/miss cache normalize_text dan stem_word di proses ini."""
+    return {
+        'normalize_text': normalize_text.cache_info()[:2],
+        'stem_word': stem_word.cache_info()[:2],
+    }
+
+def cache_delta(before, after):
+    """Menghitung selisih hit/miss cache antara dua snapshot cache_counts()."""
+    return {name: (after[name][0] - before[name][0], after[name][1] - before[name][1]) for name in after}
+
+def record_cache_delta(delta):
+    """Menambahkan selisih hit/miss cache ke metrik global."""
+    for name, (hits, misses) in delta.items():
+        metrics.record_cache(name, hits, misses)
+
+def process_chunk_with_stats(texts_chunk):
+    """Memproses satu chunk di worker dan mengembalikan hasil, statistik cache dan durasi."""
+    start = time.perf_counter()
+    before = cache_counts()
+    results = process_chunk(texts_chunk)
+    return results, cache_delta(before, cache_counts()), time.perf_counter() - start
+
+def process_shared_chunk(task):
+    """Memproses satu chunk teks di shared memory dan menulis hasilnya ke arena output."""
+    start = time.perf_counter()
+    before = cache_counts()
+    outcome = run_task(task, nlp_preprocess)
+    return outcome, cache_delta(before, cache_counts()), time.perf_counter() - start
+
+# Pool worker dipakai ulang antar pemanggilan process_batch
+_executor = None
+_executor_key = None
+pool_startup_seconds = None
+
+def _warmup(_):
+    """Tugas kosong untuk memastikan worker sudah hidup."""
+    return os.getpid()
+
+def get_executor():
+    """Mengambil pool worker yang masih hidup, atau membuat yang baru (sekaligus mengukur biaya start)."""
+    global _executor, _executor_key, pool_startup_seconds
+    key = (worker_initializer, worker_initargs)
+    if _executor is not None and _executor_key != key:
+        shutdown_executor()
+    if _executor is None:
+        start = time.perf_counter()
+        _executor = concurrent.futures.ProcessPoolExecutor(max_workers=NUM_PROCESSES, initializer=worker_initializer,
+                                                           initargs=worker_initargs)
+        list(_executor.map(_warmup, range(NUM_PROCESSES)))
+        _executor_key = key
+        pool_startup_seconds = time.perf_counter() - start
+        logger.info(f"Pool {NUM_PROCESSES} worker siap dalam {pool_startup_seconds:.2f} detik")
+    return _executor
+
+def shutdown_executor():
+    """Menghentikan pool worker (worker menulis hasil profiler/cache saat berhenti)."""
+    global _executor, _executor_key
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+        _executor_key = None
+
+atexit.register(shutdown_executor)
+
+def calibrate(texts):
+    """
+    Memproses sampel awal secara sekuensial untuk mengukur biaya per karakter
+
+    Args:
+        texts: List teks
+
+    Returns:
+        Tuple (hasil untuk sampel, jumlah item sampel, detik per karakter)
+    """
+    sample_size = min(CALIBRATION_SAMPLE, len(texts))
+    start = time.perf_counter()
+    results = [nlp_preprocess(text) for text in texts[:sample_size]]
+    elapsed = time.perf_counter() - start
+    sample_chars = sum(len(text) for text in texts[:sample_size]) + sample_size
+    return results, sample_size, elapsed / sample_chars
+
+def should_parallelize(remaining_chars, cost_per_char):
+    """Memutuskan mode paralel berdasarkan estimasi waktu sekuensial vs paralel."""
+    if NUM_PROCESSES < 2 or remaining_chars == 0:
+        return False
+    estimated_sequential = remaining_chars * cost_per_char
+    startup = 0.0 if _executor is not None else (pool_startup_seconds or POOL_STARTUP_SECONDS)
+    estimated_parallel = estimated_sequential / NUM_PROCESSES + startup
+    return estimated_parallel * PARALLEL_MARGIN < estimated_sequential
+
+def plan_chunks(texts, offset, cost_per_char, max_items=None):
+    """
+    Membagi texts[offset:] menjadi chunk berdasarkan jumlah karakter
+
+    Ukuran chunk mengikuti TARGET_CHUNK_SECONDS dari biaya terukur, tetapi dibatasi
+    agar setiap worker mendapat minimal CHUNKS_PER_WORKER chunk.
+
+    Returns:
+        List tuple (start, end)
+    """
+    lengths = [len(text) + 1 for text in texts[offset:]]
+    total_chars = sum(lengths)
+    target_chars = TARGET_CHUNK_SECONDS / cost_per_char if cost_per_char > 0 else total_chars
+    budget = max(1, min(target_chars, total_chars / (NUM_PROCESSES * CHUNKS_PER_WORKER)))
+
+    bounds = []
+    start = offset
+    chars = 0
+    for index, length in enumerate(lengths, offset):
+        chars += length
+        if chars >= budget or (max_items and index + 1 - start >= max_items):
+            bounds.append((start, index + 1))
+            start = index + 1
+            chars = 0
+    if start < len(texts):
+        bounds.append((start, len(texts)))
+    return bounds
+
+def _dispatch(func, tasks):
+    """
+    Mengirim tugas ke pool secara dinamis dan mengembalikan hasil sesuai urutan tugas
+
+    Worker mengambil tugas berikutnya begitu selesai (tanpa pembagian statis),
+    hasil dikumpulkan saat selesai lalu diurutkan kembali.
+    """
+    executor = get_executor()
+    futures = {executor.submit(func, task): index for index, task in enumerate(tasks)}
+    outcomes = [None] * len(tasks)
+    for future in concurrent.futures.as_completed(futures):
+        outcome, chunk_cache, seconds = future.result()
+        outcomes[futures[future]] = outcome
+        record_cache_delta(chunk_cache)
+        metrics.observe('nlp_chunk_seconds', seconds)
+    return outcomes
+
+def _process_parallel_shared(texts, bounds):
+    """Pemrosesan paralel dengan transport shared memory; None jika shared memory tidak tersedia."""
+    try:
+        batch = SharedTextBatch(texts, bounds)
+    except OSError as e:
+        logger.warning(f"Shared memory tidak tersedia ({e}), kembali ke transport pickle")
+        return None
+    
+    with batch:
+        return batch.results(_dispatch(process_shared_chunk, batch.tasks))
+
+def _process_parallel_pickle(texts, bounds):
+    """Pemrosesan paralel dengan mengirim chunk teks lewat pickle."""
+    results = []
+    for chunk_result in _dispatch(process_chunk_with_stats, [texts[start:end] for start, end in bounds]):
+        results.extend(chunk_result)
+    return results
+
 # Versi multiprocessing untuk memproses batch teks
-def process_batch(texts, batch_size=500):
-    """Memproses batch teks secara paralel menggunakan multiprocessing."""
+def process_batch(texts, batch_size=None):
+    """
+    Memproses batch teks, paralel jika diperkirakan lebih cepat.
+
+    Sampel awal diproses sekuensial untuk mengukur biaya per karakter; dari situ
+    diputuskan mode sekuensial/paralel dan ukuran chunk (berdasarkan jumlah
+    karakter). batch_size (opsional) membatasi jumlah item per chunk.
+    """
     if not texts:
         return []
     
@@ -307,84 +493,93 @@ def process_batch(texts, batch_size=500):
     # Batasi jumlah item yang diproses untuk menghindari memory overload
     texts = [t if isinstance(t, str) else "" for t in texts]
     
-    # Jika dataset kecil, proses langsung tanpa multiprocessing
-    if len(texts) < 1000:
-        logger.info(f"Dataset kecil ({len(texts)} item), memproses secara sekuensial")
-        return [nlp_preprocess(text) for text in texts]
-    
-    # Bagi data menjadi beberapa chunk untuk multiprocessing
-    chunks = []
-    for i in range(0, len(texts), batch_size):
-        chunks.append(texts[i:i+batch_size])
-    
-    logger.info(f"Memproses {len(texts)} item dalam {len(chunks)} chunk menggunakan {NUM_PROCESSES} proses")
-    
-    # Gunakan multiprocessing untuk pemrosesan paralel
-    results = []
-    start_time = time.time()
-    
-    with concurrent.futures.ProcessPoolExecutor(max_workers=NUM_PROCESSES) as executor:
-        chunk_results = list(executor.map(process_chunk, chunks))
-    
-    # Gabungkan hasil dari semua chunks
-    for chunk_result in chunk_results:
-        results.extend(chunk_result)
+    with metrics.stage('process_batch', rows=len(texts)) as stage:
+        before = cache_counts()
+        results, done, cost_per_char = calibrate(texts)
+        remaining_chars = sum(len(text) + 1 for text in texts[done:])
+        
+        if not should_parallelize(remaining_chars, cost_per_char):
+            logger.info(f"Memproses {len(texts)} item secara sekuensial "
+                        f"(estimasi {remaining_chars * cost_per_char:.2f} detik)")
+            results.extend(nlp_preprocess(text) for text in texts[done:])
+            record_cache_delta(cache_delta(before, cache_counts()))
+        else:
+            record_cache_delta(cache_delta(before, cache_counts()))
+            bounds = plan_chunks(texts, done, cost_per_char, batch_size)
+            logger.info(f"Memproses {len(texts) - done} item dalam {len(bounds)} chunk menggunakan {NUM_PROCESSES} proses "
+                        f"(estimasi sekuensial {remaining_chars * cost_per_char:.2f} detik)")
+            
+            parallel_results = _process_parallel_shared(texts, bounds) if USE_SHARED_MEMORY else None
+            if parallel_results is None:
+                parallel_results = _process_parallel_pickle(texts, bounds)
+            results.extend(parallel_results)
     
-    elapsed = time.time() - start_time
-    logger.info(f"Selesai memproses {len(texts)} item dalam {elapsed:.2f} detik ({len(texts)/elapsed:.1f} item/detik)")
+    logger.info(f"Selesai memproses {len(texts)} item dalam {stage['wall_seconds']:.2f} detik ({stage['rows_per_sec'] or 0:.1f} item/detik)")
     
     return results
 
-def preprocess_dataframe(df, output_file=None, vectorize=False, batch_size=500):
+def preprocess_dataframe(df, output_file=None, vectorize=False, batch_size=None):
     """
     Melakukan preprocessing NLP pada DataFrame untuk semua kolom (Title, Link, Authors, Year, Cited).
     """
     logger.info("Memulai preprocessing NLP...")
-    start_time = time.time()
+    with metrics.stage('preprocess_dataframe', rows=len(df)) as stage:
+        processed_df = _preprocess_dataframe(df, output_file, vectorize, batch_size)
     
+    logger.info(f"Preprocessing NLP selesai dalam {stage['wall_seconds']:.2f} detik!")
+    return processed_df
+
+def _preprocess_dataframe(df, output_file, vectorize, batch_size):
+    """Isi preprocess_dataframe (dipisah agar seluruh tahap terukur oleh metrics.stage)."""
     # Pastikan NLTK resources tersedia
     download_nltk_resources()
     
-    # Copy DataFrame untuk menghindari perubahan pada original
-    result_df = df.copy()
-    
-    # Periksa apakah kolom yang dibutuhkan ada di DataFrame
+    # Periksa apakah kolom yang dibutuhkan ada di DataFrame (df tidak diubah, jadi tidak perlu disalin)
     required_columns = ['Title', 'Link', 'Authors', 'Year', 'Cited']
-    missing_columns = [col for col in required_columns if col not in result_df.columns]
+    missing_columns = [col for col in required_columns if col not in df.columns]
     
     if missing_columns:
         logger.warning(f"Kolom berikut tidak ditemukan: {', '.join(missing_columns)}")
-        # Tambahkan kolom kosong untuk yang hilang
-        for col in missing_columns:
-            result_df[col] = ""
+    
+    def column(name):
+        # Kolom yang hilang diperlakukan sebagai kolom kosong
+        if name in df.columns:
+            return df[name]
+        return pd.Series('', index=df.index, dtype=TEXT_DTYPE)
     
     # DataFrame untuk hasil preprocessing
-    processed_df = pd.DataFrame(index=result_df.index)
+    processed_df = pd.DataFrame(index=df.index)
     
     # 1. Preprocessing Title - paling penting
     logger.info("Preprocessing kolom Title...")
-    title_texts = result_df['Title'].fillna('').astype(str).tolist()
-    processed_df['Title'] = process_batch(title_texts, batch_size)
+    title_texts = column('Title').fillna('').astype(str).tolist()
+    processed_df['Title'] = pd.array(process_batch(title_texts, batch_size), dtype=TEXT_DTYPE)
+    del title_texts
     
-    # 2. Preprocessing Link (normalisasi saja karena ini URL)
+    # 2. Preprocessing Link (normalisasi saja karena ini URL), langsung di kolom string Arrow
     logger.info("Preprocessing kolom Link...")
-    processed_df['Link'] = result_df['Link'].fillna('').apply(lambda x: x.lower().strip() if isinstance(x, str) else "")
+    processed_df['Link'] = column('Link').astype(TEXT_DTYPE).fillna('').str.lower().str.strip()
     
     # 3. Preprocessing Authors
     logger.info("Preprocessing kolom Authors...")
-    author_texts = result_df['Authors'].fillna('').astype(str).tolist()
-    processed_df['Authors'] = process_batch(author_texts, batch_size)
+    author_texts = column('Authors').fillna('').astype(str).tolist()
+    processed_df['Authors'] = pd.array(process_batch(author_texts, batch_size), dtype=TEXT_DTYPE)
+    del author_texts
     
-    # 4. Preprocessing Year (ekstrak dan bersihkan)
+    # 4. Preprocessing Year (ekstrak dan bersihkan; tahun tidak dikenal menjadi <NA>)
+    # Kolom yang sudah bertipe Int16/Int32 (misalnya dari clean_articles) tidak di-parse ulang
     logger.info("Preprocessing kolom Year...")
-    processed_df['Year'] = result_df['Year'].fillna('').astype(str).apply(lambda x: 
-        re.search(r'(19|20)\d{2}', str(x)).group(0) if re.search(r'(19|20)\d{2}', str(x)) else "Unknown")
+    if column('Year').dtype == YEAR_DTYPE:
+        processed_df['Year'] = df['Year']
+    else:
+        processed_df['Year'] = to_year(column('Year').astype(TEXT_DTYPE).str.extract(r'((?:19|20)\d{2})', expand=False))
     
     # 5. Preprocessing Cited (konversi ke numerik)
     logger.info("Preprocessing kolom Cited...")
-    processed_df['Cited'] = result_df['Cited'].fillna('0').astype(str).apply(lambda x: 
-        re.sub(r'[^\d]', '', str(x)) if str(x).strip() else "0")
-    processed_df['Cited'] = pd.to_numeric(processed_df['Cited'], errors='coerce').fillna(0).astype(int)
+    if column('Cited').dtype == CITED_DTYPE:
+        processed_df['Cited'] = df['Cited']
+    else:
+        processed_df['Cited'] = to_cited(column('Cited').astype(TEXT_DTYPE).str.replace(r'[^\d]', '', regex=True))
     
     # Vektorisasi Title (opsional)
     if vectorize:
@@ -417,15 +612,106 @@ def preprocess_dataframe(df, output_file=None, vectorize=False, batch_size=500):
     # Simpan hasil ke file
     if output_file:
         try:
-            processed_df.to_csv(output_file, index=False)
+            to_csv(processed_df, output_file)
             logger.info(f"Hasil preprocessing NLP disimpan ke {output_file}")
         except Exception as e:
             logger.error(f"Gagal menyimpan hasil ke file: {e}")
     
-    total_time = time.time() - start_time
-    logger.info(f"Preprocessing NLP selesai dalam {total_time:.2f} detik!")
     return processed_df
 
+def _process_frame(df, output_file, vectorize):
+    """
+    Preprocessing NLP atas DataFrame artikel di memori (per bagian OUTER_CHUNK_ROWS untuk dataset besar)
+    
+    Returns:
+        Jumlah baris yang diproses
+    """
+    # Deteksi ukuran dataset
+    num_rows = len(df)
+    logger.info(f"Dataset berisi {num_rows} baris")
+    
+    # Ukuran chunk ditentukan scheduler adaptif di process_batch
+    batch_size = None
+    
+    # Bagi dataset untuk dataset besar (pool worker dipakai ulang antar bagian)
+    if num_rows > OUTER_CHUNK_ROWS:
+        logger.info(f"Dataset besar terdeteksi ({num_rows} baris). Memproses dalam beberapa bagian...")
+        
+        # Berapa bagian yang dibutuhkan 
+        chunk_size = OUTER_CHUNK_ROWS
+        num_chunks = (num_rows // chunk_size) + (1 if num_rows % chunk_size > 0 else 0)
+        logger.info(f"Akan memproses dalam {num_chunks} bagian...")
+        
+        # Siapkan untuk hasil gabungan
+        all_processed = []
+        
+        for i in range(0, num_rows, chunk_size):
+            chunk_end = min(i + chunk_size, num_rows)
+            logger.info(f"Memproses bagian {i//chunk_size + 1}/{num_chunks} (baris {i+1}-{chunk_end})...")
+            
+            # Proses chunk
+            # preprocess_dataframe tidak mengubah input, jadi cukup view tanpa salinan
+            chunk_df = df.iloc[i:chunk_end]
+            processed_chunk = preprocess_dataframe(
+                chunk_df,
+                output_file=None,
+                vectorize=False,
+                batch_size=batch_size
+            )
+            
+            all_processed.append(processed_chunk)
+            
+            # Bebaskan memori
+            del chunk_df
+            import gc; gc.collect()
+        
+        # Gabungkan hasil
+        logger.info("Menggabungkan hasil semua bagian...")
+        final_df = pd.concat(all_processed, ignore_index=True)
+        
+        del all_processed
+        report_memory(final_df, 'process_nlp')
+        
+        # Simpan hasil
+        to_csv(final_df, output_file)
+        logger.info(f"Hasil NLP preprocessing disimpan ke {output_file}")
+        
+        # Vektorisasi
+        if vectorize:
+            try:
+                logger.info("Melakukan vektorisasi pada hasil gabungan...")
+                # Filter teks kosong
+                mask = final_df['Title'].str.strip() != ''
+                texts = final_df.loc[mask, 'Title'].tolist()
+                
+                if texts:
+                    # TF-IDF Vectorization
+                    vectorizer = TfidfVectorizer(max_features=1000)
+                    tfidf_matrix = vectorizer.fit_transform(texts)
+                    
+                    # Simpan vectorizer dan feature matrix
+                    vectorizer_file = f"{os.path.splitext(output_file)[0]}_tfidf_vectorizer.pkl"
+                    joblib.dump(vectorizer, vectorizer_file)
+                    logger.info(f"Vectorizer disimpan ke {vectorizer_file}")
+                    
+                    feature_file = f"{os.path.splitext(output_file)[0]}_tfidf_features.pkl"
+                    joblib.dump(tfidf_matrix, feature_file)
+                    logger.info(f"Feature matrix disimpan ke {feature_file}")
+            except Exception as e:
+                logger.error(f"Error dalam vektorisasi: {e}")
+    else:
+        # Jika dataset relatif kecil, proses sekaligus
+        logger.info(f"Memproses {num_rows} baris data sekaligus...")
+        processed_df = preprocess_dataframe(
+            df,
+            output_file=output_file,
+            vectorize=vectorize,
+            batch_size=batch_size
+        )
+        report_memory(processed_df, 'process_nlp')
+    
+    return num_rows
+
 # Main function untuk memproses file CSV
 def process_nlp(input_file, output_file=None, vectorize=True, translate=False):
     """
@@ -449,128 +735,92 @@ def process_nlp(input_file, output_file=None, vectorize=True, translate=False):
         output_file = f"{filename}_nlp{ext}"
     
     logger.info(f"=== Memulai preprocessing NLP untuk file {input_file} ===")
-    start_time = time.time()
-    
-    try:
-        # Baca file CSV dengan opsi toleran
-        logger.info(f"Membaca file {input_file}...")
+    with metrics.stage('process_nlp') as stage:
         try:
-            # Gunakan engine Python yang lebih toleran
-            df = pd.read_csv(input_file, on_bad_lines='warn', engine='python')
-        except Exception as e:
-            logger.warning(f"Error membaca CSV dengan pandas default: {e}")
-            logger.info("Mencoba metode alternatif...")
-            df = pd.read_csv(input_file, on_bad_lines='skip', encoding='utf-8', engine='python')
+            # Baca file CSV dengan opsi toleran
+            logger.info(f"Membaca file {input_file}...")
+            try:
+                # Gunakan engine Python yang lebih toleran
+                df = pd.read_csv(input_file, on_bad_lines='warn', engine='python')
+            except Exception as e:
+                logger.warning(f"Error membaca CSV dengan pandas default: {e}")
+                logger.info("Mencoba metode alternatif...")
+                df = pd.read_csv(input_file, on_bad_lines='skip', encoding='utf-8', engine='python')
         
-        # Periksa apakah kolom yang diperlukan ada
-        required_columns = ['Title', 'Link', 'Authors', 'Year', 'Cited']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+            # Periksa apakah kolom yang diperlukan ada
+            required_columns = ['Title', 'Link', 'Authors', 'Year', 'Cited']
+            missing_columns = [col for col in required_columns if col not in df.columns]
         
-        if missing_columns:
-            logger.warning(f"Kolom tidak lengkap: {', '.join(missing_columns)} tidak ditemukan.")
-            # Tambahkan kolom kosong jika tidak ada
-            for col in missing_columns:
-                df[col] = ""
+            if missing_columns:
+                logger.warning(f"Kolom tidak lengkap: {', '.join(missing_columns)} tidak ditemukan.")
+                # Tambahkan kolom kosong jika tidak ada
+                for col in missing_columns:
+                    df[col] = ""
+            compact_articles(df)
+            report_memory(df, 'process_nlp_input')
         
-        # Deteksi ukuran dataset
-        num_rows = len(df)
-        logger.info(f"Dataset berisi {num_rows} baris")
+            num_rows = _process_frame(df, output_file, vectorize)
         
-        # Ukuran batch: sesuaikan berdasarkan jumlah baris
-        if num_rows <= 1000:
-            batch_size = 200
-        elif num_rows <= 5000:
-            batch_size = 500
-        else:
-            batch_size = 1000
-            
-        # Bagi dataset untuk dataset besar
-        if num_rows > 10000:
-            logger.info(f"Dataset besar terdeteksi ({num_rows} baris). Memproses dalam beberapa bagian...")
-            
-            # Berapa bagian yang dibutuhkan 
-            chunk_size = 5000 # Proses 5000 baris sekaligus
-            num_chunks = (num_rows // chunk_size) + (1 if num_rows % chunk_size > 0 else 0)
-            logger.info(f"Akan memproses dalam {num_chunks} bagian...")
-            
-            # Siapkan untuk hasil gabungan
-            all_processed = []
-            
-            for i in range(0, num_rows, chunk_size):
-                chunk_end = min(i + chunk_size, num_rows)
-                logger.info(f"Memproses bagian {i//chunk_size + 1}/{num_chunks} (baris {i+1}-{chunk_end})...")
-                
-                # Proses chunk
-                chunk_df = df.iloc[i:chunk_end].copy()
-                processed_chunk = preprocess_dataframe(
-                    chunk_df,
-                    output_file=None,
-                    vectorize=False,
-                    batch_size=batch_size
-                )
-                
-                all_processed.append(processed_chunk)
-                
-                # Bebaskan memori
-                del chunk_df
-                import gc; gc.collect()
-            
-            # Gabungkan hasil
-            logger.info("Menggabungkan hasil semua bagian...")
-            final_df = pd.concat(all_processed, ignore_index=True)
-            
-            # Simpan hasil
-            final_df.to_csv(output_file, index=False)
-            logger.info(f"Hasil NLP preprocessing disimpan ke {output_file}")
-            
-            # Vektorisasi
-            if vectorize:
-                try:
-                    logger.info("Melakukan vektorisasi pada hasil gabungan...")
-                    # Filter teks kosong
-                    mask = final_df['Title'].str.strip() != ''
-                    texts = final_df.loc[mask, 'Title'].tolist()
-                    
-                    if texts:
-                        # TF-IDF Vectorization
-                        vectorizer = TfidfVectorizer(max_features=1000)
-                        tfidf_matrix = vectorizer.fit_transform(texts)
-                        
-                        # Simpan vectorizer dan feature matrix
-                        vectorizer_file = f"{os.path.splitext(output_file)[0]}_tfidf_vectorizer.pkl"
-                        joblib.dump(vectorizer, vectorizer_file)
-                        logger.info(f"Vectorizer disimpan ke {vectorizer_file}")
-                        
-                        feature_file = f"{os.path.splitext(output_file)[0]}_tfidf_features.pkl"
-                        joblib.dump(tfidf_matrix, feature_file)
-                        logger.info(f"Feature matrix disimpan ke {feature_file}")
-                except Exception as e:
-                    logger.error(f"Error dalam vektorisasi: {e}")
-        else:
-            # Jika dataset relatif kecil, proses sekaligus
-            logger.info(f"Memproses {num_rows} baris data sekaligus...")
-            processed_df = preprocess_dataframe(
-                df,
-                output_file=output_file,
-                vectorize=vectorize,
-                batch_size=batch_size
-            )
+            stage['rows'] = num_rows
         
-        elapsed_time = time.time() - start_time
-        minutes = int(elapsed_time // 60)
-        seconds = elapsed_time % 60
+        except Exception as e:
+            logger.error(f"Error dalam preprocessing NLP: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise
+    
+    elapsed_time = stage['wall_seconds']
+    minutes = int(elapsed_time // 60)
+    seconds = elapsed_time % 60
+    
+    if minutes > 0:
+        time_msg = f"{minutes} menit {seconds:.1f} detik"
+    else:
+        time_msg = f"{seconds:.1f} detik"
         
-        if minutes > 0:
-            time_msg = f"{minutes} menit {seconds:.1f} detik"
-        else:
-            time_msg = f"{seconds:.1f} detik"
-            
-        logger.info(f"=== Preprocessing NLP selesai dalam {time_msg} ({elapsed_time/num_rows:.4f} detik/baris) ===")
+    logger.info(f"=== Preprocessing NLP selesai dalam {time_msg} ({elapsed_time/max(num_rows, 1):.4f} detik/baris) ===")
+    
+    return output_file
+
+def process_raw(input_file, output_file=None, vectorize=True, processed_file=None, chunk_rows=None, workers=1):
+    """
+    Mode fused: pembersihan (preprocess_csv) dan preprocessing NLP dalam satu pass di memori.
+    
+    File mentah dibaca sekali, dibersihkan per chunk (paralel jika workers > 1) dan
+    hasilnya yang sudah bertipe ringkas (Year Int16, Cited Int32) langsung diteruskan
+    ke NLP tanpa ditulis lalu di-parse ulang dari CSV antara.
+    
+    Args:
+        input_file: Path ke file CSV hasil scraping
+        output_file: Path hasil NLP (jika None, akan menggunakan nama input + '_processed_nlp')
+        vectorize: Flag untuk melakukan vektorisasi pada teks
+        processed_file: Jika diisi, hasil pembersihan juga ditulis ke file ini (CSV antara)
+        chunk_rows: Ukuran chunk pembersihan paralel
+        workers: Jumlah proses worker pembersihan
+    
+    Returns:
+        Path ke file hasil preprocessing NLP
+    """
+    if not os.path.exists(input_file):
+        raise FileNotFoundError(f"File {input_file} tidak ditemukan")
+    
+    if output_file is None:
+        filename, ext = os.path.splitext(input_file)
+        output_file = f"{filename}_processed_nlp{ext}"
+    
+    logger.info(f"=== Memulai preprocessing fused (bersih + NLP) untuk file {input_file} ===")
+    with metrics.stage('process_raw') as stage:
+        df = read_raw_csv(input_file)
+        logger.info(f"Data awal: {df.shape[0]} baris, {df.shape[1]} kolom")
+        df = clean_articles(df, chunk_rows=chunk_rows, workers=workers, stage='process_raw_input')
         
-        return output_file
+        if processed_file:
+            to_csv(df, processed_file)
+            logger.info(f"Hasil pembersihan disimpan ke {processed_file}")
         
-    except Exception as e:
-        logger.error(f"Error dalam preprocessing NLP: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        raise 
\ No newline at end of file
+        stage['rows'] = _process_frame(df, output_file, vectorize)
+    
+    logger.info(f"=== Preprocessing fused selesai dalam {stage['wall_seconds']:.1f} detik "
+                f"({stage['wall_seconds']/max(stage['rows'], 1):.4f} detik/baris) ===")
+    
+    return output_file
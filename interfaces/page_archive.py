@@ -0,0 +1,153 @@
+"""
+Arsip HTML mentah halaman listing Sinta (content-addressed, terkompresi).
+
+Setiap halaman yang diambil scraper disimpan apa adanya (``driver.page_source``)
+sehingga parsing dapat diulang offline, misalnya saat selector berubah atau
+ada kolom baru, tanpa scraping ulang lewat Selenium. Format arsip:
+
+- ``[nama].pack``: blob HTML terkompresi (zstd, atau zlib jika paket
+  ``zstandard`` tidak terpasang) yang disambung berurutan; setiap blob
+  dikompresi terpisah agar bisa dibaca acak dan paralel
+- ``[nama].idx``: JSON-lines satu baris per pengambilan halaman (page, url,
+  fetched_at, sha256, offset, length, codec)
+
+Blob diberi alamat sha256 dari HTML-nya: halaman yang isinya tidak berubah
+tidak disimpan dua kali. Index hanya ditambah setelah blob selesai ditulis,
+dan baris index yang menunjuk melewati ukuran pack (misalnya karena proses
+terhenti) diabaikan saat arsip dibuka.
+
+Contoh:
+    from interfaces.page_archive import PageArchive
+    archive = PageArchive('data/archive/sinta_pages')
+    archive.put(2503, url, html)
+    html = archive.get(archive.latest()[2503])
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_FILE = os.path.join('data', 'archive', 'sinta_pages')
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 6
+
+
+def default_codec():
+    """Codec kompresi yang tersedia: zstd jika terpasang, selain itu zlib."""
+    return 'zstd' if zstandard is not None else 'zlib'
+
+
+def compress(data, codec):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if codec == 'zlib':
+        return zlib.compress(data, ZLIB_LEVEL)
+    raise ValueError(f"Codec arsip tidak dikenal: {codec}")
+
+
+def decompress(data, codec):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ImportError("Arsip memakai zstd; pasang paket zstandard untuk membacanya")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == 'zlib':
+        return zlib.decompress(data)
+    raise ValueError(f"Codec arsip tidak dikenal: {codec}")
+
+
+def read_page(pack_file, entry):
+    """HTML asli sebuah entri index langsung dari file pack (tanpa memuat index)."""
+    with open(pack_file, 'rb') as file:
+        file.seek(entry['offset'])
+        data = file.read(entry['length'])
+    return decompress(data, entry['codec']).decode('utf-8')
+
+
+class PageArchive:
+    """Arsip append-only halaman HTML mentah dengan index offset."""
+
+    def __init__(self, path=ARCHIVE_FILE, codec=None):
+        self.path = path
+        self.pack_file = f'{path}.pack'
+        self.index_file = f'{path}.idx'
+        self.codec = codec or default_codec()
+        self.entries = []
+        self._blobs = {}
+        self._partial_line = False
+        self._load_index()
+
+    def _load_index(self):
+        if not os.path.exists(self.index_file):
+            return
+        pack_size = os.path.getsize(self.pack_file) if os.path.exists(self.pack_file) else 0
+        with open(self.index_file, encoding='utf-8') as file:
+            for line in file:
+                self._partial_line = not line.endswith('\n')
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # baris terakhir yang terpotong
+                if entry['offset'] + entry['length'] <= pack_size:
+                    self.entries.append(entry)
+                    self._blobs.setdefault(entry['sha256'], entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def put(self, page, url, html):
+        """
+        Menyimpan HTML satu halaman (blob baru hanya jika isinya belum ada)
+
+        Returns:
+            Dict entri index
+        """
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self._blobs.get(digest)
+        if blob is None:
+            directory = os.path.dirname(self.pack_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            compressed = compress(data, self.codec)
+            with open(self.pack_file, 'ab') as file:
+                offset = file.tell()
+                file.write(compressed)
+            blob = {'sha256': digest, 'offset': offset, 'length': len(compressed), 'codec': self.codec}
+        entry = {
+            'page': page,
+            'url': url,
+            'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            'sha256': digest,
+            'offset': blob['offset'],
+            'length': blob['length'],
+            'codec': blob['codec'],
+            'size': len(data),
+        }
+        with open(self.index_file, 'a', encoding='utf-8') as file:
+            # Tutup baris terpotong dari proses sebelumnya agar entri baru tetap terbaca
+            file.write(('\n' if self._partial_line else '') + json.dumps(entry) + '\n')
+        self._partial_line = False
+        self.entries.append(entry)
+        self._blobs.setdefault(digest, entry)
+        return entry
+
+    def latest(self):
+        """Entri pengambilan terakhir per nomor halaman."""
+        return {entry['page']: entry for entry in self.entries}
+
+    def get(self, entry):
+        """HTML asli dari sebuah entri index."""
+        return read_page(self.pack_file, entry)
+
+    def stats(self):
+        """Jumlah entri, blob unik, ukuran asli dan ukuran terkompresi."""
+        raw = sum(entry.get('size', 0) for entry in self._blobs.values())
+        packed = os.path.getsize(self.pack_file) if os.path.exists(self.pack_file) else 0
+        return {'entries': len(self.entries), 'blobs': len(self._blobs), 'raw_bytes': raw, 'packed_bytes': packed}
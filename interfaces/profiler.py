@@ -0,0 +1,278 @@
+"""
+Profiler sampling opsional untuk pipeline preprocessing dan NLP.
+
+Sebuah thread pengambil sampel membaca stack semua thread (``sys._current_frames``)
+setiap beberapa milidetik, baik di proses utama maupun di setiap worker
+``ProcessPoolExecutor`` (dipasang lewat initializer worker di nlp_processor).
+Sampel per worker ditulis saat worker berhenti, lalu digabung menjadi:
+
+- ``profile.collapsed`` : format collapsed-stack (kompatibel flamegraph.pl / speedscope)
+- ``hotspots.txt``      : ringkasan top-N fungsi (self & inklusif) dan per paket
+
+Contoh:
+    profiler = PipelineProfiler('profile')
+    process_nlp = profiler.wrap(process_nlp)
+    ...
+    profiler.write_report()
+"""
+
+import functools
+import glob
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from multiprocessing import util
+
+from interfaces import nlp_processor
+
+DEFAULT_INTERVAL = 0.005
+WORKER_FILE_PATTERN = 'worker_{pid}.collapsed'
+
+# Frame daun yang berarti thread sedang menunggu (bukan bekerja)
+IDLE_FRAMES = {
+    ('wait', 'threading.py'), ('_wait_for_tstate_lock', 'threading.py'),
+    ('select', 'selectors.py'), ('poll', 'selectors.py'),
+    ('wait', 'connection.py'), ('_poll', 'connection.py'), ('_recv', 'connection.py'),
+    ('get', 'queues.py'), ('wait', 'process.py'),
+}
+
+
+def frame_label(frame):
+    """Label satu frame: nama fungsi beserta lokasi filenya."""
+    code = frame.f_code
+    return f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _short_path(path):
+    """Memendekkan path file agar label flamegraph tetap terbaca."""
+    marker = 'site-packages' + os.sep
+    if marker in path:
+        return path.split(marker, 1)[1]
+    cwd = os.getcwd() + os.sep
+    if path.startswith(cwd):
+        return path[len(cwd):]
+    return os.path.basename(path)
+
+
+def is_idle(label):
+    """True jika label frame daun menunjukkan thread sedang menunggu."""
+    name, _, location = label.partition(' (')
+    return (name, os.path.basename(location.split(':', 1)[0])) in IDLE_FRAMES
+
+
+def package_of(label):
+    """Nama paket/modul dari label frame (untuk agregasi per paket)."""
+    location = label.rsplit('(', 1)[-1].split(':', 1)[0]
+    parts = location.replace('\\', '/').split('/')
+    if len(parts) > 1:
+        return parts[0]
+    return os.path.splitext(parts[0])[0]
+
+
+class SamplingProfiler:
+    """Profiler statistik berbasis thread; jumlah per stack dinyatakan dalam milidetik."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples = Counter()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Mulai mengambil sampel di thread latar belakang."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Berhenti mengambil sampel."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            # Bobot sampel = waktu sejak sampel sebelumnya (ms), karena thread
+            # sampler bisa tertunda menunggu GIL dari thread yang sibuk
+            now = time.perf_counter()
+            weight = max(1, int(round((now - last) * 1000)))
+            last = now
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(frame_label(frame))
+                    frame = frame.f_back
+                stack.append(f"{names.get(ident, 'thread')} [pid {os.getpid()}]")
+                stack.reverse()
+                self.samples[';'.join(stack)] += weight
+
+    def write_collapsed(self, path):
+        """Menulis sampel ke file collapsed-stack."""
+        write_collapsed(self.samples, path)
+
+
+def write_collapsed(samples, path):
+    """Menulis Counter stack -> jumlah sampel ke format collapsed-stack."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for stack, count in samples.most_common():
+            file.write(f"{stack} {count}\n")
+
+
+def read_collapsed(path):
+    """Membaca file collapsed-stack menjadi Counter."""
+    samples = Counter()
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            stack, _, count = line.rstrip('\n').rpartition(' ')
+            if stack:
+                samples[stack] += int(count)
+    return samples
+
+
+# Profiler milik proses worker (diisi oleh worker_initializer)
+_worker_profiler = None
+
+
+def worker_initializer(output_dir, interval):
+    """Initializer worker ProcessPoolExecutor: mulai sampling dan tulis hasil saat worker keluar."""
+    global _worker_profiler
+    _worker_profiler = SamplingProfiler(interval)
+    _worker_profiler.start()
+    util.Finalize(None, _dump_worker_profile, args=(output_dir,), exitpriority=10)
+
+
+def _dump_worker_profile(output_dir):
+    if _worker_profiler is None:
+        return
+    _worker_profiler.stop()
+    path = os.path.join(output_dir, WORKER_FILE_PATTERN.format(pid=os.getpid()))
+    # Satu pid bisa dipakai ulang oleh pool berikutnya, jadi gabungkan dengan isi lama
+    if os.path.exists(path):
+        _worker_profiler.samples.update(read_collapsed(path))
+    _worker_profiler.write_collapsed(path)
+
+
+class PipelineProfiler:
+    """Mengatur profiling proses utama dan worker lalu menggabungkan hasilnya."""
+
+    def __init__(self, output_dir='profile', interval=DEFAULT_INTERVAL, top_n=25):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.top_n = top_n
+        self.profiler = SamplingProfiler(interval)
+        self.wall_seconds = 0.0
+        os.makedirs(output_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(output_dir, WORKER_FILE_PATTERN.format(pid='*'))):
+            os.remove(stale)
+
+    def wrap(self, func):
+        """Membungkus func sehingga dijalankan di bawah profiler (termasuk worker-nya)."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self.profiler.running:
+                return func(*args, **kwargs)
+            nlp_processor.set_worker_initializer(worker_initializer, (self.output_dir, self.interval))
+            self.profiler.start()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.wall_seconds += time.perf_counter() - start
+                self.profiler.stop()
+                # Hentikan pool agar worker menulis sampelnya sebelum laporan dibuat
+                nlp_processor.shutdown_executor()
+                nlp_processor.set_worker_initializer(None)
+        return wrapper
+
+    def merged_samples(self):
+        """Menggabungkan sampel proses utama dengan sampel semua worker."""
+        merged = Counter(self.profiler.samples)
+        for path in glob.glob(os.path.join(self.output_dir, WORKER_FILE_PATTERN.format(pid='*'))):
+            merged.update(read_collapsed(path))
+        return merged
+
+    def write_report(self):
+        """
+        Menulis profile.collapsed dan hotspots.txt ke output_dir
+
+        Returns:
+            Path file ringkasan hotspot, atau None jika tidak ada sampel
+        """
+        samples = self.merged_samples()
+        if not samples:
+            return None
+        collapsed_file = os.path.join(self.output_dir, 'profile.collapsed')
+        write_collapsed(samples, collapsed_file)
+
+        summary = format_hotspots(samples, self.top_n, self.interval, self.wall_seconds)
+        summary_file = os.path.join(self.output_dir, 'hotspots.txt')
+        with open(summary_file, 'w', encoding='utf-8') as file:
+            file.write(summary)
+        print(summary)
+        print(f"Profil collapsed-stack disimpan di {collapsed_file} (gunakan flamegraph.pl atau speedscope)")
+        return summary_file
+
+
+def format_hotspots(samples, top_n=25, interval=DEFAULT_INTERVAL, wall_seconds=None):
+    """
+    Membuat ringkasan hotspot dari sampel collapsed-stack
+
+    Args:
+        samples: Counter stack -> milidetik
+        top_n: Jumlah fungsi teratas yang ditampilkan
+        interval: Interval sampling (detik)
+        wall_seconds: Total waktu wall bagian yang diprofil (opsional)
+
+    Returns:
+        String ringkasan
+    """
+    total = sum(samples.values())
+    busy = 0
+    self_counts = Counter()
+    inclusive_counts = Counter()
+    package_counts = Counter()
+    for stack, count in samples.items():
+        frames = stack.split(';')
+        leaf = frames[-1]
+        if len(frames) == 1 or is_idle(leaf):
+            package_counts['(menunggu/idle)'] += count
+            continue
+        busy += count
+        self_counts[leaf] += count
+        package_counts[package_of(leaf)] += count
+        for frame in set(frames[1:]):
+            inclusive_counts[frame] += count
+
+    lines = [f"Total waktu thread tersampel: {total / 1000:.1f} detik (interval {interval * 1000:.1f} ms), "
+             f"aktif: {busy / 1000:.1f} detik"]
+    if wall_seconds:
+        lines.append(f"Waktu wall bagian yang diprofil: {wall_seconds:.2f} detik")
+    busy = busy or 1
+
+    lines.append(f"\nTop {top_n} fungsi berdasarkan waktu sendiri (self, % dari waktu aktif):")
+    for label, count in self_counts.most_common(top_n):
+        lines.append(f"  {count / busy * 100:6.2f}%  {count:>9} ms  {label}")
+
+    lines.append(f"\nTop {top_n} fungsi berdasarkan waktu inklusif (% dari waktu aktif):")
+    for label, count in inclusive_counts.most_common(top_n):
+        lines.append(f"  {count / busy * 100:6.2f}%  {count:>9} ms  {label}")
+
+    lines.append("\nWaktu sendiri per paket/modul (% dari total):")
+    for package, count in package_counts.most_common(top_n):
+        lines.append(f"  {count / total * 100:6.2f}%  {count:>9} ms  {package}")
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,434 @@
+"""
+Layanan kueri lokal (HTTP asyncio) dengan model yang tetap dimuat di memori.
+
+Setiap kueri lewat CLI harus memulai Python, mengimpor stack NLP dan memuat
+ulang vectorizer/model dari pickle. ``main.py serve`` memuat semuanya sekali:
+bundle model SDGs, vectorizer dan matriks TF-IDF hasil NLP, serta cube
+analitik, lalu melayani kueri JSON di localhost (tanpa akses jaringan luar):
+
+- ``GET  /health``: status dan sumber data yang dimuat
+- ``POST /preprocess``: ``{"texts": [...]}`` -> hasil ``nlp_preprocess`` per teks
+- ``POST /predict``: ``{"titles": [...], "top_k": 3}`` -> label SDGs teratas per judul
+- ``GET  /similar?text=...&top=10``: artikel dengan cosine TF-IDF tertinggi
+- ``GET  /article?row=N`` atau ``?link=URL``: kolom satu artikel
+- ``GET  /stats?dimension=Year&key=2020``: baris ringkasan cube (jumlah artikel, sitasi)
+
+/similar dan /article mengembalikan Title, Link dan Authors asli dari input NLP
+(``[nama]_processed.csv`` atau file scraping), bukan hasil stemming.
+
+Permintaan yang datang bersamaan digabung (micro-batching): setiap endpoint
+berat punya satu antrean, dan semua teks yang menunggu hingga ``max_wait``
+detik (atau sampai ``max_batch`` teks) diproses dalam satu panggilan
+vectorize/predict di thread terpisah, sehingga event loop tetap responsif.
+
+Contoh:
+    python main.py serve data/sinta_articles_2503_to_3336_processed_nlp.csv --port 8765
+    curl -s localhost:8765/predict -d '{"titles": ["analisis ketahanan pangan"]}'
+"""
+
+import asyncio
+import json
+import os
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from interfaces.analytics import CUBE_FILE, load_cube
+from interfaces.csv_preprocessor import DISPLAY_COLUMNS, display_articles
+from interfaces.label_sdgs import DEFAULT_TOP_K, MODEL_FILE, load_model, model_version, predict_top_k
+from interfaces.metrics import metrics
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_WAIT = 0.005       # detik menunggu permintaan lain sebelum batch dijalankan
+MAX_BODY_BYTES = 1 << 20
+MAX_TOP = 100
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class RequestError(Exception):
+    """Kesalahan permintaan yang dikembalikan ke klien dengan kode status HTTP."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MicroBatcher:
+    """
+    Menggabungkan item dari permintaan yang bersamaan menjadi satu panggilan func
+
+    func menerima list item dan mengembalikan list hasil dengan urutan yang sama;
+    func dijalankan di thread executor, satu batch pada satu waktu.
+    """
+
+    def __init__(self, name, func, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        self.name = name
+        self.func = func
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, items):
+        """Menambahkan item ke antrean dan menunggu hasilnya."""
+        if not items:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((list(items), future))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        count = len(batch[0][0])
+        deadline = loop.time() + self.max_wait
+        while count < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(entry)
+            count += len(entry[0])
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            items = [item for entry_items, _ in batch for item in entry_items]
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(None, self.func, items)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            metrics.observe(f'serve_{self.name}_batch_seconds', time.perf_counter() - start)
+            metrics.incr(f'serve_{self.name}_batches')
+            metrics.incr(f'serve_{self.name}_items', len(items))
+            position = 0
+            for entry_items, future in batch:
+                if not future.done():
+                    future.set_result(results[position:position + len(entry_items)])
+                position += len(entry_items)
+
+
+def _json_default(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if value is pd.NA or value is pd.NaT:
+        return None
+    return str(value)
+
+
+def _record(df, row):
+    """Kolom satu baris artikel sebagai dict (nilai kosong menjadi None)."""
+    return {column: (None if pd.isna(value) else value) for column, value in df.iloc[row].items()}
+
+
+class QueryService:
+    """
+    Sumber data yang dimuat sekali dan handler setiap endpoint
+
+    Args:
+        nlp_file: File CSV hasil NLP (dengan file TF-IDF-nya) untuk /similar dan /article
+        model_file: Bundle model SDGs untuk /predict
+        cube_file: File cube analitik untuk /stats
+        max_batch: Jumlah teks maksimum per batch
+        max_wait: Waktu tunggu (detik) untuk mengumpulkan batch
+    """
+
+    def __init__(self, nlp_file=None, model_file=MODEL_FILE, cube_file=CUBE_FILE,
+                 max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        from interfaces.nlp_processor import nlp_preprocess
+
+        self.nlp_preprocess = nlp_preprocess
+        self.nlp_file = nlp_file
+        self.bundle = load_model(model_file)
+        self.version = model_version(self.bundle) if self.bundle else None
+        self.df = self.X = self.rows = self.vectorizer = self.links = self.display = None
+        if nlp_file:
+            from interfaces.clustering import load_features
+
+            self.df, self.X, mask, self.vectorizer = load_features(nlp_file)
+            self.rows = np.flatnonzero(mask)
+            self.links = pd.Index(self.df['Link'].astype(str))
+            display = display_articles(nlp_file, len(self.df))
+            self.display = None if display is None else display[DISPLAY_COLUMNS]
+        self.cube = load_cube(cube_file) if os.path.exists(cube_file) else None
+        # Panggilan pertama memuat stemmer dan stopwords, jangan dibebankan ke kueri pertama
+        nlp_preprocess('pemanasan layanan')
+
+        self.batchers = {
+            'preprocess': MicroBatcher('preprocess', self._preprocess_batch, max_batch, max_wait),
+            'predict': MicroBatcher('predict', self._predict_batch, max_batch, max_wait),
+            'similar': MicroBatcher('similar', self._similar_batch, max_batch, max_wait),
+        }
+
+    def status(self):
+        return {
+            'status': 'ok',
+            'model': self.version,
+            'articles': None if self.df is None else len(self.df),
+            'source': self.nlp_file,
+            'cube': self.cube is not None,
+        }
+
+    def record(self, row):
+        """Kolom satu artikel; Title, Link dan Authors diambil dari input NLP jika tersedia."""
+        record = _record(self.df, row)
+        if self.display is not None:
+            record.update(_record(self.display, row))
+        return record
+
+    # Fungsi batch (dijalankan di thread executor, satu batch per endpoint pada satu waktu)
+
+    def _preprocess_batch(self, texts):
+        return [self.nlp_preprocess(text) for text in texts]
+
+    def _predict_batch(self, items):
+        texts = [self.nlp_preprocess(title) for title, _ in items]
+        k = max(top_k for _, top_k in items)
+        labels, probabilities = predict_top_k(self.bundle, texts, k)
+        return [
+            [[str(label), round(float(prob), 4)] for label, prob in zip(row_labels[:top_k], row_proba[:top_k])]
+            for (_, top_k), row_labels, row_proba in zip(items, labels, probabilities)
+        ]
+
+    def _similar_batch(self, items):
+        queries = self.vectorizer.transform([self.nlp_preprocess(text) for text, _ in items])
+        # Satu perkalian sparse untuk semua kueri dalam batch (vektor TF-IDF sudah ternormalisasi L2)
+        # Hasil tetap sparse: hanya artikel yang berbagi term dengan kueri yang punya skor
+        scores = (queries @ self.X.T).tocsr()
+        results = []
+        for (_, top), i in zip(items, range(scores.shape[0])):
+            row_scores = scores.data[scores.indptr[i]:scores.indptr[i + 1]]
+            row_ids = scores.indices[scores.indptr[i]:scores.indptr[i + 1]]
+            if top < len(row_scores):
+                best = np.argpartition(-row_scores, top - 1)[:top]
+            else:
+                best = np.arange(len(row_scores))
+            best = best[np.lexsort((row_ids[best], -row_scores[best]))]
+            results.append([
+                dict(self.record(self.rows[row_ids[j]]), row=int(self.rows[row_ids[j]]),
+                     score=round(float(row_scores[j]), 4))
+                for j in best
+            ])
+        return results
+
+    # Handler endpoint
+
+    async def preprocess(self, body, query):
+        texts = _text_list(body, 'texts', 'text')
+        return {'results': await self.batchers['preprocess'].submit(texts)}
+
+    async def predict(self, body, query):
+        if self.bundle is None:
+            raise RequestError(503, "Model SDGs belum dilatih (jalankan --label terlebih dahulu)")
+        titles = _text_list(body, 'titles', 'title')
+        top_k = _int(body.get('top_k', DEFAULT_TOP_K), 'top_k')
+        predictions = await self.batchers['predict'].submit([(title, top_k) for title in titles])
+        return {'model': self.version, 'predictions': predictions}
+
+    async def similar(self, body, query):
+        if self.X is None:
+            raise RequestError(503, "File hasil NLP tidak dimuat (jalankan serve dengan file hasil NLP)")
+        text = query.get('text') or body.get('text')
+        if not text or not str(text).strip():
+            raise RequestError(400, "Parameter 'text' kosong")
+        top = min(_int(query.get('top', body.get('top', 10)), 'top'), MAX_TOP)
+        results, = await self.batchers['similar'].submit([(str(text), top)])
+        return {'results': results}
+
+    async def article(self, body, query):
+        if self.df is None:
+            raise RequestError(503, "File hasil NLP tidak dimuat (jalankan serve dengan file hasil NLP)")
+        if 'row' in query:
+            row = _int(query['row'], 'row', minimum=0)
+            if row >= len(self.df):
+                raise RequestError(404, f"Baris {row} tidak ada (jumlah artikel: {len(self.df)})")
+        elif 'link' in query:
+            positions = self.links.get_indexer_for([query['link'].lower().strip()])
+            if positions[0] < 0:
+                raise RequestError(404, f"Artikel dengan link {query['link']} tidak ditemukan")
+            row = int(positions[0])
+        else:
+            raise RequestError(400, "Gunakan parameter 'row' atau 'link'")
+        return dict(self.record(row), row=row)
+
+    async def stats(self, body, query):
+        if self.cube is None:
+            raise RequestError(503, "Cube analitik belum dibuat (gunakan --only-cube atau jalankan pipeline NLP)")
+        table = self.cube
+        if 'dimension' in query:
+            table = table[table['dimension'] == query['dimension']]
+        if 'key' in query:
+            table = table[table['key'] == query['key']]
+        return {'results': table.to_dict('records')}
+
+    async def health(self, body, query):
+        return self.status()
+
+
+def _text_list(body, plural, singular):
+    texts = body.get(plural, [body[singular]] if singular in body else None)
+    if not isinstance(texts, list) or not texts:
+        raise RequestError(400, f"Field '{plural}' harus berupa list teks yang tidak kosong")
+    return [str(text) for text in texts]
+
+
+def _int(value, name, minimum=1):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise RequestError(400, f"Parameter '{name}' harus bilangan bulat")
+    if value < minimum:
+        raise RequestError(400, f"Parameter '{name}' minimal {minimum}")
+    return value
+
+
+class QueryServer:
+    """Server HTTP/1.1 minimal (keep-alive, body JSON) di atas asyncio.start_server."""
+
+    def __init__(self, service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.routes = {
+            '/health': ('GET', service.health),
+            '/preprocess': ('POST', service.preprocess),
+            '/predict': ('POST', service.predict),
+            '/similar': ('GET', service.similar),
+            '/article': ('GET', service.article),
+            '/stats': ('GET', service.stats),
+        }
+        self.server = None
+
+    async def start(self):
+        for batcher in self.service.batchers.values():
+            batcher.start()
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for batcher in self.service.batchers.values():
+            await batcher.stop()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                method, target, version = (lines[0].split(' ') + ['', '', ''])[:3]
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        key, value = line.split(':', 1)
+                        headers[key.strip().lower()] = value.strip()
+                length = int(headers.get('content-length') or 0)
+                if length > MAX_BODY_BYTES:
+                    status, payload = 413, {'error': f"Body maksimal {MAX_BODY_BYTES} byte"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self._dispatch(method, target, body)
+                    keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                data = json.dumps(payload, default=_json_default, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, raw_body):
+        start = time.perf_counter()
+        url = urlsplit(target)
+        route = self.routes.get(url.path)
+        try:
+            if route is None:
+                raise RequestError(404, f"Endpoint {url.path} tidak dikenal")
+            expected, handler = route
+            if method != expected:
+                raise RequestError(405, f"Endpoint {url.path} hanya menerima {expected}")
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                raise RequestError(400, "Body bukan JSON yang valid")
+            if not isinstance(body, dict):
+                raise RequestError(400, "Body JSON harus berupa object")
+            status, payload = 200, await handler(body, query)
+        except RequestError as e:
+            status, payload = e.status, {'error': str(e)}
+        except Exception as e:
+            status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+        metrics.observe('serve_request_seconds', time.perf_counter() - start, path=url.path, status=status)
+        metrics.incr(f'serve_status_{status}')
+        return status, payload
+
+
+async def serve(nlp_file=None, host=DEFAULT_HOST, port=DEFAULT_PORT, model_file=MODEL_FILE, cube_file=CUBE_FILE,
+                max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+    """
+    Memuat data lalu melayani kueri sampai dihentikan (Ctrl+C)
+
+    Args:
+        nlp_file: File CSV hasil NLP (opsional, untuk /similar dan /article)
+        host: Alamat bind (default hanya localhost)
+        port: Port HTTP (0 untuk port acak)
+        model_file: Bundle model SDGs
+        cube_file: File cube analitik
+        max_batch: Jumlah teks maksimum per batch
+        max_wait: Waktu tunggu pengumpulan batch dalam detik
+    """
+    start = time.perf_counter()
+    service = QueryService(nlp_file, model_file, cube_file, max_batch, max_wait)
+    server = await QueryServer(service, host, port).start()
+    status = service.status()
+    print(f"Data dimuat dalam {time.perf_counter() - start:.2f} detik "
+          f"(model: {status['model'] or '-'}, artikel: {status['articles'] or '-'}, cube: {'ya' if status['cube'] else 'tidak'})")
+    print(f"Layanan kueri berjalan di http://{host}:{server.port} (Ctrl+C untuk berhenti)")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.stop()
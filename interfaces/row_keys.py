@@ -0,0 +1,26 @@
+"""
+Hash baris artikel yang stabil antar run, untuk mendeteksi baris baru atau berubah.
+
+Modul ini sengaja hanya bergantung pada numpy, sehingga pembaca ringan seperti
+``main.py report`` (cube analitik) tidak ikut memuat scikit-learn.
+
+Contoh:
+    from interfaces.row_keys import row_hashes
+    hashes = row_hashes(pd.read_csv('data/sinta_articles_2503_to_3336_processed_nlp.csv'))
+"""
+
+import hashlib
+
+import numpy as np
+
+
+def row_hashes(df):
+    """Hash 64-bit stabil per baris (Link, atau Title jika Link kosong) untuk mendeteksi baris baru."""
+    keys = df['Title'].fillna('').astype(str)
+    if 'Link' in df.columns:
+        links = df['Link'].fillna('').astype(str)
+        keys = links.where(links != '', keys)
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little') for key in keys),
+        dtype=np.uint64, count=len(keys),
+    )
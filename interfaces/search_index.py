@@ -0,0 +1,392 @@
+"""
+Inverted index di disk dengan ranking BM25 untuk judul dan penulis artikel.
+
+Index dibangun dari kolom ``Title`` dan ``Authors`` hasil ``preprocess_dataframe``
+(sudah di-case fold, tanpa stopword dan di-stem), sehingga kueri cukup diproses
+dengan ``nlp_preprocess`` yang sama.
+
+Struktur direktori index:
+
+- ``meta.json``         : jumlah dokumen, total panjang dokumen, daftar segmen
+- ``seg_NNNNNN.docs``   : posting list doc id (delta + varint) semua term di segmen
+- ``seg_NNNNNN.freqs``  : frekuensi term (varint), sejajar dengan ``.docs``
+- ``seg_NNNNNN.lex.npy``: per term: df, offset/panjang byte di ``.docs`` dan ``.freqs``
+- ``seg_NNNNNN.terms.json``: daftar term segmen (urutan sama dengan ``.lex.npy``)
+- ``docs.jsonl`` + ``doc_offsets.u64``: isi baris artikel hasil NLP, ditambah kolom
+  asli dari input NLP (``display``) untuk ditampilkan
+- ``doc_lengths.u32``, ``doc_keys.u64``: panjang dokumen (BM25) dan hash baris
+
+Penambahan baris baru (yang hash Link/Title-nya belum ada) membuat segmen baru;
+file posting lama tidak diubah. Jika jumlah segmen melebihi ``MAX_SEGMENTS``,
+semua segmen digabung ulang dari ``docs.jsonl``. ``meta.json`` ditulis paling
+akhir secara atomik, jadi data yang ditambahkan oleh proses yang terhenti di
+tengah jalan diabaikan saat index dibuka.
+
+Contoh:
+    from interfaces.search_index import build_index, search
+    build_index('data/sinta_articles_2503_to_3336_processed_nlp.csv')
+    results = search('padi lampung', top_k=10)
+"""
+
+import glob
+import json
+import math
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from interfaces.csv_preprocessor import DISPLAY_COLUMNS, display_articles
+from interfaces.metrics import metrics
+from interfaces.row_keys import row_hashes
+
+INDEX_DIR = os.path.join('data', 'index')
+TEXT_COLUMNS = ('Title', 'Authors')
+MAX_SEGMENTS = 8
+
+# Parameter BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def encode_varints(values):
+    """
+    Encode array bilangan bulat non-negatif ke varint (7 bit per byte, little-endian)
+
+    Returns:
+        Tuple (array uint8 hasil encode, jumlah byte per nilai)
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    for shift in (7, 14, 21, 28, 35, 42, 49, 56, 63):
+        nbytes += values >= np.uint64(1 << shift)
+    starts = np.cumsum(nbytes) - nbytes
+    out = np.empty(int(nbytes.sum()), dtype=np.uint8)
+    for k in range(int(nbytes.max(initial=0))):
+        mask = nbytes > k
+        chunk = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (nbytes[mask] > k + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[mask] + k] = chunk | more
+    return out, nbytes
+
+
+def decode_varints(buffer):
+    """Decode byte varint (hasil encode_varints) menjadi array uint64."""
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    values = (data[starts] & 0x7F).astype(np.uint64)
+    for k in range(1, int(lengths.max(initial=0))):
+        mask = lengths > k
+        values[mask] |= (data[starts[mask] + k] & 0x7F).astype(np.uint64) << np.uint64(7 * k)
+    return values
+
+
+def document_texts(df):
+    """Teks yang diindeks per baris: gabungan Title dan Authors hasil NLP."""
+    parts = [df[column].fillna('').astype(str) for column in TEXT_COLUMNS if column in df.columns]
+    text = parts[0]
+    for part in parts[1:]:
+        text = text + ' ' + part
+    return text.tolist()
+
+
+class SearchIndex:
+    """Inverted index BM25 tersegmentasi yang disimpan di direktori."""
+
+    def __init__(self, index_dir=INDEX_DIR):
+        self.index_dir = index_dir
+        os.makedirs(index_dir, exist_ok=True)
+        self._load()
+
+    def _path(self, name):
+        return os.path.join(self.index_dir, name)
+
+    def _load(self):
+        meta_file = self._path('meta.json')
+        if os.path.exists(meta_file):
+            with open(meta_file, encoding='utf-8') as file:
+                self.meta = json.load(file)
+        else:
+            self.meta = {'format': 1, 'num_docs': 0, 'total_length': 0, 'next_segment': 1, 'segments': []}
+        num_docs = self.meta['num_docs']
+        # Abaikan data yang ditulis setelah meta.json terakhir (proses terhenti)
+        self.doc_lengths = self._read_array('doc_lengths.u32', np.uint32, num_docs)
+        self.doc_offsets = self._read_array('doc_offsets.u64', np.uint64, num_docs)
+        self.doc_keys = self._read_array('doc_keys.u64', np.uint64, num_docs)
+        self.segments = [self._open_segment(segment) for segment in self.meta['segments']]
+
+    def _read_array(self, name, dtype, count):
+        path = self._path(name)
+        if not os.path.exists(path) or count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.fromfile(path, dtype=dtype, count=count)
+
+    def _truncate(self, name, size):
+        """Memotong file append-only ke ukuran yang tercatat di meta.json."""
+        path = self._path(name)
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, 'r+b') as file:
+                file.truncate(size)
+
+    def _open_segment(self, segment):
+        name = segment['name']
+        with open(self._path(f'{name}.terms.json'), encoding='utf-8') as file:
+            terms = json.load(file)
+        return {
+            **segment,
+            'lexicon': {term: row for row, term in enumerate(terms)},
+            'entries': np.load(self._path(f'{name}.lex.npy')),
+            'docs': np.memmap(self._path(f'{name}.docs'), dtype=np.uint8, mode='r')
+            if os.path.getsize(self._path(f'{name}.docs')) else np.zeros(0, dtype=np.uint8),
+            'freqs': np.memmap(self._path(f'{name}.freqs'), dtype=np.uint8, mode='r')
+            if os.path.getsize(self._path(f'{name}.freqs')) else np.zeros(0, dtype=np.uint8),
+        }
+
+    @property
+    def num_docs(self):
+        return self.meta['num_docs']
+
+    def _write_segment(self, texts, base):
+        """Membangun satu segmen dari teks dokumen dengan doc id mulai dari base."""
+        # Impor lokal: perintah search hanya membaca index dan tidak butuh scikit-learn
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        name = f"seg_{self.meta['next_segment']:06d}"
+        self.meta['next_segment'] += 1
+
+        vectorizer = CountVectorizer(analyzer=str.split)
+        X = vectorizer.fit_transform(texts).tocsc()
+        X.sort_indices()
+        terms = vectorizer.get_feature_names_out().tolist()
+
+        # Delta doc id per term: entri pertama setiap term menyimpan doc id absolut
+        doc_ids = X.indices.astype(np.uint64) + np.uint64(base)
+        deltas = doc_ids.copy()
+        deltas[1:] -= doc_ids[:-1]
+        heads = X.indptr[:-1]
+        deltas[heads] = doc_ids[heads]
+        doc_bytes, doc_nbytes = encode_varints(deltas)
+        freq_bytes, freq_nbytes = encode_varints(X.data)
+
+        doc_lengths = np.add.reduceat(doc_nbytes, heads)
+        freq_lengths = np.add.reduceat(freq_nbytes, heads)
+        entries = np.column_stack([
+            np.diff(X.indptr),
+            np.cumsum(doc_lengths) - doc_lengths, doc_lengths,
+            np.cumsum(freq_lengths) - freq_lengths, freq_lengths,
+        ]).astype(np.int64)
+
+        doc_bytes.tofile(self._path(f'{name}.docs'))
+        freq_bytes.tofile(self._path(f'{name}.freqs'))
+        np.save(self._path(f'{name}.lex.npy'), entries)
+        with open(self._path(f'{name}.terms.json'), 'w', encoding='utf-8') as file:
+            json.dump(terms, file, ensure_ascii=False)
+        return {'name': name, 'base': base, 'num_docs': len(texts), 'num_terms': len(terms)}
+
+    def _append_documents(self, df, texts, keys, display=None):
+        """Menambahkan isi dokumen, panjang dan hash ke file append-only."""
+        docs_file = self._path('docs.jsonl')
+        start = int(self.doc_offsets[-1]) if len(self.doc_offsets) else 0
+        if len(self.doc_offsets):
+            with open(docs_file, 'rb') as file:
+                file.seek(start)
+                start += len(file.readline())
+        # Buang sisa tulisan yang tidak tercatat di meta.json
+        self._truncate('docs.jsonl', start)
+        for name, array in (('doc_lengths.u32', self.doc_lengths), ('doc_offsets.u64', self.doc_offsets),
+                            ('doc_keys.u64', self.doc_keys)):
+            self._truncate(name, array.nbytes)
+
+        records = df.astype(object).where(df.notna(), None).to_dict('records')
+        if display is not None:
+            display = display[DISPLAY_COLUMNS]
+            for record, shown in zip(records, display.astype(object).where(display.notna(), None).to_dict('records')):
+                record['display'] = shown
+        lines = [json.dumps(record, ensure_ascii=False, default=str).encode('utf-8') + b'\n' for record in records]
+        offsets = start + np.cumsum([0] + [len(line) for line in lines[:-1]], dtype=np.uint64)
+        lengths = np.fromiter((len(text.split()) for text in texts), dtype=np.uint32, count=len(texts))
+        with open(docs_file, 'ab') as file:
+            file.writelines(lines)
+        for name, array in (('doc_lengths.u32', lengths), ('doc_offsets.u64', offsets), ('doc_keys.u64', keys)):
+            with open(self._path(name), 'ab') as file:
+                array.tofile(file)
+        return lengths, offsets
+
+    def _save_meta(self):
+        self.meta['segments'] = [
+            {key: segment[key] for key in ('name', 'base', 'num_docs', 'num_terms')} for segment in self.segments
+        ]
+        tmp_file = self._path('meta.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(self.meta, file, indent=2)
+        os.replace(tmp_file, self._path('meta.json'))
+
+    def add(self, df, display=None):
+        """
+        Menambahkan baris yang belum diindeks sebagai segmen baru
+
+        Args:
+            df: DataFrame hasil NLP (kolom Title, Authors, Link, ...)
+            display: DataFrame input NLP yang sejajar baris per baris dengan df (opsional,
+                kolom DISPLAY_COLUMNS-nya disimpan untuk ditampilkan)
+
+        Returns:
+            Jumlah dokumen yang ditambahkan
+        """
+        keys = row_hashes(df)
+        first = np.zeros(len(keys), dtype=bool)
+        first[np.unique(keys, return_index=True)[1]] = True
+        new_rows = first & ~np.isin(keys, self.doc_keys)
+        if not new_rows.any():
+            return 0
+
+        df, keys = df[new_rows], keys[new_rows]
+        if display is not None:
+            display = display[new_rows]
+        # Baris tanpa token (Title dan Authors kosong) tidak diindeks; segmen butuh vocabulary
+        has_tokens = np.array([bool(text.split()) for text in document_texts(df)], dtype=bool)
+        if not has_tokens.any():
+            return 0
+        df, keys = df[has_tokens], keys[has_tokens]
+        if display is not None:
+            display = display[has_tokens]
+        texts = document_texts(df)
+        base = self.num_docs
+        lengths, offsets = self._append_documents(df, texts, keys, display)
+        segment = self._write_segment(texts, base)
+
+        self.meta['num_docs'] += len(texts)
+        self.meta['total_length'] += int(lengths.sum())
+        self.doc_lengths = np.concatenate([self.doc_lengths, lengths])
+        self.doc_offsets = np.concatenate([self.doc_offsets, offsets])
+        self.doc_keys = np.concatenate([self.doc_keys, keys])
+        self.segments.append(self._open_segment(segment))
+        self._save_meta()
+
+        if len(self.segments) > MAX_SEGMENTS:
+            self.optimize()
+        return len(texts)
+
+    def documents(self, doc_ids):
+        """Membaca isi dokumen (dict kolom) untuk daftar doc id."""
+        records = []
+        with open(self._path('docs.jsonl'), 'rb') as file:
+            for doc_id in doc_ids:
+                file.seek(int(self.doc_offsets[doc_id]))
+                records.append(json.loads(file.readline()))
+        return records
+
+    def optimize(self):
+        """Menggabungkan semua segmen menjadi satu (dibangun ulang dari docs.jsonl)."""
+        if len(self.segments) <= 1:
+            return
+        old_segments = self.segments
+        df = pd.read_json(self._path('docs.jsonl'), lines=True, nrows=self.num_docs, dtype=False)
+        segment = self._write_segment(document_texts(df), 0)
+        self.segments = [self._open_segment(segment)]
+        self._save_meta()
+        for old in old_segments:
+            for path in glob.glob(self._path(f"{old['name']}.*")):
+                os.remove(path)
+
+    def postings(self, term):
+        """Gabungan posting list (doc id, frekuensi) sebuah term dari semua segmen."""
+        doc_ids, freqs = [], []
+        for segment in self.segments:
+            row = segment['lexicon'].get(term)
+            if row is None:
+                continue
+            _, doc_offset, doc_length, freq_offset, freq_length = segment['entries'][row]
+            doc_ids.append(np.cumsum(decode_varints(segment['docs'][doc_offset:doc_offset + doc_length])))
+            freqs.append(decode_varints(segment['freqs'][freq_offset:freq_offset + freq_length]))
+        if not doc_ids:
+            return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint64)
+        return np.concatenate(doc_ids), np.concatenate(freqs)
+
+    def search(self, tokens, top_k=10):
+        """
+        Ranking BM25 untuk token kueri
+
+        Args:
+            tokens: List token kueri (sudah diproses nlp_preprocess)
+            top_k: Jumlah hasil teratas
+
+        Returns:
+            List tuple (doc id, skor) terurut menurun
+        """
+        num_docs = self.num_docs
+        if not num_docs:
+            return []
+        avg_length = self.meta['total_length'] / num_docs
+        all_ids, all_scores = [], []
+        for term in set(tokens):
+            doc_ids, freqs = self.postings(term)
+            if not len(doc_ids):
+                continue
+            idf = math.log(1 + (num_docs - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            freqs = freqs.astype(np.float64)
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc_ids] / avg_length)
+            all_ids.append(doc_ids)
+            all_scores.append(idf * freqs * (BM25_K1 + 1) / (freqs + norm))
+        if not all_ids:
+            return []
+
+        doc_ids, inverse = np.unique(np.concatenate(all_ids), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(all_scores))
+        if len(scores) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.lexsort((doc_ids[top], -scores[top]))]
+        return [(int(doc_ids[i]), float(scores[i])) for i in top]
+
+
+def build_index(nlp_file, index_dir=INDEX_DIR):
+    """
+    Menambahkan artikel dari file hasil NLP ke index (hanya baris baru)
+
+    Args:
+        nlp_file: Path file CSV hasil preprocessing NLP
+        index_dir: Direktori index
+
+    Returns:
+        Jumlah dokumen yang ditambahkan
+    """
+    df = pd.read_csv(nlp_file)
+    with metrics.stage('index_add') as stage:
+        index = SearchIndex(index_dir)
+        added = index.add(df, display_articles(nlp_file, len(df)))
+        stage['rows'] = added
+    print(f"{added} artikel ditambahkan ke index ({index.num_docs} total, {len(index.segments)} segmen) "
+          f"dalam {stage['wall_seconds']:.2f} detik: {index_dir}")
+    return added
+
+
+def search(query, index_dir=INDEX_DIR, top_k=10, index=None):
+    """
+    Mencari artikel dengan kueri bebas
+
+    Args:
+        query: Teks kueri (diproses dengan nlp_preprocess seperti judul/penulis)
+        index_dir: Direktori index
+        top_k: Jumlah hasil teratas
+        index: SearchIndex yang sudah dibuka (opsional, untuk kueri berulang)
+
+    Returns:
+        List dict kolom artikel (Title, Link dan Authors asli jika tersimpan) dengan tambahan kunci 'score'
+    """
+    from interfaces.nlp_processor import nlp_preprocess
+
+    index = index or SearchIndex(index_dir)
+    start = time.perf_counter()
+    tokens = nlp_preprocess(query).split()
+    ranked = index.search(tokens, top_k)
+    records = index.documents([doc_id for doc_id, _ in ranked])
+    metrics.observe('search_seconds', time.perf_counter() - start)
+    return [dict(record, **(record.pop('display', None) or {}), score=round(score, 4))
+            for record, (_, score) in zip(records, ranked)]
@@ -0,0 +1,263 @@
+"""
+Tabel lease shard halaman untuk scraping terdistribusi lewat direktori bersama.
+
+Rentang halaman dibagi menjadi shard berukuran tetap (``plan.json``). Worker
+di host mana pun yang me-mount direktori yang sama mengambil shard lewat
+file lease, memperbarui heartbeat setelah setiap halaman, lalu menandai
+shard selesai beserta file CSV hasilnya. Lease yang heartbeat-nya lebih tua
+dari ``lease_timeout`` dianggap mati dan shard-nya di-lease ulang ke worker
+lain. Isi direktori:
+
+- ``plan.json``: rentang halaman dan daftar shard
+- ``shard_NNNNN.lease``: pemilik shard yang sedang dikerjakan (worker, host,
+  pid, waktu heartbeat, halaman terakhir)
+- ``shard_NNNNN.done``: catatan shard selesai (worker, file output, jumlah
+  artikel)
+- ``shard_NNNNN.csv``: hasil scraping shard
+- ``leases.lock``: lock file singkat; setiap perubahan lease dilakukan di
+  bawah lock ini (``O_CREAT | O_EXCL``), lock yang lebih tua dari
+  ``LOCK_TIMEOUT`` dianggap tertinggal dan dihapus
+
+Semua file ditulis atomik (file sementara lalu ``os.replace``). Waktu
+heartbeat memakai jam masing-masing host, jadi ``lease_timeout`` harus jauh
+lebih besar dari selisih jam antar host.
+
+Contoh:
+    from interfaces.shard_leases import ShardLeases
+    leases = ShardLeases('data/shards')
+    leases.plan(2503, 3336, shard_pages=25)
+    shard = leases.acquire('host-a-1234')
+    leases.heartbeat(shard, 'host-a-1234', page=2510)
+    leases.complete(shard, 'host-a-1234', 'data/shards/shard_00000.csv', articles=250)
+"""
+
+import json
+import os
+import socket
+import time
+from contextlib import contextmanager
+
+SHARD_DIR = os.path.join('data', 'shards')
+DEFAULT_SHARD_PAGES = 25
+DEFAULT_LEASE_TIMEOUT = 300.0
+LOCK_TIMEOUT = 30.0
+LOCK_POLL = 0.05
+
+
+def default_worker_id():
+    """ID worker unik per proses: nama host dan pid."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def write_json(path, data):
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2)
+    os.replace(tmp_file, path)
+
+
+def read_json(path):
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class ShardLeases:
+    """Lease shard rentang halaman di direktori bersama, dengan heartbeat dan re-lease shard mati."""
+
+    def __init__(self, shard_dir=SHARD_DIR, lease_timeout=DEFAULT_LEASE_TIMEOUT):
+        self.shard_dir = shard_dir
+        self.lease_timeout = lease_timeout
+        self.plan_file = os.path.join(shard_dir, 'plan.json')
+        self.lock_file = os.path.join(shard_dir, 'leases.lock')
+
+    def plan(self, start_page, end_page, shard_pages=DEFAULT_SHARD_PAGES):
+        """
+        Membagi rentang halaman menjadi shard (idempoten untuk rentang yang sama)
+
+        Raises:
+            ValueError: Jika direktori sudah berisi rencana dengan rentang/ukuran berbeda
+
+        Returns:
+            Dict rencana (start_page, end_page, shard_pages, shards)
+        """
+        if end_page < start_page or shard_pages < 1:
+            raise ValueError(f"Rentang shard tidak valid: {start_page}-{end_page} per {shard_pages} halaman")
+        os.makedirs(self.shard_dir, exist_ok=True)
+        plan = {
+            'start_page': start_page,
+            'end_page': end_page,
+            'shard_pages': shard_pages,
+            'shards': [
+                {'id': shard_id, 'start': start, 'end': min(start + shard_pages - 1, end_page)}
+                for shard_id, start in enumerate(range(start_page, end_page + 1, shard_pages))
+            ],
+        }
+        with self._lock():
+            existing = read_json(self.plan_file)
+            if existing is not None:
+                if existing != plan:
+                    raise ValueError(f"{self.shard_dir} sudah berisi rencana {existing['start_page']}-"
+                                     f"{existing['end_page']} per {existing['shard_pages']} halaman")
+                return existing
+            write_json(self.plan_file, plan)
+        return plan
+
+    def load_plan(self):
+        plan = read_json(self.plan_file)
+        if plan is None:
+            raise FileNotFoundError(f"Rencana shard {self.plan_file} belum dibuat")
+        return plan
+
+    def _path(self, shard, suffix):
+        return os.path.join(self.shard_dir, f"shard_{shard['id']:05d}.{suffix}")
+
+    def output_file(self, shard):
+        """File CSV hasil sebuah shard."""
+        return self._path(shard, 'csv')
+
+    def _is_expired(self, lease, now):
+        return lease is None or now - lease['heartbeat'] > self.lease_timeout
+
+    @contextmanager
+    def _lock(self):
+        deadline = None
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_file) > LOCK_TIMEOUT:
+                        # Lock tertinggal dari proses yang mati di tengah operasi. Diambil alih dengan
+                        # rename atomik: jika proses lain lebih dulu mengambilnya, rename gagal dan
+                        # proses ini kembali mengantre
+                        stale_file = f'{self.lock_file}.{os.getpid()}.stale'
+                        os.rename(self.lock_file, stale_file)
+                        os.remove(stale_file)
+                        continue
+                except FileNotFoundError:
+                    continue
+                deadline = deadline or time.monotonic() + LOCK_TIMEOUT * 2
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Tidak bisa mengambil lock {self.lock_file}")
+                time.sleep(LOCK_POLL)
+        try:
+            os.write(fd, default_worker_id().encode('utf-8'))
+            os.close(fd)
+            yield
+        finally:
+            try:
+                os.remove(self.lock_file)
+            except FileNotFoundError:
+                pass
+
+    def acquire(self, worker_id):
+        """
+        Mengambil shard berikutnya: shard yang belum pernah di-lease, lalu shard dengan lease mati
+
+        Returns:
+            Dict shard (id, start, end, attempt) atau None jika semua shard selesai/sedang dikerjakan
+        """
+        plan = self.load_plan()
+        with self._lock():
+            now = time.time()
+            for shard in plan['shards']:
+                if os.path.exists(self._path(shard, 'done')):
+                    continue
+                lease = read_json(self._path(shard, 'lease'))
+                if not self._is_expired(lease, now):
+                    continue
+                attempt = lease['attempt'] + 1 if lease else 1
+                if lease:
+                    print(f"Lease shard {shard['id']} milik {lease['worker']} mati "
+                          f"(heartbeat {now - lease['heartbeat']:.0f} detik lalu), di-lease ulang")
+                write_json(self._path(shard, 'lease'), {
+                    'worker': worker_id,
+                    'host': socket.gethostname(),
+                    'pid': os.getpid(),
+                    'acquired': now,
+                    'heartbeat': now,
+                    'attempt': attempt,
+                    'page': None,
+                })
+                return dict(shard, attempt=attempt)
+        return None
+
+    def heartbeat(self, shard, worker_id, page=None):
+        """
+        Memperbarui heartbeat lease (dan halaman terakhir yang selesai)
+
+        Returns:
+            False jika lease sudah bukan milik worker ini (shard harus ditinggalkan)
+        """
+        with self._lock():
+            lease = read_json(self._path(shard, 'lease'))
+            if lease is None or lease['worker'] != worker_id or os.path.exists(self._path(shard, 'done')):
+                return False
+            lease['heartbeat'] = time.time()
+            if page is not None:
+                lease['page'] = page
+            write_json(self._path(shard, 'lease'), lease)
+        return True
+
+    def complete(self, shard, worker_id, output_file, articles=0):
+        """
+        Menandai shard selesai; file hasil sementara dipindahkan ke output_file(shard)
+
+        Args:
+            output_file: File CSV hasil yang ditulis worker (dipindahkan atomik)
+
+        Returns:
+            False jika lease sudah hilang (hasil dibuang, worker lain akan mengulang shard)
+        """
+        with self._lock():
+            lease = read_json(self._path(shard, 'lease'))
+            if lease is None or lease['worker'] != worker_id or os.path.exists(self._path(shard, 'done')):
+                return False
+            os.replace(output_file, self.output_file(shard))
+            write_json(self._path(shard, 'done'), {
+                'worker': worker_id,
+                'start': shard['start'],
+                'end': shard['end'],
+                'output': os.path.basename(self.output_file(shard)),
+                'articles': articles,
+                'attempt': lease['attempt'],
+                'completed': time.time(),
+            })
+            os.remove(self._path(shard, 'lease'))
+        return True
+
+    def release(self, shard, worker_id):
+        """Melepas lease lebih awal (misalnya worker berhenti) agar shard langsung bisa diambil lagi."""
+        with self._lock():
+            lease = read_json(self._path(shard, 'lease'))
+            if lease is not None and lease['worker'] == worker_id:
+                lease['heartbeat'] = 0
+                write_json(self._path(shard, 'lease'), lease)
+
+    def status(self):
+        """
+        Status setiap shard
+
+        Returns:
+            List dict shard dengan state 'done', 'leased', 'expired' atau 'pending'
+        """
+        plan = self.load_plan()
+        now = time.time()
+        shards = []
+        for shard in plan['shards']:
+            done = read_json(self._path(shard, 'done'))
+            lease = read_json(self._path(shard, 'lease'))
+            if done is not None:
+                shards.append(dict(shard, state='done', worker=done['worker'], articles=done['articles']))
+            elif lease is not None:
+                state = 'expired' if self._is_expired(lease, now) else 'leased'
+                shards.append(dict(shard, state=state, worker=lease['worker'], page=lease['page'],
+                                   heartbeat_age=round(now - lease['heartbeat'], 1)))
+            else:
+                shards.append(dict(shard, state='pending'))
+        return shards
+
@@ -0,0 +1,140 @@
+"""
+Transport teks tanpa pickle per string ke worker proses lewat shared memory.
+
+Kolom teks dikemas sekali menjadi satu buffer UTF-8 kontigu di
+``multiprocessing.shared_memory``: item dalam satu chunk dipisah karakter NUL,
+dan batas byte setiap chunk dicatat di proses utama. Worker hanya menerima nama
+segmen dan rentang byte chunk-nya (tuple kecil), membaca teks langsung dari
+buffer bersama, lalu menulis hasil ke arena output bersama. Yang di-pickle
+antar proses hanya deskripsi tugas dan panjang hasil, bukan string-nya.
+
+Kapasitas arena output tiap chunk sama dengan ukuran input chunk ditambah
+``SLOT_SLACK`` byte per item. Hasil NLP (lowercase, tanpa tanda baca/stopword,
+di-stem) hampir selalu lebih pendek dari input; chunk yang tidak muat (atau
+hasilnya mengandung NUL) dikembalikan lewat jalur pickle biasa (overflow).
+"""
+
+from multiprocessing import shared_memory
+
+SEPARATOR = '\x00'
+SLOT_SLACK = 8
+
+
+def _attach(name):
+    """Membuka segmen shared memory yang sudah dibuat oleh proses utama."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: worker berbagi resource tracker dengan proses utama,
+        # sehingga pendaftaran ulang nama yang sama tidak berpengaruh dan
+        # segmen tetap di-unlink sekali oleh pemiliknya
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedTextBatch:
+    """Teks input dan arena output di shared memory (milik proses utama)."""
+
+    def __init__(self, texts, bounds):
+        """
+        Args:
+            texts: List string yang akan diproses
+            bounds: List tuple (start, end) pembagian chunk
+        """
+        # NUL dipakai sebagai pemisah item, jadi dibuang dari teks input
+        encoded_chunks = []
+        for start, end in bounds:
+            chunk = texts[start:end]
+            joined = SEPARATOR.join(chunk)
+            if joined.count(SEPARATOR) != len(chunk) - 1:
+                joined = SEPARATOR.join(text.replace(SEPARATOR, ' ') for text in chunk)
+            encoded_chunks.append((start, len(chunk), joined.encode('utf-8')))
+
+        self.tasks = []
+        self._segments = []
+        try:
+            total_in = sum(len(data) for _, _, data in encoded_chunks)
+            self.data = self._new_segment(total_in)
+            self.output = self._new_segment(total_in + SLOT_SLACK * len(texts))
+            in_pos = out_pos = 0
+            for start, count, data in encoded_chunks:
+                self.data.buf[in_pos:in_pos + len(data)] = data
+                capacity = len(data) + SLOT_SLACK * count
+                self.tasks.append((self.data.name, self.output.name, start, count,
+                                   in_pos, in_pos + len(data), out_pos, capacity))
+                in_pos += len(data)
+                out_pos += capacity
+        except Exception:
+            self.close()
+            raise
+
+    def _new_segment(self, size):
+        segment = shared_memory.SharedMemory(create=True, size=max(1, size))
+        self._segments.append(segment)
+        return segment
+
+    def results(self, outcomes):
+        """
+        Membaca semua hasil dari arena output
+
+        Args:
+            outcomes: List hasil run_task per tugas (panjang byte atau list overflow)
+
+        Returns:
+            List string hasil sesuai urutan input
+        """
+        buffer = self.output.buf
+        results = []
+        for task, outcome in zip(self.tasks, outcomes):
+            if isinstance(outcome, list):
+                results.extend(outcome)
+                continue
+            out_pos = task[6]
+            results.extend(str(buffer[out_pos:out_pos + outcome], 'utf-8').split(SEPARATOR))
+        del buffer
+        return results
+
+    def close(self):
+        """Melepas dan menghapus semua segmen shared memory."""
+        for segment in self._segments:
+            try:
+                segment.close()
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_task(task, func):
+    """
+    Dijalankan di worker: terapkan func ke setiap teks chunk dan tulis hasil ke arena
+
+    Args:
+        task: Tuple dari SharedTextBatch.tasks
+        func: Fungsi str -> str
+
+    Returns:
+        Panjang byte hasil yang ditulis ke arena, atau list hasil jika chunk tidak muat
+    """
+    data_name, output_name, _, count, in_start, in_end, out_pos, capacity = task
+    # Segmen ditutup setelah setiap tugas agar worker tidak menahan mapping batch yang sudah selesai
+    data = _attach(data_name)
+    try:
+        texts = str(data.buf[in_start:in_end], 'utf-8').split(SEPARATOR)
+    finally:
+        data.close()
+    results = [func(text) for text in texts]
+    payload = SEPARATOR.join(results).encode('utf-8')
+    if len(payload) > capacity or payload.count(b'\x00') != count - 1:
+        return results
+    output = _attach(output_name)
+    try:
+        output.buf[out_pos:out_pos + len(payload)] = payload
+    finally:
+        output.close()
+    return len(payload)
@@ -0,0 +1,365 @@
+"""
+Index "artikel serupa" berbasis vektor TF-IDF yang direduksi dengan TruncatedSVD.
+
+Matriks TF-IDF hasil NLP direduksi menjadi vektor dense berdimensi kecil
+(dinormalisasi L2 sehingga dot product = cosine similarity), lalu disusun
+menjadi index IVF (inverted file) murni NumPy: centroid k-means membagi
+vektor ke dalam ``n_lists`` daftar, dan kueri hanya membandingkan vektor di
+``n_probe`` daftar terdekat. Dengan ukuran daftar sekitar akar n, pencarian
+top-k dan job semua-pasangan-di-atas-ambang menjadi sub-kuadratik.
+
+Mode ``exact`` (brute force atas semua vektor) tetap tersedia untuk
+mengukur recall IVF (``--similar-recall``).
+
+Contoh:
+    from interfaces.similarity import build_similarity_index, SimilarityIndex
+    build_similarity_index('data/sinta_articles_2503_to_3336_processed_nlp.csv')
+    index = SimilarityIndex()
+    index.similar_to_row(10, top_k=5)
+"""
+
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from interfaces.metrics import metrics
+
+SIMILARITY_DIR = os.path.join('data', 'similarity')
+N_COMPONENTS = 64
+DEFAULT_N_PROBE = 16
+DEFAULT_THRESHOLD = 0.9
+
+# Sampel untuk fitting SVD dan centroid IVF
+SVD_SAMPLE_SIZE = 50000
+IVF_SAMPLE_SIZE = 100000
+
+# Ukuran blok perkalian matriks (membatasi memori sementara)
+BLOCK_ROWS = 1024
+BLOCK_COLUMNS = 32768
+RANDOM_STATE = 42
+
+
+def _normalize(vectors):
+    """Normalisasi L2 per baris (baris nol tetap nol)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def _sample(n, size, random_state=RANDOM_STATE):
+    if n <= size:
+        return np.arange(n)
+    return np.sort(np.random.default_rng(random_state).choice(n, size, replace=False))
+
+
+def reduce_features(X, n_components=N_COMPONENTS, random_state=RANDOM_STATE):
+    """
+    Mereduksi matriks TF-IDF sparse menjadi vektor dense ternormalisasi
+
+    SVD dilatih pada sampel baris lalu diterapkan ke seluruh matriks per blok.
+
+    Returns:
+        Tuple (model TruncatedSVD, array float32 [n, n_components])
+    """
+    # Impor lokal: scikit-learn hanya dimuat saat index dibangun, bukan saat modul diimpor
+    from sklearn.decomposition import TruncatedSVD
+
+    n_components = max(1, min(n_components, X.shape[1] - 1))
+    svd = TruncatedSVD(n_components=n_components, random_state=random_state)
+    svd.fit(X[_sample(X.shape[0], SVD_SAMPLE_SIZE, random_state)])
+    vectors = np.empty((X.shape[0], n_components), dtype=np.float32)
+    for start in range(0, X.shape[0], SVD_SAMPLE_SIZE):
+        vectors[start:start + SVD_SAMPLE_SIZE] = svd.transform(X[start:start + SVD_SAMPLE_SIZE])
+    return svd, _normalize(vectors)
+
+
+def build_ivf(vectors, n_lists=None, random_state=RANDOM_STATE):
+    """
+    Membangun index IVF: centroid dan daftar vektor per centroid
+
+    Returns:
+        Tuple (centroid [n_lists, d], offset daftar [n_lists + 1], id vektor terurut per daftar)
+    """
+    from sklearn.cluster import MiniBatchKMeans
+
+    n = len(vectors)
+    n_lists = n_lists or int(np.clip(2 * np.sqrt(n), 1, n))
+    sample = vectors[_sample(n, IVF_SAMPLE_SIZE, random_state)]
+    n_lists = min(n_lists, len(sample))
+    kmeans = MiniBatchKMeans(n_clusters=n_lists, batch_size=4096, n_init=1, random_state=random_state)
+    kmeans.fit(sample)
+    centroids = _normalize(kmeans.cluster_centers_.astype(np.float32))
+
+    # Setiap vektor masuk ke daftar centroid dengan cosine tertinggi
+    assignments = np.concatenate([
+        np.argmax(vectors[start:start + BLOCK_COLUMNS] @ centroids.T, axis=1)
+        for start in range(0, n, BLOCK_COLUMNS)
+    ]) if n else np.zeros(0, dtype=np.int64)
+    order = np.argsort(assignments, kind='stable')
+    offsets = np.zeros(n_lists + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(assignments, minlength=n_lists))
+    return centroids, offsets, order.astype(np.int64)
+
+
+def _top_k(scores, ids, top_k):
+    """Top-k (id, skor) dari array skor, terurut menurun."""
+    if len(scores) > top_k:
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        top = np.arange(len(scores))
+    top = top[np.argsort(-scores[top], kind='stable')]
+    return ids[top], scores[top]
+
+
+class SimilarityIndex:
+    """Index IVF atas vektor SVD yang tersimpan di direktori."""
+
+    def __init__(self, index_dir=SIMILARITY_DIR):
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, 'meta.json'), encoding='utf-8') as file:
+            self.meta = json.load(file)
+        self.vectors = np.load(os.path.join(index_dir, 'vectors.npy'), mmap_mode='r')
+        self.row_ids = np.load(os.path.join(index_dir, 'row_ids.npy'))
+        self.centroids = np.load(os.path.join(index_dir, 'centroids.npy'))
+        self.offsets = np.load(os.path.join(index_dir, 'list_offsets.npy'))
+        self.list_ids = np.load(os.path.join(index_dir, 'list_ids.npy'))
+        self._models = None
+        self._articles = None
+        # Posisi vektor untuk setiap nomor baris artikel
+        self._position = {int(row): position for position, row in enumerate(self.row_ids)}
+
+    def models(self):
+        """Vectorizer dan SVD (dimuat saat dibutuhkan untuk kueri teks)."""
+        if self._models is None:
+            self._models = joblib.load(os.path.join(self.index_dir, 'models.joblib'))
+        return self._models
+
+    def articles(self, rows):
+        """Judul, tahun dan link artikel pada nomor baris tertentu di file sumber index."""
+        if self._articles is None:
+            # Dimuat sekali per index; Title dan Link asli diambil dari input NLP jika tersedia
+            from interfaces.csv_preprocessor import display_articles
+
+            df = pd.read_csv(self.meta['source'], usecols=lambda column: column in ('Title', 'Year', 'Link'))
+            display = display_articles(self.meta['source'], len(df))
+            if display is not None:
+                df[['Title', 'Link']] = display[['Title', 'Link']].to_numpy()
+            self._articles = df.fillna('')
+        return self._articles.iloc[list(rows)].to_dict('records')
+
+    def _candidates(self, query_vectors, n_probe):
+        """Id vektor di n_probe daftar terdekat dari (rata-rata) vektor kueri."""
+        centroid_scores = query_vectors @ self.centroids.T
+        if centroid_scores.ndim > 1:
+            centroid_scores = centroid_scores.max(axis=0)
+        n_probe = min(n_probe, len(self.centroids))
+        lists = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        return np.concatenate([self.list_ids[self.offsets[i]:self.offsets[i + 1]] for i in lists])
+
+    def search_vector(self, vector, top_k=10, n_probe=DEFAULT_N_PROBE, exact=False, exclude=None):
+        """
+        Top-k vektor paling mirip
+
+        Args:
+            vector: Vektor kueri ternormalisasi [d]
+            top_k: Jumlah hasil
+            n_probe: Jumlah daftar IVF yang diperiksa
+            exact: Brute force atas semua vektor (untuk cek recall)
+            exclude: Posisi vektor yang dikecualikan (misalnya artikel kueri itu sendiri)
+
+        Returns:
+            Tuple (array posisi vektor, array cosine similarity)
+        """
+        if exact:
+            candidates = np.arange(len(self.vectors))
+        else:
+            candidates = self._candidates(vector, n_probe)
+        if exclude is not None:
+            candidates = candidates[candidates != exclude]
+        scores = np.asarray(self.vectors[candidates] @ vector)
+        return _top_k(scores, candidates, top_k)
+
+    def _results(self, positions, scores):
+        return [(int(self.row_ids[position]), float(score)) for position, score in zip(positions, scores)]
+
+    def similar_to_row(self, row, top_k=10, n_probe=DEFAULT_N_PROBE, exact=False):
+        """
+        Artikel paling mirip dengan artikel pada baris tertentu di file hasil NLP
+
+        Returns:
+            List tuple (nomor baris, cosine similarity)
+        """
+        position = self._position.get(int(row))
+        if position is None:
+            raise KeyError(f"Baris {row} tidak memiliki vektor (judul kosong atau di luar index)")
+        vector = np.asarray(self.vectors[position])
+        return self._results(*self.search_vector(vector, top_k, n_probe, exact, exclude=position))
+
+    def similar_to_text(self, text, top_k=10, n_probe=DEFAULT_N_PROBE, exact=False):
+        """
+        Artikel paling mirip dengan teks bebas (diproses dengan nlp_preprocess)
+
+        Returns:
+            List tuple (nomor baris, cosine similarity)
+        """
+        from interfaces.nlp_processor import nlp_preprocess
+
+        models = self.models()
+        reduced = models['svd'].transform(models['vectorizer'].transform([nlp_preprocess(text)]))
+        vector = _normalize(reduced.astype(np.float32))[0]
+        return self._results(*self.search_vector(vector, top_k, n_probe, exact))
+
+    def pairs_above(self, threshold=DEFAULT_THRESHOLD, n_probe=DEFAULT_N_PROBE, exact=False):
+        """
+        Semua pasangan artikel dengan cosine similarity >= threshold
+
+        Mode IVF membandingkan setiap daftar hanya dengan n_probe daftar terdekat
+        (sub-kuadratik); mode exact membandingkan semua pasangan per blok.
+
+        Returns:
+            DataFrame kolom row_a, row_b, similarity (row_a < row_b), terurut menurun
+        """
+        found_a, found_b, found_scores = [], [], []
+
+        def collect(positions_a, positions_b, block):
+            a, b = np.nonzero(block >= threshold)
+            a, b = positions_a[a], positions_b[b]
+            keep = a != b
+            found_a.append(np.minimum(a[keep], b[keep]))
+            found_b.append(np.maximum(a[keep], b[keep]))
+            found_scores.append(block[block >= threshold][keep])
+
+        n = len(self.vectors)
+        if exact:
+            for start in range(0, n, BLOCK_ROWS):
+                rows = np.arange(start, min(start + BLOCK_ROWS, n))
+                # Hanya blok kolom di kanan diagonal (setiap pasangan sekali)
+                for column_start in range(start, n, BLOCK_COLUMNS):
+                    columns = np.arange(column_start, min(column_start + BLOCK_COLUMNS, n))
+                    collect(rows, columns, np.asarray(self.vectors[rows] @ self.vectors[columns].T))
+        else:
+            centroid_scores = self.centroids @ self.centroids.T
+            n_probe = min(n_probe, len(self.centroids))
+            for list_id in range(len(self.centroids)):
+                members = self.list_ids[self.offsets[list_id]:self.offsets[list_id + 1]]
+                if not len(members):
+                    continue
+                lists = np.argpartition(-centroid_scores[list_id], n_probe - 1)[:n_probe]
+                candidates = np.concatenate([self.list_ids[self.offsets[i]:self.offsets[i + 1]] for i in lists])
+                member_vectors = np.asarray(self.vectors[members])
+                for start in range(0, len(candidates), BLOCK_COLUMNS):
+                    block_candidates = candidates[start:start + BLOCK_COLUMNS]
+                    collect(members, block_candidates, member_vectors @ np.asarray(self.vectors[block_candidates]).T)
+
+        if found_a:
+            a, b, scores = np.concatenate(found_a), np.concatenate(found_b), np.concatenate(found_scores)
+        else:
+            a = b = np.zeros(0, dtype=np.int64)
+            scores = np.zeros(0, dtype=np.float32)
+        # Pasangan yang sama bisa ditemukan dari dua daftar
+        keys = a.astype(np.int64) * n + b
+        keys, first = np.unique(keys, return_index=True)
+        pairs = pd.DataFrame({
+            'row_a': self.row_ids[a[first]],
+            'row_b': self.row_ids[b[first]],
+            'similarity': np.round(scores[first].astype(np.float64), 4),
+        })
+        return pairs.sort_values(['similarity', 'row_a', 'row_b'], ascending=[False, True, True], ignore_index=True)
+
+    def recall(self, sample_size=200, top_k=10, n_probe=DEFAULT_N_PROBE, random_state=RANDOM_STATE):
+        """
+        Recall@k rata-rata IVF terhadap brute force pada sampel kueri
+
+        Returns:
+            Float recall (0-1)
+        """
+        hits = total = 0
+        for position in _sample(len(self.vectors), sample_size, random_state):
+            vector = np.asarray(self.vectors[position])
+            approx, _ = self.search_vector(vector, top_k, n_probe, exclude=position)
+            exact, _ = self.search_vector(vector, top_k, exact=True, exclude=position)
+            hits += len(np.intersect1d(approx, exact))
+            total += len(exact)
+        return hits / total if total else 1.0
+
+
+def build_similarity_index(nlp_file, index_dir=SIMILARITY_DIR, n_components=N_COMPONENTS, n_lists=None):
+    """
+    Membangun index artikel serupa dari matriks TF-IDF file hasil NLP
+
+    Args:
+        nlp_file: Path file CSV hasil preprocessing NLP (dengan file TF-IDF-nya)
+        index_dir: Direktori index
+        n_components: Dimensi vektor SVD
+        n_lists: Jumlah daftar IVF (default: 2 * akar jumlah artikel)
+
+    Returns:
+        SimilarityIndex yang sudah dibuka
+    """
+    from interfaces.clustering import load_features
+
+    df, X, mask, vectorizer = load_features(nlp_file)
+    with metrics.stage('similarity_build', X.shape[0]) as stage:
+        svd, vectors = reduce_features(X, n_components)
+        centroids, offsets, list_ids = build_ivf(vectors, n_lists)
+
+        os.makedirs(index_dir, exist_ok=True)
+        np.save(os.path.join(index_dir, 'vectors.npy'), vectors)
+        np.save(os.path.join(index_dir, 'row_ids.npy'), np.flatnonzero(mask))
+        np.save(os.path.join(index_dir, 'centroids.npy'), centroids)
+        np.save(os.path.join(index_dir, 'list_offsets.npy'), offsets)
+        np.save(os.path.join(index_dir, 'list_ids.npy'), list_ids)
+        joblib.dump({'vectorizer': vectorizer, 'svd': svd}, os.path.join(index_dir, 'models.joblib'))
+        with open(os.path.join(index_dir, 'meta.json'), 'w', encoding='utf-8') as file:
+            json.dump({
+                'source': os.path.abspath(nlp_file),
+                'num_vectors': len(vectors),
+                'n_components': vectors.shape[1],
+                'n_lists': len(centroids),
+                'explained_variance': round(float(svd.explained_variance_ratio_.sum()), 4),
+            }, file, indent=2)
+    print(f"Index artikel serupa ({len(vectors)} vektor, {vectors.shape[1]} dimensi, {len(centroids)} daftar IVF) "
+          f"dibangun dalam {stage['wall_seconds']:.2f} detik: {index_dir}")
+    return SimilarityIndex(index_dir)
+
+
+def find_similar_pairs(nlp_file, output_file=None, index_dir=SIMILARITY_DIR, threshold=DEFAULT_THRESHOLD,
+                       n_probe=DEFAULT_N_PROBE, exact=False, rebuild=True, recall_sample=0):
+    """
+    Job semua-pasangan: menyimpan pasangan artikel dengan similarity >= threshold
+
+    Args:
+        nlp_file: Path file CSV hasil NLP (atau hasil labeling dengan baris yang sama)
+        output_file: Path hasil (default: [namafile]_similar_pairs.csv)
+        index_dir: Direktori index
+        threshold: Ambang cosine similarity
+        n_probe: Jumlah daftar IVF yang diperiksa per daftar
+        exact: Brute force semua pasangan (untuk cek recall)
+        rebuild: Bangun ulang index dari nlp_file terlebih dahulu
+        recall_sample: Jika > 0, ukur recall@10 IVF terhadap brute force pada sampel kueri sebanyak ini
+
+    Returns:
+        Path file pasangan
+    """
+    if output_file is None:
+        output_file = f"{os.path.splitext(nlp_file)[0]}_similar_pairs.csv"
+    index = build_similarity_index(nlp_file, index_dir) if rebuild else SimilarityIndex(index_dir)
+
+    with metrics.stage('similarity_pairs', len(index.vectors)) as stage:
+        pairs = index.pairs_above(threshold, n_probe, exact)
+    df = pd.read_csv(nlp_file)
+    # Sertakan judul, link dan label SDG (jika ada) kedua artikel
+    columns = [column for column in ('Title', 'Link', 'Year', 'predicted_sdgs') if column in df.columns]
+    for suffix, rows in (('a', pairs['row_a']), ('b', pairs['row_b'])):
+        for column in columns:
+            pairs[f'{column}_{suffix}'] = df[column].to_numpy()[rows.to_numpy()]
+    pairs.to_csv(output_file, index=False)
+    mode = 'exact' if exact else f'IVF n_probe={n_probe}'
+    print(f"{len(pairs)} pasangan dengan similarity >= {threshold} ({mode}) ditemukan dalam "
+          f"{stage['wall_seconds']:.2f} detik, disimpan di: {output_file}")
+    if recall_sample and not exact:
+        print(f"Recall@10 IVF (n_probe={n_probe}) pada {min(recall_sample, len(index.vectors))} kueri sampel: "
+              f"{index.recall(recall_sample, n_probe=n_probe):.4f}")
+    return output_file
@@ -0,0 +1,269 @@
+"""
+Topic modeling inkremental (online LDA / MiniBatchNMF) pada judul hasil NLP.
+
+Model baru dilatih penuh (beberapa epoch mini-batch), lalu disimpan bersama
+vocabulary dan hash baris yang sudah dipelajari. Saat ada data baru hasil
+scraping, hanya baris baru yang dipakai untuk memperbarui model dengan
+``partial_fit`` per mini-batch, tanpa fitting ulang dari awal. Vocabulary ditetapkan saat model pertama kali dibuat
+(kata yang baru muncul di data susulan diabaikan) agar bobot topik tetap
+sebanding antar pembaruan. Model disimpan dibuat ulang jika metode atau jumlah
+topiknya berbeda dengan yang diminta.
+
+Prevalensi topik per tahun dihitung dengan satu agregasi sparse: matriks
+indikator tahun x dokumen dikalikan dengan matriks dokumen x topik.
+
+Contoh:
+    from interfaces.topics import model_topics
+    trends_file = model_topics('data/sinta_articles_2503_to_3336_processed_nlp.csv')
+"""
+
+import os
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from interfaces.metrics import metrics
+from interfaces.row_keys import row_hashes
+
+TOPIC_METHODS = ('lda', 'nmf')
+DEFAULT_METHOD = 'lda'
+DEFAULT_N_TOPICS = 10
+MODEL_FILE = os.path.join('data', 'models', 'topic_model.joblib')
+
+# Ukuran vocabulary dan mini-batch partial_fit
+MAX_FEATURES = 5000
+# Kata harus muncul di minimal MIN_DF judul (korpus yang terlalu kecil memakai 1)
+MIN_DF = 2
+BATCH_SIZE = 2048
+TOP_TERMS = 10
+RANDOM_STATE = 42
+
+
+def build_model(method=DEFAULT_METHOD, n_topics=DEFAULT_N_TOPICS, total_samples=1_000_000):
+    """
+    Membuat vectorizer dan model topik yang mendukung partial_fit
+
+    Args:
+        method: 'lda' (online LatentDirichletAllocation, fitur hitungan kata)
+            atau 'nmf' (MiniBatchNMF, fitur TF-IDF)
+        n_topics: Jumlah topik
+        total_samples: Perkiraan ukuran korpus (dipakai pembaruan online LDA)
+
+    Returns:
+        Tuple (vectorizer, model)
+    """
+    # Impor lokal: scikit-learn hanya dimuat saat model dibuat, bukan saat modul diimpor
+    from sklearn.decomposition import LatentDirichletAllocation, MiniBatchNMF
+    from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+    if method == 'lda':
+        vectorizer = CountVectorizer(max_features=MAX_FEATURES, min_df=MIN_DF)
+        model = LatentDirichletAllocation(
+            n_components=n_topics, learning_method='online', batch_size=BATCH_SIZE,
+            total_samples=total_samples, random_state=RANDOM_STATE,
+        )
+    elif method == 'nmf':
+        vectorizer = TfidfVectorizer(max_features=MAX_FEATURES, min_df=MIN_DF)
+        model = MiniBatchNMF(n_components=n_topics, batch_size=BATCH_SIZE, init='nndsvda', random_state=RANDOM_STATE)
+    else:
+        raise ValueError(f"Metode topik tidak dikenal: {method} (pilihan: {', '.join(TOPIC_METHODS)})")
+    return vectorizer, model
+
+
+def load_model(model_file=MODEL_FILE):
+    """Memuat bundle model topik tersimpan, atau None jika belum ada."""
+    if not os.path.exists(model_file):
+        return None
+    return joblib.load(model_file)
+
+
+def save_model(bundle, model_file=MODEL_FILE):
+    """Menyimpan bundle model topik secara atomik."""
+    directory = os.path.dirname(model_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_file = f'{model_file}.tmp'
+    joblib.dump(bundle, tmp_file)
+    os.replace(tmp_file, model_file)
+
+
+def fit_vocabulary(vectorizer, texts):
+    """Menetapkan vocabulary dari korpus awal; turun ke min_df=1 jika korpusnya terlalu kecil."""
+    try:
+        return vectorizer.fit(texts)
+    except ValueError:
+        # "After pruning, no terms remain": tidak ada kata yang muncul di MIN_DF judul
+        if vectorizer.min_df == 1:
+            raise
+    print(f"Tidak ada kata yang muncul di minimal {vectorizer.min_df} dari {len(texts)} judul, "
+          "vocabulary memakai semua kata (min_df=1)")
+    try:
+        return vectorizer.set_params(min_df=1).fit(texts)
+    except ValueError:
+        raise ValueError(f"Tidak ada kata yang bisa dipakai untuk model topik dari {len(texts)} judul") from None
+
+
+def partial_fit_texts(bundle, texts, batch_size=BATCH_SIZE):
+    """Memperbarui model topik dengan teks baru per mini-batch."""
+    vectorizer = bundle['vectorizer']
+    model = bundle['model']
+    for start in range(0, len(texts), batch_size):
+        model.partial_fit(vectorizer.transform(texts[start:start + batch_size]))
+
+
+def update_model(df, model_file=MODEL_FILE, method=DEFAULT_METHOD, n_topics=DEFAULT_N_TOPICS,
+                 retrain=False, batch_size=BATCH_SIZE):
+    """
+    Membuat model topik atau memperbaruinya dengan baris yang belum pernah dipelajari
+
+    Args:
+        df: DataFrame hasil NLP (kolom Title, Link)
+        model_file: Path bundle model
+        method: Metode topik ('lda' atau 'nmf')
+        n_topics: Jumlah topik (model tersimpan dengan jumlah lain dibuat ulang)
+        retrain: Buat model baru meskipun sudah ada
+        batch_size: Ukuran mini-batch partial_fit
+
+    Returns:
+        Bundle model (vectorizer, model, method, seen, updated_at)
+    """
+    texts = df['Title'].fillna('').astype(str)
+    nonempty = (texts.str.strip() != '').to_numpy()
+    hashes = row_hashes(df)
+
+    bundle = None if retrain else load_model(model_file)
+    if bundle and bundle['method'] != method:
+        print(f"Model tersimpan memakai metode {bundle['method']}, membuat model {method} baru")
+        bundle = None
+    elif bundle and bundle['model'].n_components != n_topics:
+        print(f"Model tersimpan memiliki {bundle['model'].n_components} topik, membuat model {n_topics} topik baru")
+        bundle = None
+
+    created = bundle is None
+    if created:
+        vectorizer, model = build_model(method, n_topics, total_samples=max(int(nonempty.sum()), 1))
+        # Vocabulary ditetapkan sekali dari korpus awal
+        fit_vocabulary(vectorizer, texts[nonempty].tolist())
+        bundle = {'vectorizer': vectorizer, 'model': model, 'method': method,
+                  'seen': np.array([], dtype=np.uint64)}
+
+    # Baris baru: belum pernah dipelajari dan kemunculan pertama dari hash-nya
+    first = np.zeros(len(hashes), dtype=bool)
+    first[np.unique(hashes, return_index=True)[1]] = True
+    new_rows = nonempty & first & ~np.isin(hashes, bundle['seen'])
+    num_new = int(new_rows.sum())
+    if num_new:
+        # Urutan acak agar setiap mini-batch mewakili seluruh korpus
+        order = np.random.default_rng(RANDOM_STATE).permutation(np.flatnonzero(new_rows))
+        if created:
+            # Model baru dilatih max_iter epoch; partial_fit sekali lewat hanya untuk baris susulan
+            with metrics.stage('topic_fit', num_new):
+                bundle['model'].fit(bundle['vectorizer'].transform(texts.to_numpy()[order].tolist()))
+        else:
+            if bundle['method'] == 'lda':
+                # Bobot pembaruan online LDA bergantung pada ukuran korpus yang sudah dipelajari
+                bundle['model'].total_samples = len(bundle['seen']) + num_new
+            with metrics.stage('topic_partial_fit', num_new):
+                partial_fit_texts(bundle, texts.to_numpy()[order].tolist(), batch_size)
+        bundle['seen'] = np.union1d(bundle['seen'], hashes[new_rows])
+        bundle['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        save_model(bundle, model_file)
+    print(f"Model topik {bundle['method']} diperbarui dengan {num_new} judul baru "
+          f"(total {len(bundle['seen'])} judul dipelajari)")
+    return bundle
+
+
+def document_topics(bundle, texts, batch_size=50000):
+    """Distribusi topik per dokumen (baris dinormalisasi menjadi proporsi), per batch."""
+    vectorizer = bundle['vectorizer']
+    model = bundle['model']
+    parts = []
+    for start in range(0, len(texts), batch_size):
+        weights = model.transform(vectorizer.transform(texts[start:start + batch_size]))
+        totals = weights.sum(axis=1, keepdims=True)
+        parts.append(np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0))
+    if not parts:
+        return np.zeros((0, model.n_components))
+    return np.vstack(parts)
+
+
+def topic_terms(bundle, top_n=TOP_TERMS):
+    """Kata dengan bobot tertinggi di setiap topik."""
+    terms = np.asarray(bundle['vectorizer'].get_feature_names_out())
+    top = np.argsort(-bundle['model'].components_, axis=1)[:, :top_n]
+    return {topic: terms[indices].tolist() for topic, indices in enumerate(top)}
+
+
+def topic_prevalence_by_year(years, doc_topics):
+    """
+    Rata-rata proporsi topik per tahun dengan satu perkalian matriks sparse
+
+    Args:
+        years: Series tahun per dokumen (sejajar dengan doc_topics)
+        doc_topics: Array [n_dokumen, n_topik]
+
+    Returns:
+        DataFrame indeks Year, kolom topic_0..topic_n dan articles
+    """
+    codes, labels = pd.factorize(years.astype(str), sort=True)
+    indicator = sparse.csr_matrix(
+        (np.ones(len(codes)), (codes, np.arange(len(codes)))), shape=(len(labels), len(codes))
+    )
+    sums = indicator @ doc_topics
+    counts = np.asarray(indicator.sum(axis=1)).ravel()
+    prevalence = pd.DataFrame(
+        sums / np.maximum(counts, 1)[:, None],
+        index=pd.Index(labels, name='Year'),
+        columns=[f'topic_{topic}' for topic in range(doc_topics.shape[1])],
+    )
+    prevalence['articles'] = counts.astype(int)
+    return prevalence
+
+
+def model_topics(nlp_file, output_file=None, model_file=MODEL_FILE, method=DEFAULT_METHOD,
+                 n_topics=DEFAULT_N_TOPICS, retrain=False):
+    """
+    Memperbarui model topik dan menulis tabel tren topik per tahun
+
+    Args:
+        nlp_file: Path file CSV hasil preprocessing NLP
+        output_file: Path tabel tren (default: [namafile]_topic_trends.csv);
+            daftar kata per topik ditulis ke [namafile]_topics.csv
+        model_file: Path bundle model topik
+        method: Metode topik ('lda' atau 'nmf')
+        n_topics: Jumlah topik (model tersimpan dengan jumlah lain dibuat ulang)
+        retrain: Buat model baru dari awal
+
+    Returns:
+        Path file tren topik
+    """
+    base = os.path.splitext(nlp_file)[0]
+    if output_file is None:
+        output_file = f"{base}_topic_trends.csv"
+    terms_file = f"{base}_topics.csv"
+
+    df = pd.read_csv(nlp_file)
+    bundle = update_model(df, model_file, method, n_topics, retrain)
+
+    with metrics.stage('topic_trends', len(df)):
+        texts = df['Title'].fillna('').astype(str)
+        nonempty = (texts.str.strip() != '').to_numpy()
+        doc_topics = document_topics(bundle, texts[nonempty].tolist())
+        years = df.loc[nonempty, 'Year'] if 'Year' in df.columns else pd.Series('Unknown', index=texts[nonempty].index)
+        prevalence = topic_prevalence_by_year(years, doc_topics)
+
+    prevalence.round(4).to_csv(output_file)
+    terms = topic_terms(bundle)
+    pd.DataFrame({
+        'topic': list(terms),
+        'terms': [', '.join(words) for words in terms.values()],
+    }).to_csv(terms_file, index=False)
+
+    for topic, words in terms.items():
+        print(f"  Topik {topic}: {', '.join(words)}")
+    print(f"Tren topik per tahun disimpan di: {output_file}")
+    print(f"Daftar kata per topik disimpan di: {terms_file}")
+    return output_file
@@ -1,8 +1,10 @@
 import csv
 
+from entities.article import COLUMNS, ArticleBatch
+
 def write_articles_to_csv(articles, filename='sinta_articles.csv'):
+    rows = articles.rows() if isinstance(articles, ArticleBatch) else (article.to_row() for article in articles)
     with open(filename, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=['Title', 'Link', 'Authors', 'Year', 'Cited'])
-        writer.writeheader()
-        for article in articles:
-            writer.writerow(article.to_dict())
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
@@ -1,29 +1,516 @@
-from usecases.scraper import scrape_articles_with_login
+# Di tingkat modul hanya konstanta CLI dari modul ringan; modul yang memuat NLTK, scikit-learn atau
+# Selenium diimpor di cabang perintah yang memakainya agar perintah seperti report langsung berjalan
+from usecases.pipeline import DEFAULT_JOBS as DEFAULT_PIPELINE_JOBS, STAGE_NAMES, STATE_FILE as PIPELINE_STATE_FILE
+from usecases.scraper import BROWSER_PROFILES
 import os
 import argparse
-from dotenv import load_dotenv
-from interfaces.csv_preprocessor import preprocess_csv
-from interfaces.nlp_processor import process_nlp
+import atexit
+import functools
+import time
+from interfaces.csv_preprocessor import DEFAULT_CHUNK_ROWS, NUM_WORKERS, preprocess_csv
+from interfaces.topics import DEFAULT_METHOD as DEFAULT_TOPIC_METHOD, DEFAULT_N_TOPICS, TOPIC_METHODS
+from interfaces.label_sdgs import (
+    CLASSIFIER_BACKENDS, DEFAULT_BACKEND, DEFAULT_N_JOBS, DEFAULT_TOP_K, LABEL_FILE,
+    REVIEW_CONFIDENCE_THRESHOLD, REVIEW_FILE, model_path,
+)
+from interfaces.search_index import INDEX_DIR
+from interfaces.page_archive import ARCHIVE_FILE
+from interfaces.shard_leases import DEFAULT_LEASE_TIMEOUT, DEFAULT_SHARD_PAGES, SHARD_DIR, ShardLeases
+from interfaces.analytics import CUBE_FILE
+from interfaces.authors import AUTHORS_DIR, RANKING_FIELDS
+from interfaces.similarity import DEFAULT_N_PROBE, DEFAULT_THRESHOLD as DEFAULT_SIMILAR_THRESHOLD, SIMILARITY_DIR
+from interfaces.query_service import (
+    DEFAULT_HOST as DEFAULT_SERVE_HOST, DEFAULT_MAX_BATCH, DEFAULT_MAX_WAIT, DEFAULT_PORT as DEFAULT_SERVE_PORT,
+)
+from interfaces.metrics import metrics
+
+def nlp_function(name):
+    """Fungsi nlp_processor yang modulnya (NLTK, scikit-learn) baru diimpor saat pertama dipanggil."""
+    def call(*args, **kwargs):
+        from interfaces import nlp_processor
+        return getattr(nlp_processor, name)(*args, **kwargs)
+    call.__name__ = name
+    return call
 
 def main():
     # Parse argumen command line
     parser = argparse.ArgumentParser(description='Scrape dan preprocess data jurnal Sinta Unila.')
+    parser.add_argument('command', nargs='?', choices=['search', 'similar', 'authors', 'report', 'run', 'serve', 'shard', 'merge'],
+                        help='Perintah opsional: search (cari artikel di index), similar (artikel serupa), '
+                             'authors (query index penulis), report (ringkasan cube analitik), '
+                             'run (jalankan graf tahap pipeline dengan cache), '
+                             'serve (layanan kueri lokal dengan model di memori), '
+                             'shard (scraping terbagi: plan / work / status), '
+                             'merge (gabungkan hasil shard atau file CSV scraping)')
+    parser.add_argument('query', nargs='*', help='Kata kunci pencarian, nomor baris/teks untuk perintah similar, '
+                                                 '"top" / "collaborators NAMA" / "output NAMA" untuk perintah authors, '
+                                                 'file CSV hasil scraping untuk perintah run, '
+                                                 'file CSV hasil NLP untuk perintah serve, '
+                                                 '"plan" / "work" / "status" untuk perintah shard, '
+                                                 'atau file CSV scraping yang digabung untuk perintah merge')
     parser.add_argument('--start', type=int, default=2503, help='Halaman awal untuk scraping (default: 2503)')
     parser.add_argument('--end', type=int, default=3336, help='Halaman akhir untuk scraping (default: 3336)')
+    parser.add_argument('--archive-file', default=ARCHIVE_FILE, help=f'Arsip HTML mentah halaman hasil scraping (default: {ARCHIVE_FILE})')
+    parser.add_argument('--no-archive', action='store_true', help='Jangan simpan HTML mentah halaman saat scraping')
+    parser.add_argument('--browser-profile', default='default', choices=BROWSER_PROFILES,
+                        help='Profil Chrome untuk scraping: default (jendela penuh) atau lean (headless, tanpa '
+                             'gambar/CSS/font, pageLoadStrategy eager) (default: default)')
+    parser.add_argument('--replay', action='store_true', help='Parse ulang halaman --start..--end dari arsip HTML tanpa akses jaringan')
+    parser.add_argument('--replay-workers', type=int, help='Jumlah proses parsing saat --replay (default: semua core)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Refresh delta: ambil ulang halaman terbaru dan perbarui Cited/Year pada CSV hasil scraping yang sudah ada')
+    parser.add_argument('--refresh-stop-after', type=int, default=5,
+                        help='Hentikan refresh setelah sejumlah halaman berturut-turut tidak berubah (default: 5)')
+    parser.add_argument('--shard-dir', default=SHARD_DIR, help=f'Direktori bersama rencana dan lease shard (default: {SHARD_DIR})')
+    parser.add_argument('--shard-pages', type=int, default=DEFAULT_SHARD_PAGES,
+                        help=f'Jumlah halaman per shard untuk shard plan (default: {DEFAULT_SHARD_PAGES})')
+    parser.add_argument('--lease-timeout', type=float, default=DEFAULT_LEASE_TIMEOUT,
+                        help=f'Detik tanpa heartbeat sebelum lease shard dianggap mati (default: {DEFAULT_LEASE_TIMEOUT:.0f})')
+    parser.add_argument('--worker-id', help='ID worker shard (default: nama host dan pid)')
+    parser.add_argument('--max-shards', type=int, help='Worker berhenti setelah sejumlah shard ini (default: sampai habis)')
+    parser.add_argument('--merge-output', help='File hasil perintah merge (default: sinta_articles_{start}_to_{end}.csv)')
+    parser.add_argument('--allow-partial', action='store_true', help='Perintah merge: gabungkan meskipun masih ada shard yang belum selesai')
     parser.add_argument('--preprocess', action='store_true', help='Lakukan preprocessing data setelah scraping')
     parser.add_argument('--only-preprocess', help='Hanya lakukan preprocessing pada file CSV yang ditentukan')
+    parser.add_argument('--chunk-rows', type=int,
+                        help=f'Preprocessing streaming per chunk sebanyak N baris untuk file besar (contoh: {DEFAULT_CHUNK_ROWS})')
+    parser.add_argument('--preprocess-workers', type=int, help='Jumlah proses worker preprocessing streaming (default: jumlah CPU - 1)')
+    parser.add_argument('--spill-dir', help='Direktori file sementara preprocessing streaming (default: direktori temp sistem)')
     parser.add_argument('--nlp', action='store_true', help='Lakukan preprocessing NLP pada judul artikel')
+    parser.add_argument('--fused', action='store_true',
+                        help='Gabungkan preprocessing dan NLP dalam satu pass di memori (dengan --preprocess/--only-preprocess dan --nlp)')
+    parser.add_argument('--keep-processed', action='store_true',
+                        help='Mode --fused: tetap tulis CSV antara hasil preprocessing (*_processed.csv)')
     parser.add_argument('--translate', action='store_true', help='Terjemahkan judul non-Indonesia ke Bahasa Indonesia (lambat)')
     parser.add_argument('--only-nlp', help='Hanya lakukan preprocessing NLP pada file CSV yang ditentukan')
+    parser.add_argument('--label', action='store_true', help='Lakukan pelabelan SDGs otomatis setelah preprocessing NLP')
+    parser.add_argument('--only-label', help='Hanya lakukan pelabelan SDGs pada file CSV yang ditentukan')
+    parser.add_argument('--label-file', default=LABEL_FILE, help=f'File CSV data latih SDGs (default: {LABEL_FILE})')
+    parser.add_argument('--model-file', default=None,
+                        help=f"File model SDGs tersimpan (default: {model_path('[backend]')}, per --label-backend)")
+    parser.add_argument('--retrain', action='store_true', help='Paksa pelatihan ulang model SDGs (dan model topik)')
+    parser.add_argument('--label-backend', default=DEFAULT_BACKEND, choices=CLASSIFIER_BACKENDS,
+                        help=f'Backend classifier SDGs (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--label-jobs', type=int, default=DEFAULT_N_JOBS, help='Jumlah core untuk pelatihan model SDGs (default: -1, semua core)')
+    parser.add_argument('--review-file', default=REVIEW_FILE, help=f'File antrean review manual hasil pelabelan (default: {REVIEW_FILE})')
+    parser.add_argument('--review-threshold', type=float, default=REVIEW_CONFIDENCE_THRESHOLD,
+                        help=f'Prediksi dengan probabilitas di bawah ambang ini masuk antrean review (default: {REVIEW_CONFIDENCE_THRESHOLD})')
+    parser.add_argument('--label-top-k', type=int, default=DEFAULT_TOP_K, help=f'Jumlah label SDGs teratas per artikel (default: {DEFAULT_TOP_K})')
+    parser.add_argument('--cluster', action='store_true', help='Lakukan clustering artikel (MiniBatchKMeans) setelah preprocessing NLP')
+    parser.add_argument('--only-cluster', help='Hanya lakukan clustering pada file hasil NLP yang ditentukan')
+    parser.add_argument('--clusters', type=int, help='Jumlah cluster (default: dipilih otomatis lewat sweep silhouette)')
+    parser.add_argument('--cluster-plot', help='File visualisasi cluster (default: [namafile]_clusters.png di samping hasil NLP)')
+    parser.add_argument('--topics', action='store_true', help='Perbarui model topik (online LDA/NMF) dan tren topik per tahun setelah preprocessing NLP')
+    parser.add_argument('--only-topics', help='Hanya lakukan topic modeling pada file hasil NLP yang ditentukan')
+    parser.add_argument('--topic-method', default=DEFAULT_TOPIC_METHOD, choices=TOPIC_METHODS,
+                        help=f'Metode topic modeling (default: {DEFAULT_TOPIC_METHOD})')
+    parser.add_argument('--topic-count', type=int, default=DEFAULT_N_TOPICS, help=f'Jumlah topik; model tersimpan dengan jumlah lain dibuat ulang (default: {DEFAULT_N_TOPICS})')
+    parser.add_argument('--index', action='store_true', help='Tambahkan hasil NLP ke index pencarian BM25')
+    parser.add_argument('--only-index', help='Hanya tambahkan file hasil NLP yang ditentukan ke index pencarian')
+    parser.add_argument('--index-dir', default=INDEX_DIR, help=f'Direktori index pencarian (default: {INDEX_DIR})')
+    parser.add_argument('--similar', action='store_true', help='Bangun index artikel serupa dan cari pasangan mirip setelah preprocessing NLP')
+    parser.add_argument('--only-similar', help='Hanya bangun index artikel serupa dan cari pasangan mirip pada file hasil NLP yang ditentukan')
+    parser.add_argument('--similar-dir', default=SIMILARITY_DIR, help=f'Direktori index artikel serupa (default: {SIMILARITY_DIR})')
+    parser.add_argument('--similar-threshold', type=float, default=DEFAULT_SIMILAR_THRESHOLD,
+                        help=f'Ambang cosine similarity pasangan artikel (default: {DEFAULT_SIMILAR_THRESHOLD})')
+    parser.add_argument('--similar-probe', type=int, default=DEFAULT_N_PROBE, help=f'Jumlah daftar IVF yang diperiksa (default: {DEFAULT_N_PROBE})')
+    parser.add_argument('--similar-exact', action='store_true', help='Gunakan brute force (tanpa IVF) untuk cek recall')
+    parser.add_argument('--similar-recall', type=int, default=0, metavar='N',
+                        help='Ukur recall@k IVF terhadap brute force pada N kueri sampel (dengan --similar/--only-similar atau perintah similar)')
+    parser.add_argument('--authors', action='store_true', help='Bangun index penulis dan co-authorship setelah preprocessing data (dengan --only-nlp: dari file input NLP)')
+    parser.add_argument('--only-authors', help='Hanya bangun index penulis dari file hasil preprocessing yang ditentukan')
+    parser.add_argument('--authors-dir', default=AUTHORS_DIR, help=f'Direktori index penulis (default: {AUTHORS_DIR})')
+    parser.add_argument('--author-by', default='articles', choices=RANKING_FIELDS,
+                        help='Urutan perintah "authors top": articles atau citations (default: articles)')
+    parser.add_argument('--only-cube', help='Hanya perbarui cube analitik dari file hasil NLP/labeling yang ditentukan')
+    parser.add_argument('--cube-cluster-file', help='File hasil clustering untuk dimensi cluster pada --only-cube')
+    parser.add_argument('--cube-file', default=CUBE_FILE, help=f'File cube analitik (default: {CUBE_FILE})')
+    parser.add_argument('--until', choices=STAGE_NAMES, help='Perintah run: jalankan tahap ini beserta tahap yang dibutuhkannya saja')
+    parser.add_argument('--pipeline-jobs', type=int, default=DEFAULT_PIPELINE_JOBS,
+                        help=f'Perintah run: jumlah tahap yang boleh berjalan bersamaan (default: {DEFAULT_PIPELINE_JOBS})')
+    parser.add_argument('--pipeline-state', default=PIPELINE_STATE_FILE,
+                        help=f'Perintah run: file cache hash tahap (default: {PIPELINE_STATE_FILE})')
+    parser.add_argument('--top', type=int, default=10, help='Jumlah hasil pencarian teratas (default: 10)')
+    parser.add_argument('--host', default=DEFAULT_SERVE_HOST, help=f'Alamat layanan serve (default: {DEFAULT_SERVE_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVE_PORT, help=f'Port layanan serve (default: {DEFAULT_SERVE_PORT})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_MAX_BATCH,
+                        help=f'Jumlah teks maksimum per micro-batch layanan serve (default: {DEFAULT_MAX_BATCH})')
+    parser.add_argument('--batch-wait', type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help=f'Waktu tunggu pengumpulan micro-batch dalam milidetik (default: {DEFAULT_MAX_WAIT * 1000:g})')
+    parser.add_argument('--metrics', help='Tulis metrik per tahap ke file JSON-lines ini')
+    parser.add_argument('--metrics-prometheus', help='Tulis metrik ke textfile Prometheus ini')
+    parser.add_argument('--profile', action='store_true', help='Profil preprocessing dan NLP (termasuk worker) dengan sampling profiler')
+    parser.add_argument('--profile-dir', default='profile', help='Direktori hasil profiling (default: profile)')
+    parser.add_argument('--profile-interval', type=float, default=5.0, help='Interval sampling dalam milidetik (default: 5)')
+    parser.add_argument('--profile-top', type=int, default=25, help='Jumlah hotspot teratas di ringkasan (default: 25)')
     
     args = parser.parse_args()
     
+    # Aktifkan ekspor metrik jika diminta; ringkasan ditulis saat program selesai
+    if args.metrics or args.metrics_prometheus:
+        metrics.configure(jsonl_path=args.metrics, prometheus_path=args.metrics_prometheus)
+        atexit.register(metrics.flush)
+    
+    # Mode profiling: bungkus preprocess_csv dan process_nlp (termasuk worker-nya)
+    run_preprocess = preprocess_csv
+    run_nlp = nlp_function('process_nlp')
+    run_raw = nlp_function('process_raw')
+    if args.profile:
+        from interfaces.profiler import PipelineProfiler
+        profiler = PipelineProfiler(args.profile_dir, interval=args.profile_interval / 1000, top_n=args.profile_top)
+        run_preprocess = profiler.wrap(run_preprocess)
+        run_nlp = profiler.wrap(run_nlp)
+        run_raw = profiler.wrap(run_raw)
+        atexit.register(profiler.write_report)
+    run_preprocess = functools.partial(run_preprocess, chunk_rows=args.chunk_rows, workers=args.preprocess_workers,
+                                       spill_dir=args.spill_dir)
+    
+    def run_label(input_file):
+        from interfaces.label_sdgs import label_articles
+        print(f"\nMelakukan pelabelan SDGs pada data ({input_file})...")
+        labeled_file = label_articles(input_file, label_file=args.label_file,
+                                      model_file=args.model_file, retrain=args.retrain,
+                                      backend=args.label_backend, n_jobs=args.label_jobs,
+                                      top_k=args.label_top_k, review_file=args.review_file,
+                                      review_threshold=args.review_threshold)
+        print(f"Pelabelan SDGs berhasil! Hasil disimpan di: {labeled_file}")
+        return labeled_file
+    
+    def run_cluster(input_file):
+        from interfaces.clustering import cluster_articles
+        print(f"\nMelakukan clustering artikel pada data ({input_file})...")
+        clustered_file = cluster_articles(input_file, k=args.clusters, plot_file=args.cluster_plot)
+        print(f"Clustering berhasil! Hasil disimpan di: {clustered_file}")
+        return clustered_file
+    
+    def run_topics(input_file):
+        from interfaces.topics import model_topics
+        print(f"\nMelakukan topic modeling pada data ({input_file})...")
+        trends_file = model_topics(input_file, method=args.topic_method, n_topics=args.topic_count, retrain=args.retrain)
+        print(f"Topic modeling berhasil! Tren topik disimpan di: {trends_file}")
+        return trends_file
+    
+    def run_index(input_file):
+        from interfaces.search_index import build_index
+        print(f"\nMenambahkan data ({input_file}) ke index pencarian...")
+        build_index(input_file, args.index_dir)
+    
+    def run_similar(input_file):
+        from interfaces.similarity import find_similar_pairs
+        print(f"\nMencari artikel serupa pada data ({input_file})...")
+        pairs_file = find_similar_pairs(input_file, index_dir=args.similar_dir, threshold=args.similar_threshold,
+                                        n_probe=args.similar_probe, exact=args.similar_exact,
+                                        recall_sample=args.similar_recall)
+        print(f"Pencarian artikel serupa berhasil! Pasangan disimpan di: {pairs_file}")
+        return pairs_file
+    
+    def run_authors(input_file):
+        from interfaces.authors import build_author_index
+        print(f"\nMembangun index penulis dari data ({input_file})...")
+        build_author_index(input_file, args.authors_dir)
+    
+    def run_cube(input_file, cluster_file=None):
+        from interfaces.analytics import update_cube
+        print(f"\nMemperbarui cube analitik dari data ({input_file})...")
+        update_cube(input_file, cluster_file, cube_file=args.cube_file)
+    
+    def run_after_nlp(nlp_output):
+        # Tahap lanjutan yang memakai hasil NLP
+        labeled_file = clustered_file = None
+        if args.label:
+            labeled_file = run_label(nlp_output)
+        if args.cluster:
+            clustered_file = run_cluster(nlp_output)
+        if args.topics:
+            run_topics(nlp_output)
+        if args.index:
+            run_index(nlp_output)
+        if args.similar:
+            run_similar(nlp_output)
+        # Cube analitik diperbarui sekali per run, hanya jika tahap yang mengisinya (label/cluster) berjalan
+        if labeled_file or clustered_file:
+            run_cube(labeled_file or nlp_output, clustered_file)
+    
+    def run_fused(input_file):
+        # Preprocessing + NLP satu pass; CSV antara hanya ditulis jika diminta atau dibutuhkan index penulis
+        processed_file = None
+        if args.keep_processed or args.authors:
+            filename, ext = os.path.splitext(input_file)
+            processed_file = f"{filename}_processed{ext}"
+        nlp_output = run_raw(input_file, vectorize=True, processed_file=processed_file,
+                             chunk_rows=args.chunk_rows or DEFAULT_CHUNK_ROWS, workers=args.preprocess_workers or NUM_WORKERS)
+        print(f"Preprocessing + NLP (fused) berhasil! Hasil disimpan di: {nlp_output}")
+        if args.authors:
+            run_authors(processed_file)
+        run_after_nlp(nlp_output)
+        return nlp_output
+    
+    # Perintah search: cari artikel di index BM25
+    if args.command == 'search':
+        from interfaces.search_index import search
+        query = ' '.join(args.query)
+        if not query.strip():
+            print("Error: Kata kunci pencarian kosong")
+            return 1
+        if not os.path.exists(os.path.join(args.index_dir, 'meta.json')):
+            print(f"Error: Index {args.index_dir} belum dibuat (gunakan --only-index atau --index)")
+            return 1
+        start = time.perf_counter()
+        results = search(query, args.index_dir, args.top)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for rank, result in enumerate(results, 1):
+            print(f"{rank:>3}. [{result['score']:.3f}] {result.get('Title', '')} ({result.get('Year', '')})")
+            print(f"     {result.get('Authors', '')} | {result.get('Link', '')}")
+        print(f"{len(results)} hasil dalam {elapsed_ms:.1f} ms")
+        return 0
+    
+    # Perintah similar: artikel serupa dengan baris tertentu atau teks bebas
+    if args.command == 'similar':
+        from interfaces.similarity import SimilarityIndex
+        query = ' '.join(args.query)
+        if not query.strip():
+            print("Error: Nomor baris atau teks kosong")
+            return 1
+        if not os.path.exists(os.path.join(args.similar_dir, 'meta.json')):
+            print(f"Error: Index {args.similar_dir} belum dibuat (gunakan --only-similar atau --similar)")
+            return 1
+        index = SimilarityIndex(args.similar_dir)
+        start = time.perf_counter()
+        if query.strip().isdigit():
+            try:
+                results = index.similar_to_row(int(query), args.top, args.similar_probe, args.similar_exact)
+            except KeyError as e:
+                print(f"Error: {e.args[0]}")
+                return 1
+        else:
+            results = index.similar_to_text(query, args.top, args.similar_probe, args.similar_exact)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        articles = index.articles(row for row, _ in results)
+        for rank, ((row, score), article) in enumerate(zip(results, articles), 1):
+            print(f"{rank:>3}. [{score:.3f}] baris {row}: {article.get('Title', '')} ({article.get('Year', '')})")
+            print(f"     {article.get('Link', '')}")
+        print(f"{len(results)} hasil dalam {elapsed_ms:.1f} ms (sumber: {index.meta['source']})")
+        if args.similar_recall:
+            recall = index.recall(args.similar_recall, args.top, args.similar_probe)
+            print(f"Recall@{args.top} IVF (n_probe={args.similar_probe}) pada "
+                  f"{min(args.similar_recall, len(index.vectors))} kueri sampel: {recall:.4f}")
+        return 0
+    
+    # Perintah authors: penulis teratas, kolaborator, atau output per tahun
+    if args.command == 'authors':
+        from interfaces.authors import AuthorIndex
+        action = args.query[0] if args.query else 'top'
+        name = ' '.join(args.query[1:])
+        if action not in ('top', 'collaborators', 'output'):
+            print(f"Error: Perintah authors tidak dikenal: {action} (pilihan: top, collaborators, output)")
+            return 1
+        if action != 'top' and not name.strip():
+            print(f"Error: Nama penulis kosong untuk authors {action}")
+            return 1
+        if not os.path.exists(os.path.join(args.authors_dir, 'meta.json')):
+            print(f"Error: Index {args.authors_dir} belum dibuat (gunakan --only-authors atau --authors)")
+            return 1
+        index = AuthorIndex(args.authors_dir)
+        try:
+            if action == 'top':
+                print(f"Penulis teratas menurut {args.author_by}:")
+                table = index.top_authors(args.author_by, args.top)
+            elif action == 'collaborators':
+                print(f"Kolaborator {index.display_name(name)}:")
+                table = index.collaborators(name, args.top)
+            else:
+                print(f"Output per tahun {index.display_name(name)}:")
+                table = index.yearly_output(name)
+        except KeyError as e:
+            print(f"Error: {e.args[0]}")
+            return 1
+        print(table.to_string(index=False))
+        return 0
+    
+    # Perintah run: graf tahap dengan cache hash konten (hanya tahap yang input-nya berubah)
+    if args.command == 'run':
+        from usecases.pipeline import build_pipeline
+        raw_file = args.query[0] if args.query else f"sinta_articles_{args.start}_to_{args.end}.csv"
+        if not os.path.exists(raw_file):
+            print(f"Error: File {raw_file} tidak ditemukan (jalankan scraping terlebih dahulu)")
+            return 1
+        options = {
+            'label_file': args.label_file, 'model_file': args.model_file, 'label_backend': args.label_backend,
+            'label_jobs': args.label_jobs, 'label_top_k': args.label_top_k, 'review_file': args.review_file,
+            'review_threshold': args.review_threshold, 'clusters': args.clusters, 'cluster_plot': args.cluster_plot,
+            'topic_method': args.topic_method, 'topic_count': args.topic_count, 'index_dir': args.index_dir,
+            'similar_dir': args.similar_dir, 'similar_threshold': args.similar_threshold,
+            'similar_probe': args.similar_probe, 'authors_dir': args.authors_dir, 'cube_file': args.cube_file,
+            'chunk_rows': args.chunk_rows, 'preprocess_workers': args.preprocess_workers, 'spill_dir': args.spill_dir,
+        }
+        pipeline = build_pipeline(raw_file, options, state_file=args.pipeline_state, jobs=args.pipeline_jobs)
+        results = pipeline.run(until=args.until)
+        for name, status in results.items():
+            print(f"  {name:<12} {status}")
+        return 0 if all(status in ('ran', 'skipped') for status in results.values()) else 1
+    
+    # Perintah serve: layanan kueri HTTP lokal, model dan matriks fitur dimuat sekali
+    if args.command == 'serve':
+        import asyncio
+        from interfaces.query_service import serve
+        nlp_file = args.query[0] if args.query else None
+        if nlp_file and not os.path.exists(nlp_file):
+            print(f"Error: File {nlp_file} tidak ditemukan")
+            return 1
+        try:
+            asyncio.run(serve(nlp_file, args.host, args.port, model_file=args.model_file or model_path(args.label_backend),
+                              cube_file=args.cube_file, max_batch=args.batch_size, max_wait=args.batch_wait / 1000))
+        except KeyboardInterrupt:
+            print("Layanan kueri dihentikan")
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+    
+    # Perintah shard: rencana shard, worker scraping, atau status lease
+    if args.command == 'shard':
+        action = args.query[0] if args.query else 'status'
+        if action not in ('plan', 'work', 'status'):
+            print(f"Error: Perintah shard tidak dikenal: {action} (pilihan: plan, work, status)")
+            return 1
+        leases = ShardLeases(args.shard_dir, args.lease_timeout)
+        try:
+            if action == 'plan':
+                plan = leases.plan(args.start, args.end, args.shard_pages)
+                print(f"Rencana {len(plan['shards'])} shard untuk halaman {plan['start_page']}-{plan['end_page']} "
+                      f"({plan['shard_pages']} halaman per shard) di {args.shard_dir}")
+                return 0
+            if action == 'status':
+                shards = leases.status()
+                for shard in shards:
+                    detail = ''
+                    if shard['state'] == 'done':
+                        detail = f"{shard['worker']}, {shard['articles']} artikel"
+                    elif shard['state'] in ('leased', 'expired'):
+                        detail = f"{shard['worker']}, halaman {shard['page']}, heartbeat {shard['heartbeat_age']} detik lalu"
+                    print(f"  shard {shard['id']:>4} {shard['start']:>5}-{shard['end']:<5} {shard['state']:<8} {detail}")
+                counts = {state: sum(shard['state'] == state for shard in shards)
+                          for state in ('done', 'leased', 'expired', 'pending')}
+                print(', '.join(f"{count} {state}" for state, count in counts.items()))
+                return 0
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: {e}")
+            return 1
+        from dotenv import load_dotenv
+        from usecases.sharding import scrape_shards_with_login
+        load_dotenv()
+        email, password = os.getenv("SINTA_EMAIL"), os.getenv("SINTA_PASSWORD")
+        if not email or not password:
+            print("Error: Email atau password tidak ditemukan di file .env")
+            return 1
+        if not os.path.exists(leases.plan_file):
+            print(f"Error: Rencana shard {leases.plan_file} belum dibuat (gunakan shard plan)")
+            return 1
+        summary = scrape_shards_with_login(args.shard_dir, email, password, worker_id=args.worker_id,
+                                           lease_timeout=args.lease_timeout, archive=not args.no_archive,
+                                           browser_profile=args.browser_profile, max_shards=args.max_shards)
+        return 0 if summary is not None else 1
+    
+    # Perintah merge: k-way merge hasil shard (atau file CSV scraping) dengan dedup global
+    if args.command == 'merge':
+        from usecases.sharding import merge_scraped_files, merge_shards
+        if args.query:
+            missing = [path for path in args.query if not os.path.exists(path)]
+            if missing:
+                print(f"Error: File {', '.join(missing)} tidak ditemukan")
+                return 1
+            merge_scraped_files(args.query, args.merge_output or 'sinta_articles_merged.csv')
+            return 0
+        try:
+            output_file = merge_shards(args.shard_dir, args.merge_output, allow_partial=args.allow_partial)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+        return 0 if output_file else 1
+    
+    # Perintah report: ringkasan dari cube analitik saja (tanpa membaca CSV)
+    if args.command == 'report':
+        from interfaces.analytics import report
+        if not os.path.exists(args.cube_file):
+            print(f"Error: Cube {args.cube_file} belum dibuat (gunakan --only-cube atau jalankan pipeline NLP)")
+            return 1
+        report(args.cube_file, args.top)
+        return 0
+    
+    # Jika hanya ingin memperbarui cube analitik
+    if args.only_cube:
+        if os.path.exists(args.only_cube):
+            run_cube(args.only_cube, args.cube_cluster_file)
+            return 0
+        else:
+            print(f"Error: File {args.only_cube} tidak ditemukan")
+            return 1
+    
+    # Jika hanya ingin membangun index penulis
+    if args.only_authors:
+        if os.path.exists(args.only_authors):
+            run_authors(args.only_authors)
+            return 0
+        else:
+            print(f"Error: File {args.only_authors} tidak ditemukan")
+            return 1
+    
+    # Jika hanya ingin mencari artikel serupa
+    if args.only_similar:
+        if os.path.exists(args.only_similar):
+            run_similar(args.only_similar)
+            return 0
+        else:
+            print(f"Error: File {args.only_similar} tidak ditemukan")
+            return 1
+    
+    # Jika hanya ingin menambahkan data ke index pencarian
+    if args.only_index:
+        if os.path.exists(args.only_index):
+            run_index(args.only_index)
+            return 0
+        else:
+            print(f"Error: File {args.only_index} tidak ditemukan")
+            return 1
+    
+    # Jika hanya ingin melakukan topic modeling
+    if args.only_topics:
+        if os.path.exists(args.only_topics):
+            run_topics(args.only_topics)
+            return 0
+        else:
+            print(f"Error: File {args.only_topics} tidak ditemukan")
+            return 1
+    
+    # Jika hanya ingin melakukan clustering
+    if args.only_cluster:
+        if os.path.exists(args.only_cluster):
+            clustered_file = run_cluster(args.only_cluster)
+            run_cube(args.only_cluster, clustered_file)
+            return 0
+        else:
+            print(f"Error: File {args.only_cluster} tidak ditemukan")
+            return 1
+    
+    # Jika hanya ingin melakukan pelabelan SDGs
+    if args.only_label:
+        if os.path.exists(args.only_label):
+            run_cube(run_label(args.only_label))
+            return 0
+        else:
+            print(f"Error: File {args.only_label} tidak ditemukan")
+            return 1
+    
     # Jika hanya ingin melakukan preprocessing NLP
     if args.only_nlp:
         if os.path.exists(args.only_nlp):
+            if args.authors:
+                # Index penulis dibangun dari input NLP (hasil preprocessing), karena kolom Authors hasil NLP sudah di-stem
+                run_authors(args.only_nlp)
             print(f"Melakukan preprocessing NLP pada semua kolom (Title, Link, Authors, Year, Cited) dari file {args.only_nlp}...")
-            output_file = process_nlp(args.only_nlp, vectorize=True, translate=args.translate)
+            output_file = run_nlp(args.only_nlp, vectorize=True, translate=args.translate)
             print(f"Preprocessing NLP berhasil! Hasil disimpan di: {output_file}")
+            run_after_nlp(output_file)
             return 0
         else:
             print(f"Error: File {args.only_nlp} tidak ditemukan")
@@ -31,15 +518,22 @@ def main():
     
     # Jika hanya ingin melakukan preprocessing data
     if args.only_preprocess:
-        if os.path.exists(args.only_preprocess):
+        if os.path.exists(args.only_preprocess) and args.fused and args.nlp:
+            print(f"Melakukan preprocessing + NLP (fused) pada file {args.only_preprocess}...")
+            run_fused(args.only_preprocess)
+            return 0
+        elif os.path.exists(args.only_preprocess):
             print(f"Melakukan preprocessing pada file {args.only_preprocess}...")
-            output_file = preprocess_csv(args.only_preprocess)
+            output_file = run_preprocess(args.only_preprocess)
+            if args.authors:
+                run_authors(output_file)
             
             # Jika NLP juga diminta, lakukan preprocessing NLP pada hasil
             if args.nlp:
                 print(f"\nMelakukan preprocessing NLP pada hasil preprocessing ({output_file})...")
-                nlp_output = process_nlp(output_file, vectorize=True, translate=args.translate)
+                nlp_output = run_nlp(output_file, vectorize=True, translate=args.translate)
                 print(f"Preprocessing NLP berhasil! Hasil disimpan di: {nlp_output}")
+                run_after_nlp(nlp_output)
             
             print(f"Preprocessing berhasil! Hasil disimpan di: {output_file}")
             return 0
@@ -47,32 +541,56 @@ def main():
             print(f"Error: File {args.only_preprocess} tidak ditemukan")
             return 1
     
+    from dotenv import load_dotenv
+    from usecases.scraper import refresh_articles_with_login, replay_archive, scrape_articles_with_login
+    
     # Load environment variables from .env file
     load_dotenv()
     
     START_PAGE = args.start
     END_PAGE = args.end
     
-    # Get credentials from environment variables
-    EMAIL = os.getenv("SINTA_EMAIL")
-    PASSWORD = os.getenv("SINTA_PASSWORD")
-    
-    if not EMAIL or not PASSWORD:
-        print("Error: Email atau password tidak ditemukan di file .env")
-        return 1
-    
-    # Lakukan scraping
-    output_file = scrape_articles_with_login(START_PAGE, END_PAGE, EMAIL, PASSWORD)
+    if args.replay:
+        # Parse ulang dari arsip HTML: tanpa login dan tanpa akses jaringan
+        print(f"Memutar ulang parsing halaman {START_PAGE}-{END_PAGE} dari arsip {args.archive_file}...")
+        output_file = replay_archive(args.archive_file, START_PAGE, END_PAGE, workers=args.replay_workers)
+    else:
+        # Get credentials from environment variables
+        EMAIL = os.getenv("SINTA_EMAIL")
+        PASSWORD = os.getenv("SINTA_PASSWORD")
+        
+        if not EMAIL or not PASSWORD:
+            print("Error: Email atau password tidak ditemukan di file .env")
+            return 1
+        
+        archive_file = None if args.no_archive else args.archive_file
+        if args.refresh:
+            # Refresh delta pada file hasil scraping sebelumnya
+            output_file = refresh_articles_with_login(START_PAGE, END_PAGE, EMAIL, PASSWORD,
+                                                      stop_after=args.refresh_stop_after, archive_file=archive_file,
+                                                      browser_profile=args.browser_profile)
+        else:
+            # Lakukan scraping
+            output_file = scrape_articles_with_login(START_PAGE, END_PAGE, EMAIL, PASSWORD, archive_file=archive_file,
+                                                     browser_profile=args.browser_profile)
     
     if not output_file:
         print("Error: Scraping tidak berhasil menghasilkan file output")
         return 1
     
+    # Mode fused: preprocessing dan NLP hasil scraping dalam satu pass
+    if args.fused and args.preprocess and args.nlp and os.path.exists(output_file):
+        print(f"\nMelakukan preprocessing + NLP (fused) pada hasil scraping ({output_file})...")
+        run_fused(output_file)
+        return 0
+    
     # Jika opsi preprocessing diaktifkan, lakukan preprocessing pada hasil scraping
     if args.preprocess and output_file and os.path.exists(output_file):
         print(f"\nMelakukan preprocessing pada hasil scraping ({output_file})...")
-        preprocessed_file = preprocess_csv(output_file)
+        preprocessed_file = run_preprocess(output_file)
         print("Preprocessing selesai!")
+        if args.authors:
+            run_authors(preprocessed_file)
         
         # Update output_file to preprocessed file for potential NLP processing
         output_file = preprocessed_file
@@ -80,8 +598,11 @@ def main():
     # Jika opsi NLP diaktifkan, lakukan preprocessing NLP pada hasil
     if args.nlp and output_file and os.path.exists(output_file):
         print(f"\nMelakukan preprocessing NLP pada data ({output_file})...")
-        nlp_output = process_nlp(output_file, vectorize=True, translate=args.translate)
+        nlp_output = run_nlp(output_file, vectorize=True, translate=args.translate)
         print(f"Preprocessing NLP berhasil! Hasil disimpan di: {nlp_output}")
+        
+        # Tahap pelabelan/clustering jika diaktifkan
+        run_after_nlp(nlp_output)
     
     return 0
 
@@ -0,0 +1,303 @@
+"""
+Stage-graph runner for the Sinta pipeline with content-hash caching.
+
+Every stage declares its input files, parameters and output files. A stage
+is skipped when the hash of (stage name, version, parameters, input file
+contents) equals the one recorded in the state file and its outputs are still
+present and unchanged. Stages whose inputs are ready run concurrently in a
+thread pool (the heavy stages release the GIL in numpy/scikit-learn or use
+their own process pool), so for example NLP/TF-IDF and the author index run
+side by side after preprocessing.
+
+Example:
+    from usecases.pipeline import build_pipeline
+    pipeline = build_pipeline('sinta_articles_2503_to_3336.csv')
+    pipeline.run(until='label')
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import hashlib
+import json
+import os
+import threading
+import time
+
+from interfaces.metrics import metrics
+
+STATE_FILE = os.path.join('data', 'pipeline', 'state.json')
+DEFAULT_JOBS = 4
+STAGE_NAMES = ('preprocess', 'nlp', 'authors', 'label', 'cluster', 'topics', 'index', 'similar', 'cube')
+
+
+class Stage:
+    """
+    One node of the pipeline graph
+
+    Args:
+        name: Unique stage name
+        func: Callable with no arguments that produces the outputs
+        inputs: Files read by the stage (outputs of other stages or source files)
+        outputs: Files written by the stage
+        params: JSON-serializable parameters that affect the outputs
+        version: Bump when the stage logic changes to invalidate cached results
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), params=None, version=1):
+        self.name = name
+        self.func = func
+        self.inputs = [os.path.abspath(path) for path in inputs]
+        self.outputs = [os.path.abspath(path) for path in outputs]
+        self.params = params or {}
+        self.version = version
+
+
+class Pipeline:
+    """Dependency graph of stages with a persistent cache of content hashes."""
+
+    def __init__(self, stages, state_file=STATE_FILE, jobs=DEFAULT_JOBS):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_file = state_file
+        self.jobs = max(1, jobs)
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+
+        # A stage depends on every stage that produces one of its inputs
+        producers = {path: stage.name for stage in stages for path in stage.outputs}
+        self.deps = {
+            stage.name: sorted({producers[path] for path in stage.inputs if path in producers} - {stage.name})
+            for stage in stages
+        }
+
+    def _load_state(self):
+        if os.path.exists(self.state_file):
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'stages': {}, 'files': {}}
+
+    def _save_state(self):
+        directory = os.path.dirname(self.state_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.state_file)
+
+    def file_hash(self, path):
+        """
+        sha256 of a file, memoized on (size, mtime) so unchanged files are not re-read
+
+        Returns:
+            Hex digest, or None if the file does not exist
+        """
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        with self._lock:
+            cached = self.state['files'].get(path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        with self._lock:
+            self.state['files'][path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                         'sha256': digest.hexdigest()}
+        return digest.hexdigest()
+
+    def stage_key(self, stage):
+        """Content hash of a stage: name, version, parameters and input file hashes."""
+        description = {
+            'name': stage.name,
+            'version': stage.version,
+            'params': stage.params,
+            'inputs': {path: self.file_hash(path) for path in stage.inputs},
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def is_up_to_date(self, stage, key):
+        """True if the recorded run has the same key and its outputs are untouched."""
+        record = self.state['stages'].get(stage.name)
+        if not record or record['key'] != key:
+            return False
+        return all(self.file_hash(path) == record['outputs'].get(path) for path in stage.outputs)
+
+    def plan(self, until=None):
+        """
+        Stages needed to produce `until` (or every stage), in dependency order
+
+        Raises:
+            ValueError: If `until` is not a stage name
+        """
+        if until is not None and until not in self.stages:
+            raise ValueError(f"Unknown stage: {until} (choices: {', '.join(self.stages)})")
+        targets = [until] if until else list(self.stages)
+        ordered, visited = [], set()
+
+        def visit(name):
+            if name in visited:
+                return
+            visited.add(name)
+            for dep in self.deps[name]:
+                visit(dep)
+            ordered.append(name)
+
+        for name in targets:
+            visit(name)
+        return ordered
+
+    def _run_stage(self, stage):
+        """Run one stage unless it is up to date. Returns 'skipped' or 'ran'."""
+        missing = [path for path in stage.inputs if not os.path.exists(path)]
+        if missing:
+            raise FileNotFoundError(f"Stage {stage.name} is missing inputs: {', '.join(missing)}")
+        key = self.stage_key(stage)
+        if self.is_up_to_date(stage, key):
+            metrics.incr('pipeline_stages_skipped')
+            return 'skipped'
+
+        start = time.perf_counter()
+        stage.func()
+        elapsed = time.perf_counter() - start
+        outputs = {path: self.file_hash(path) for path in stage.outputs}
+        absent = [path for path, digest in outputs.items() if digest is None]
+        if absent:
+            raise RuntimeError(f"Stage {stage.name} did not produce: {', '.join(absent)}")
+        with self._lock:
+            self.state['stages'][stage.name] = {'key': key, 'outputs': outputs, 'seconds': round(elapsed, 3)}
+            self._save_state()
+        metrics.incr('pipeline_stages_run')
+        return 'ran'
+
+    def run(self, until=None):
+        """
+        Run the stages needed for `until` (or all), concurrently where the graph allows
+
+        Returns:
+            Dict stage name -> 'ran', 'skipped', 'failed' or 'cancelled'
+        """
+        names = self.plan(until)
+        print(f"Pipeline plan: {' -> '.join(names)}")
+        results = {}
+        pending = list(names)
+        running = {}
+        failed = False
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            while pending or running:
+                if not failed:
+                    for name in list(pending):
+                        if all(results.get(dep) in ('ran', 'skipped') for dep in self.deps[name] if dep in names):
+                            pending.remove(name)
+                            print(f"[pipeline] starting {name}")
+                            running[executor.submit(self._run_stage, self.stages[name])] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                        print(f"[pipeline] {name}: {'up to date, skipped' if results[name] == 'skipped' else 'done'}")
+                    except Exception as e:
+                        results[name] = 'failed'
+                        failed = True
+                        print(f"[pipeline] {name} failed: {e}")
+
+        for name in pending:
+            results[name] = 'cancelled'
+        with self._lock:
+            self._save_state()
+        return {name: results[name] for name in names}
+
+
+def build_pipeline(raw_file, options=None, state_file=STATE_FILE, jobs=DEFAULT_JOBS):
+    """
+    Standard Sinta pipeline graph starting from a scraped CSV
+
+    preprocess -> nlp -> {label, cluster, topics, index, similar} -> cube,
+    and preprocess -> authors. Scraping itself stays outside the graph
+    because it needs credentials and network access.
+
+    Args:
+        raw_file: Scraped CSV (sinta_articles_{start}_to_{end}.csv)
+        options: Dict of stage options (label_file, model_file, label_backend,
+            label_jobs, label_top_k, review_file, review_threshold, clusters,
+            cluster_plot, topic_method, topic_count, index_dir, similar_dir,
+            similar_threshold, similar_probe, authors_dir, cube_file, chunk_rows,
+            preprocess_workers, spill_dir)
+        state_file: Cache state file
+        jobs: Number of stages that may run at the same time
+
+    Returns:
+        Pipeline
+    """
+    from interfaces.analytics import CUBE_FILE, update_cube
+    from interfaces.authors import AUTHORS_DIR, build_author_index
+    from interfaces.clustering import cluster_articles, feature_files
+    from interfaces.csv_preprocessor import preprocess_csv
+    from interfaces.label_sdgs import (
+        DEFAULT_BACKEND, DEFAULT_N_JOBS, DEFAULT_TOP_K, LABEL_FILE,
+        REVIEW_CONFIDENCE_THRESHOLD, REVIEW_FILE, label_articles,
+    )
+    from interfaces.nlp_processor import process_nlp
+    from interfaces.search_index import INDEX_DIR, build_index
+    from interfaces.similarity import DEFAULT_N_PROBE, DEFAULT_THRESHOLD, SIMILARITY_DIR, find_similar_pairs
+    from interfaces.topics import DEFAULT_METHOD, DEFAULT_N_TOPICS, model_topics
+
+    defaults = {
+        'label_file': LABEL_FILE, 'model_file': None, 'label_backend': DEFAULT_BACKEND,
+        'label_jobs': DEFAULT_N_JOBS, 'label_top_k': DEFAULT_TOP_K, 'review_file': REVIEW_FILE,
+        'review_threshold': REVIEW_CONFIDENCE_THRESHOLD, 'clusters': None,
+        'cluster_plot': None, 'topic_method': DEFAULT_METHOD,
+        'topic_count': DEFAULT_N_TOPICS, 'index_dir': INDEX_DIR, 'similar_dir': SIMILARITY_DIR,
+        'similar_threshold': DEFAULT_THRESHOLD, 'similar_probe': DEFAULT_N_PROBE,
+        'authors_dir': AUTHORS_DIR, 'cube_file': CUBE_FILE, 'chunk_rows': None, 'preprocess_workers': None,
+        'spill_dir': None,
+    }
+    opts = {**defaults, **{key: value for key, value in (options or {}).items() if value is not None}}
+
+    # Output names follow the defaults of each stage function
+    base, ext = os.path.splitext(raw_file)
+    processed_file = f"{base}_processed{ext}"
+    nlp_file = f"{base}_processed_nlp{ext}"
+    nlp_base = os.path.splitext(nlp_file)[0]
+    vectorizer_file, feature_file = feature_files(nlp_file)
+    labeled_file = f"{base}_labeled.csv"
+    clustered_file = f"{nlp_base}_clustered.csv"
+
+    label_params = {key: opts[key] for key in ('label_backend', 'label_top_k', 'review_threshold')}
+    stages = [
+        # Streaming mode gives the same output, so chunk_rows is not part of the cache key
+        Stage('preprocess', lambda: preprocess_csv(raw_file, processed_file, chunk_rows=opts['chunk_rows'],
+                                                   workers=opts['preprocess_workers'], spill_dir=opts['spill_dir']),
+              inputs=[raw_file], outputs=[processed_file], version=3),
+        Stage('nlp', lambda: process_nlp(processed_file, nlp_file, vectorize=True),
+              inputs=[processed_file], outputs=[nlp_file, vectorizer_file, feature_file], version=2),
+        Stage('authors', lambda: build_author_index(processed_file, opts['authors_dir']),
+              inputs=[processed_file], outputs=[os.path.join(opts['authors_dir'], 'meta.json')]),
+        Stage('label', lambda: label_articles(nlp_file, labeled_file, label_file=opts['label_file'],
+                                              model_file=opts['model_file'], backend=opts['label_backend'],
+                                              n_jobs=opts['label_jobs'], top_k=opts['label_top_k'],
+                                              review_file=opts['review_file'],
+                                              review_threshold=opts['review_threshold']),
+              inputs=[nlp_file, opts['label_file']], outputs=[labeled_file], params=label_params),
+        Stage('cluster', lambda: cluster_articles(nlp_file, clustered_file, k=opts['clusters'],
+                                                  plot_file=opts['cluster_plot']),
+              inputs=[nlp_file, vectorizer_file, feature_file], outputs=[clustered_file],
+              params={'clusters': opts['clusters']}),
+        Stage('topics', lambda: model_topics(nlp_file, method=opts['topic_method'], n_topics=opts['topic_count']),
+              inputs=[nlp_file], outputs=[f"{nlp_base}_topic_trends.csv", f"{nlp_base}_topics.csv"],
+              params={'method': opts['topic_method'], 'n_topics': opts['topic_count']}),
+        Stage('index', lambda: build_index(nlp_file, opts['index_dir']),
+              inputs=[nlp_file], outputs=[os.path.join(opts['index_dir'], 'meta.json')]),
+        Stage('similar', lambda: find_similar_pairs(nlp_file, index_dir=opts['similar_dir'],
+                                                    threshold=opts['similar_threshold'],
+                                                    n_probe=opts['similar_probe']),
+              inputs=[nlp_file, vectorizer_file, feature_file], outputs=[f"{nlp_base}_similar_pairs.csv"],
+              params={'threshold': opts['similar_threshold'], 'n_probe': opts['similar_probe']}),
+        Stage('cube', lambda: update_cube(labeled_file, clustered_file, cube_file=opts['cube_file']),
+              inputs=[labeled_file, clustered_file], outputs=[opts['cube_file']]),
+    ]
+    return Pipeline(stages, state_file=state_file, jobs=jobs)
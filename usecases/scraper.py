@@ -1,18 +1,72 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+# Selenium is imported inside the browser functions so the CLI, replay and merge start without it
 from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
 import time
-import csv
 import os
 import re
-from entities.article import Article
+from entities.article import Article, ArticleBatch
 from interfaces.writer import write_articles_to_csv
+from interfaces.metrics import metrics
+from interfaces.page_archive import ARCHIVE_FILE, PageArchive, read_page
 
-def scrape_articles_with_login(start_page, end_page, email, password):
+SITE_URL = "https://sinta.kemdikbud.go.id"
+LOGIN_PATH = "/logins"
+LISTING_PATH = "/affiliations/profile/398/?view=googlescholar&page={}"
+LOGIN_URL = SITE_URL + LOGIN_PATH
+LISTING_URL = SITE_URL + LISTING_PATH
+
+# Pause between listing pages (rate limiting) and before retrying a failed page, in seconds
+PAGE_DELAY = 0.5
+RETRY_DELAY = 1.0
+
+# 'default' renders everything in a visible window; 'lean' is headless, eager and skips non-essential resources
+BROWSER_PROFILES = ('default', 'lean')
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+]
+
+def make_driver(profile='default'):
+    """
+    Start Chrome with one of the BROWSER_PROFILES
+    
+    The lean profile runs headless with pageLoadStrategy 'eager' (driver.get
+    returns at DOMContentLoaded) and blocks images, stylesheets, fonts and media
+    through the DevTools protocol; listing pages only need the HTML.
+    
+    Args:
+        profile: 'default' or 'lean'
+        
+    Returns:
+        Selenium webdriver instance
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile: {profile} (choose from {', '.join(BROWSER_PROFILES)})")
+    options = Options()
+    if profile == 'lean':
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1366,900")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.page_load_strategy = 'eager'
+    else:
+        options.add_argument("--start-maximized")
+    driver = webdriver.Chrome(service=Service(), options=options)
+    if profile == 'lean':
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+def scrape_articles_with_login(start_page, end_page, email, password, archive_file=ARCHIVE_FILE,
+                               browser_profile='default', site_url=SITE_URL, page_delay=PAGE_DELAY):
     """
     Scrapes articles from Sinta Unila journal within the specified page range
     
@@ -21,26 +75,31 @@ def scrape_articles_with_login(start_page, end_page, email, password):
         end_page: The last page to scrape (inclusive)
         email: Email for Sinta login
         password: Password for Sinta login
+        archive_file: Raw HTML archive path (without extension) for offline replay, or None to disable
+        browser_profile: Chrome profile from BROWSER_PROFILES
+        site_url: Base URL of the Sinta site (a local stub for load tests)
+        page_delay: Pause between pages to avoid rate limiting (seconds)
         
     Returns:
         str: Path to the CSV file containing scraped articles
     """
     # SETUP DRIVER
-    options = Options()
-    options.add_argument("--start-maximized")
-    driver = webdriver.Chrome(service=Service(), options=options)
+    driver = make_driver(browser_profile)
     
     try:
         # Login to Sinta
-        if not login(driver, email, password):
+        if not login(driver, email, password, site_url):
             print("Login failed. Exiting.")
             return None
         
+        # Keep the raw HTML of every fetched page so parsing can be replayed offline
+        archive = PageArchive(archive_file) if archive_file else None
+        
         # Track unique articles using a composite key of normalized title and year
         unique_article_keys = set()
         
-        # List to store all articles
-        all_articles = []
+        # Columnar container for all articles
+        all_articles = ArticleBatch()
         
         # Define single output filename
         output_filename = f"sinta_articles_{start_page}_to_{end_page}.csv"
@@ -51,10 +110,8 @@ def scrape_articles_with_login(start_page, end_page, email, password):
             existing_articles = load_existing_articles(output_filename)
             
             # Extract keys from existing articles
-            for article in existing_articles:
-                key = get_article_key(article)
-                unique_article_keys.add(key)
-                
+            unique_article_keys.update(article_keys(existing_articles))
+            
             all_articles.extend(existing_articles)
             print(f"Loaded {len(existing_articles)} existing articles")
         
@@ -62,52 +119,36 @@ def scrape_articles_with_login(start_page, end_page, email, password):
         for page_num in range(start_page, end_page + 1):
             print(f"Scraping page {page_num}...")
             
-            # Try up to 3 times to scrape the page
-            max_retries = 3
-            for retry in range(max_retries):
-                try:
-                    # Check if we need to login again
-                    if is_on_homepage(driver):
-                        print("Session expired. Logging in again.")
-                        if not login(driver, email, password):
-                            print("Re-login failed. Exiting.")
-                            return None
-                    
-                    articles = scrape_page(driver, page_num)
-                    if articles:
-                        # Add only non-duplicate articles
-                        unique_articles = []
-                        for article in articles:
-                            key = get_article_key(article)
-                            if key not in unique_article_keys:
-                                unique_article_keys.add(key)
-                                unique_articles.append(article)
-                        
-                        if unique_articles:
-                            all_articles.extend(unique_articles)
-                            print(f"Added {len(unique_articles)} new unique articles (filtered out {len(articles) - len(unique_articles)} duplicates)")
-                        else:
-                            print(f"No new unique articles found on page {page_num}")
-                        
-                        break  # Success, exit retry loop
-                    else:
-                        print(f"No articles found on page {page_num}, retry {retry + 1}/{max_retries}")
-                        time.sleep(1)  # Reduced wait time before retry
+            try:
+                articles = fetch_page(driver, page_num, email, password, archive, site_url=site_url)
+            except RuntimeError as e:
+                print(f"{e}. Exiting.")
+                return None
+            
+            if articles:
+                # Add only non-duplicate articles
+                unique_articles = []
+                for article in articles:
+                    key = get_article_key(article)
+                    if key not in unique_article_keys:
+                        unique_article_keys.add(key)
+                        unique_articles.append(article)
                 
-                except Exception as e:
-                    print(f"Error on page {page_num}, retry {retry + 1}/{max_retries}: {e}")
-                    time.sleep(1)  # Reduced wait time on error
-                    
-                    # If last retry failed, continue to next page
-                    if retry == max_retries - 1:
-                        print(f"Failed to scrape page {page_num} after {max_retries} attempts")
+                metrics.incr('articles_new', len(unique_articles))
+                metrics.incr('articles_duplicate', len(articles) - len(unique_articles))
+                if unique_articles:
+                    all_articles.extend(unique_articles)
+                    print(f"Added {len(unique_articles)} new unique articles (filtered out {len(articles) - len(unique_articles)} duplicates)")
+                else:
+                    print(f"No new unique articles found on page {page_num}")
             
             # Update the single CSV file with current progress - clear file and write all at once
             write_articles_to_csv(all_articles, output_filename)
             print(f"Progress updated: {len(all_articles)} articles saved to {output_filename}")
+            metrics.export_prometheus()
             
             # Wait between pages to avoid rate limiting
-            time.sleep(0.5)  # Reduced wait time between pages
+            time.sleep(page_delay)
         
         # Final deduplication pass to ensure no duplicates
         final_articles = deduplicate_articles(all_articles)
@@ -127,6 +168,254 @@ def scrape_articles_with_login(start_page, end_page, email, password):
     finally:
         driver.quit()
 
+def refresh_articles_with_login(start_page, end_page, email, password, stop_after=5,
+                                archive_file=ARCHIVE_FILE, output_filename=None, browser_profile='default',
+                                site_url=SITE_URL, page_delay=PAGE_DELAY):
+    """
+    Delta refresh of an existing scrape: re-fetch pages newest first and update in place
+    
+    Pages are visited in ascending order (the listing shows the newest
+    publications first). Existing articles get their Cited and Year updated,
+    new articles are appended, and the run stops after `stop_after`
+    consecutive pages without any change.
+    
+    Args:
+        start_page: The first page of the scraped range
+        end_page: The last page of the scraped range (inclusive)
+        email: Email for Sinta login
+        password: Password for Sinta login
+        stop_after: Number of consecutive unchanged pages that ends the refresh
+        archive_file: Raw HTML archive path (without extension), or None to disable
+        output_filename: CSV to refresh (default: sinta_articles_{start}_to_{end}.csv)
+        browser_profile: Chrome profile from BROWSER_PROFILES
+        site_url: Base URL of the Sinta site (a local stub for load tests)
+        page_delay: Pause between pages to avoid rate limiting (seconds)
+        
+    Returns:
+        str: Path to the refreshed CSV file
+    """
+    output_filename = output_filename or f"sinta_articles_{start_page}_to_{end_page}.csv"
+    if not os.path.exists(output_filename):
+        print(f"No existing file {output_filename} to refresh, run a full scrape first")
+        return None
+    
+    driver = make_driver(browser_profile)
+    
+    try:
+        if not login(driver, email, password, site_url):
+            print("Login failed. Exiting.")
+            return None
+        
+        archive = PageArchive(archive_file) if archive_file else None
+        articles = load_existing_articles(output_filename)
+        print(f"Loaded {len(articles)} existing articles from {output_filename}")
+        
+        def fetch(page_num):
+            print(f"Refreshing page {page_num}...")
+            return fetch_page(driver, page_num, email, password, archive, site_url=site_url)
+        
+        def save_progress():
+            write_articles_to_csv(articles, output_filename)
+            metrics.export_prometheus()
+        
+        state_file = fingerprint_file(output_filename)
+        try:
+            summary = refresh_pages(fetch, range(start_page, end_page + 1), articles,
+                                    load_fingerprints(state_file), stop_after, on_change=save_progress,
+                                    page_delay=page_delay)
+        except RuntimeError as e:
+            print(f"{e}. Exiting.")
+            return None
+        finally:
+            write_articles_to_csv(articles, output_filename)
+        save_fingerprints(state_file, summary['fingerprints'])
+        
+        print(f"Refreshed {summary['pages_fetched']} of {end_page - start_page + 1} pages: "
+              f"{summary['updated']} articles updated, {summary['added']} new articles")
+        print(f"All data saved to {output_filename}")
+        return output_filename
+    
+    except Exception as e:
+        print(f"Error during refresh: {e}")
+        return None
+    
+    finally:
+        driver.quit()
+
+def refresh_pages(fetch, pages, articles, fingerprints, stop_after=5, on_change=None, page_delay=PAGE_DELAY):
+    """
+    Core of the delta refresh, independent of the browser
+    
+    Args:
+        fetch: Function page_num -> list of Article objects
+        pages: Page numbers in priority order
+        articles: ArticleBatch of existing articles, updated and extended in place
+        fingerprints: Dict page number (str) -> fingerprint from the previous run
+        stop_after: Number of consecutive unchanged pages that ends the refresh
+        on_change: Optional callback after a page that changed something
+        page_delay: Pause between pages to avoid rate limiting (seconds)
+        
+    Returns:
+        Dict with pages_fetched, updated, added and the new fingerprints
+    """
+    # Row position of every existing article (first occurrence wins)
+    by_key = {}
+    for position, key in enumerate(map(make_refresh_key, articles.link, articles.title)):
+        by_key.setdefault(key, position)
+    title_keys = set(article_keys(articles))
+    fingerprints = dict(fingerprints)
+    summary = {'pages_fetched': 0, 'updated': 0, 'added': 0}
+    unchanged_run = 0
+    pages = list(pages)
+    
+    for index, page_num in enumerate(pages):
+        page_articles = fetch(page_num)
+        summary['pages_fetched'] += 1
+        if not page_articles:
+            continue  # failed page: neither changed nor unchanged
+        
+        fingerprint = fingerprint_articles(page_articles)
+        updated = added = 0
+        if fingerprints.get(str(page_num)) != fingerprint:
+            for article in page_articles:
+                position = by_key.get(refresh_key(article))
+                if position is not None:
+                    if (articles.cited[position], articles.year[position]) != (article.cited, article.year):
+                        articles.cited[position] = article.cited
+                        articles.year[position] = article.year
+                        updated += 1
+                elif get_article_key(article) not in title_keys:
+                    by_key[refresh_key(article)] = len(articles)
+                    title_keys.add(get_article_key(article))
+                    articles.append(article)
+                    added += 1
+            fingerprints[str(page_num)] = fingerprint
+        
+        summary['updated'] += updated
+        summary['added'] += added
+        metrics.incr('articles_updated', updated)
+        metrics.incr('articles_new', added)
+        if updated or added:
+            unchanged_run = 0
+            print(f"Page {page_num}: {updated} updated, {added} new articles")
+            if on_change:
+                on_change()
+        else:
+            unchanged_run += 1
+            metrics.incr('pages_unchanged')
+            if unchanged_run >= stop_after:
+                print(f"{unchanged_run} consecutive unchanged pages, stopping at page {page_num}")
+                break
+        
+        # Wait between pages to avoid rate limiting (not after the last one)
+        if index < len(pages) - 1:
+            time.sleep(page_delay)
+    
+    summary['fingerprints'] = fingerprints
+    return summary
+
+def refresh_key(article):
+    """
+    Stable identity for refresh: the article link, or the normalized title if there is no link
+    
+    Unlike get_article_key it does not include the year, so a corrected year
+    updates the existing row instead of creating a new one.
+    """
+    return make_refresh_key(article.link, article.title)
+
+def make_refresh_key(link, title):
+    """Refresh key from raw link and title values (see refresh_key)."""
+    if link and link != "No link":
+        return link
+    return normalize_title(title)
+
+def fingerprint_articles(articles):
+    """
+    Fingerprint of a listing page's content (order-insensitive link, year and citations)
+    
+    Args:
+        articles: List of Article objects parsed from one page
+        
+    Returns:
+        Hex digest string
+    """
+    rows = sorted(f"{refresh_key(article)}\t{article.year}\t{article.cited}" for article in articles)
+    return hashlib.sha256("\n".join(rows).encode('utf-8')).hexdigest()
+
+def fingerprint_file(csv_file):
+    """Path of the page fingerprint state kept next to a scraped CSV."""
+    return f"{os.path.splitext(csv_file)[0]}_fingerprints.json"
+
+def load_fingerprints(state_file):
+    """Load page fingerprints from a previous refresh (empty dict if none)."""
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_fingerprints(state_file, fingerprints):
+    """Save page fingerprints atomically."""
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(fingerprints, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, state_file)
+
+def fetch_page(driver, page_num, email, password, archive=None, max_retries=3, site_url=SITE_URL,
+               retry_delay=RETRY_DELAY):
+    """
+    Scrape one listing page, retrying and logging in again when the session expires
+    
+    Args:
+        driver: Selenium webdriver instance
+        page_num: Page number to scrape
+        email: Email for Sinta re-login
+        password: Password for Sinta re-login
+        archive: Optional PageArchive that stores the raw page HTML
+        max_retries: Number of attempts before giving up on the page
+        site_url: Base URL of the Sinta site
+        retry_delay: Pause before retrying a failed attempt (seconds)
+        
+    Returns:
+        List of Article objects (empty if the page failed on every attempt)
+        
+    Raises:
+        RuntimeError: If the session expired and re-login failed
+    """
+    page_start = time.perf_counter()
+    for retry in range(max_retries):
+        try:
+            if retry > 0:
+                metrics.incr('page_retries')
+            
+            # Check if we need to login again
+            if is_on_homepage(driver, site_url):
+                print("Session expired. Logging in again.")
+                metrics.incr('relogins')
+                if not login(driver, email, password, site_url):
+                    raise RuntimeError("Re-login failed")
+            
+            fetch_start = time.perf_counter()
+            articles = scrape_page(driver, page_num, archive, listing_url=site_url + LISTING_PATH)
+            metrics.observe('page_fetch_seconds', time.perf_counter() - fetch_start, page=page_num)
+            if articles:
+                metrics.incr('pages_scraped')
+                # Latency of the whole page including retries and re-logins
+                metrics.observe('page_total_seconds', time.perf_counter() - page_start, page=page_num)
+                return articles
+            
+            print(f"No articles found on page {page_num}, retry {retry + 1}/{max_retries}")
+            time.sleep(retry_delay)
+        
+        except RuntimeError:
+            raise
+        except Exception as e:
+            print(f"Error on page {page_num}, retry {retry + 1}/{max_retries}: {e}")
+            time.sleep(retry_delay)
+    
+    print(f"Failed to scrape page {page_num} after {max_retries} attempts")
+    metrics.incr('pages_failed')
+    return []
+
 def normalize_title(title):
     """
     Normalize a title by removing special characters, extra spaces, and lowercase
@@ -153,74 +442,78 @@ def get_article_key(article):
     Returns:
         A string key
     """
+    return make_article_key(article.title, article.year)
+
+def make_article_key(title, year):
+    """Composite key from a raw title and year (see get_article_key)."""
     # Use normalized title and year as a composite key
-    norm_title = normalize_title(article.title)
-    return f"{norm_title}_{article.year}"
+    return f"{normalize_title(title)}_{year}"
+
+def article_keys(batch):
+    """
+    Keys of every article in an ArticleBatch, computed column-wise
+    
+    Args:
+        batch: ArticleBatch
+        
+    Returns:
+        List of string keys in row order
+    """
+    return list(map(make_article_key, batch.title, batch.year))
 
 def deduplicate_articles(articles):
     """
-    Remove duplicate articles from a list
+    Remove duplicate articles, keeping the first occurrence
     
     Args:
-        articles: List of Article objects
+        articles: ArticleBatch (or iterable of Article objects)
         
     Returns:
-        List of unique Article objects
+        ArticleBatch of unique articles
     """
-    unique_keys = {}
-    unique_articles = []
+    if not isinstance(articles, ArticleBatch):
+        articles = ArticleBatch.from_articles(articles)
+    unique_keys = set()
+    keep = []
     
-    for article in articles:
-        key = get_article_key(article)
+    for position, key in enumerate(article_keys(articles)):
         if key not in unique_keys:
-            unique_keys[key] = True
-            unique_articles.append(article)
+            unique_keys.add(key)
+            keep.append(position)
     
-    return unique_articles
+    return articles if len(keep) == len(articles) else articles.take(keep)
 
 def load_existing_articles(csv_file):
     """
-    Load existing articles from a CSV file
+    Load existing articles from a CSV file in one pass
     
     Args:
         csv_file: Path to the CSV file
         
     Returns:
-        List of Article objects
+        ArticleBatch (empty if the file cannot be read)
     """
-    articles = []
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if 'Title' in row and 'Link' in row and 'Authors' in row and 'Year' in row and 'Cited' in row:
-                    article = Article(
-                        row['Title'],
-                        row['Link'],
-                        row['Authors'],
-                        row['Year'],
-                        row['Cited']
-                    )
-                    articles.append(article)
+        return ArticleBatch.read_csv(csv_file)
     except Exception as e:
         print(f"Error loading existing articles: {e}")
-    
-    return articles
+        return ArticleBatch()
 
-def is_on_homepage(driver):
+def is_on_homepage(driver, site_url=SITE_URL):
     """
     Check if the driver is currently on the Sinta homepage
     
     Args:
         driver: Selenium webdriver instance
+        site_url: Base URL of the Sinta site
         
     Returns:
         True if on homepage, False otherwise
     """
     current_url = driver.current_url
-    return current_url == "https://sinta.kemdikbud.go.id/" or current_url == "https://sinta.kemdikbud.go.id"
+    return current_url == f"{site_url}/" or current_url == site_url
 
-def login(driver, email, password):
+def login(driver, email, password, site_url=SITE_URL):
     """
     Login to Sinta website
     
@@ -228,13 +521,19 @@ def login(driver, email, password):
         driver: Selenium webdriver instance
         email: Email for login
         password: Password for login
+        site_url: Base URL of the Sinta site
         
     Returns:
         True if login successful, False otherwise
     """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    login_start = time.perf_counter()
     try:
-        LOGIN_URL = "https://sinta.kemdikbud.go.id/logins"
-        driver.get(LOGIN_URL)
+        driver.get(site_url + LOGIN_PATH)
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.NAME, "username"))
         )
@@ -244,8 +543,11 @@ def login(driver, email, password):
         driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
         print("Login submitted.")
 
-        # Wait for page to fully load and redirect to complete
-        time.sleep(2)  # Reduced wait time after login
+        # Wait for the redirect away from the login page instead of a fixed pause
+        try:
+            WebDriverWait(driver, 10).until(lambda d: "login" not in d.current_url)
+        except TimeoutException:
+            pass
         
         # Verify successful login by checking we're not still on login page
         if "login" in driver.current_url:
@@ -253,26 +555,35 @@ def login(driver, email, password):
             return False
             
         print("Login successful!")
+        metrics.observe('login_seconds', time.perf_counter() - login_start)
         return True
         
     except Exception as e:
         print(f"Login error: {e}")
         return False
 
-def scrape_page(driver, page_num):
+def scrape_page(driver, page_num, archive=None, listing_url=LISTING_URL, timings=None):
     """
     Scrape articles from a specific page
     
     Args:
         driver: Selenium webdriver instance
         page_num: Page number to scrape
+        archive: Optional PageArchive that stores the raw page HTML
+        listing_url: Listing URL template with a {} placeholder for the page number
+        timings: Optional dict that receives load_seconds, ready_seconds and parse_seconds
         
     Returns:
         List of Article objects
     """
-    BASE_URL = "https://sinta.kemdikbud.go.id/affiliations/profile/398/?view=googlescholar&page={}"
-    page_url = BASE_URL.format(page_num)
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    page_url = listing_url.format(page_num)
+    start = time.perf_counter()
     driver.get(page_url)
+    loaded = time.perf_counter()
     print(f"Navigated to: {driver.current_url}")
     
     # Check if we were redirected away from expected page
@@ -288,8 +599,38 @@ def scrape_page(driver, page_num):
     except:
         print("No articles found or page structure changed")
         return []
+    ready = time.perf_counter()
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    html = driver.page_source
+    if archive is not None:
+        archive.put(page_num, driver.current_url, html)
+    articles = parse_articles(html)
+    
+    page_timings = {
+        'load_seconds': loaded - start,
+        'ready_seconds': ready - loaded,
+        'parse_seconds': time.perf_counter() - ready,
+    }
+    for name, seconds in page_timings.items():
+        metrics.observe(f'page_{name}', seconds, page=page_num)
+    print(f"Page {page_num} timings: load {page_timings['load_seconds']:.3f}s, "
+          f"ready {page_timings['ready_seconds']:.3f}s, parse {page_timings['parse_seconds']:.3f}s")
+    if timings is not None:
+        timings.update(page_timings)
+    return articles
+
+def parse_articles(html, verbose=True):
+    """
+    Parse articles from the HTML of a Sinta listing page
+    
+    Args:
+        html: Raw HTML source of the listing page
+        verbose: Print every article found
+        
+    Returns:
+        List of Article objects
+    """
+    soup = BeautifulSoup(html, "html.parser")
     items = soup.select("div.ar-list-item.mb-5")
     
     if not items:
@@ -313,8 +654,75 @@ def scrape_page(driver, page_num):
             articles.append(article)
             
             # Print for debugging (only the title to reduce output)
-            print(f"Found article: {title[:50]}...")
+            if verbose:
+                print(f"Found article: {title[:50]}...")
         except Exception as e:
             print(f"Error parsing article: {e}")
     
-    return articles
\ No newline at end of file
+    return articles
+
+def _parse_archived_pages(archive_file, entries):
+    """
+    Parse a chunk of archived pages (runs in a worker process)
+    
+    Args:
+        archive_file: Archive path (without extension)
+        entries: Archive index entries to parse
+        
+    Returns:
+        List of (page number, list of Article objects)
+    """
+    pack_file = f"{archive_file}.pack"
+    return [(entry['page'], parse_articles(read_page(pack_file, entry), verbose=False)) for entry in entries]
+
+def replay_archive(archive_file=ARCHIVE_FILE, start_page=None, end_page=None, output_filename=None, workers=None):
+    """
+    Re-run parsing over the raw HTML archive without any network access
+    
+    The latest archived copy of every page in range is parsed in parallel,
+    then articles are deduplicated in page order exactly like a live scrape.
+    
+    Args:
+        archive_file: Archive path (without extension)
+        start_page: First page to replay (default: first archived page)
+        end_page: Last page to replay, inclusive (default: last archived page)
+        output_filename: Output CSV (default: sinta_articles_{start}_to_{end}.csv)
+        workers: Number of parser processes (default: all cores)
+        
+    Returns:
+        str: Path to the CSV file, or None if no page is archived in range
+    """
+    archive = PageArchive(archive_file)
+    latest = archive.latest()
+    pages = sorted(page for page in latest
+                   if (start_page is None or page >= start_page) and (end_page is None or page <= end_page))
+    if not pages:
+        print(f"No archived pages found in {archive_file}")
+        return None
+    start_page, end_page = pages[0], pages[-1]
+    output_filename = output_filename or f"sinta_articles_{start_page}_to_{end_page}.csv"
+    
+    workers = workers or os.cpu_count() or 1
+    # A few chunks per worker keeps every core busy without per-page task overhead
+    chunk_size = max(1, len(pages) // (workers * 4))
+    chunks = [[latest[page] for page in pages[i:i + chunk_size]] for i in range(0, len(pages), chunk_size)]
+    
+    with metrics.stage('replay_parse', len(pages)) as stage:
+        if workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = [page for chunk in executor.map(_parse_archived_pages, [archive_file] * len(chunks), chunks)
+                           for page in chunk]
+        else:
+            results = [page for chunk in chunks for page in _parse_archived_pages(archive_file, chunk)]
+        
+        articles = ArticleBatch.from_articles(article for _, page_articles in results for article in page_articles)
+        final_articles = deduplicate_articles(articles)
+        write_articles_to_csv(final_articles, output_filename)
+        stage['rows'] = len(final_articles)
+    
+    missing = (end_page - start_page + 1) - len(pages)
+    metrics.incr('pages_replayed', len(pages))
+    print(f"Replayed {len(pages)} archived pages ({missing} missing in range) in {stage['wall_seconds']:.2f}s")
+    print(f"Parsed {len(final_articles)} unique articles (filtered out {len(articles) - len(final_articles)} duplicates)")
+    print(f"All data saved to {output_filename}")
+    return output_filename
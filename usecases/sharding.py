@@ -0,0 +1,252 @@
+"""
+Sharded scraping across processes and hosts, and merging of the shard outputs.
+
+Workers lease page-range shards from a ShardLeases directory (shared over
+NFS/SMB for multi-host runs), scrape them with their own browser session,
+and hand in one CSV per shard. merge_scraped_files then combines the shard
+outputs (or any set of sinta_articles_{start}_to_{end}.csv files) with a
+streaming k-way merge and global (title, year) deduplication, producing
+the same file a single run over the whole range would.
+
+Example:
+    leases = ShardLeases('data/shards')
+    leases.plan(2503, 3336, shard_pages=25)
+    scrape_shards_with_login('data/shards', email, password)   # on every worker
+    merge_shards('data/shards', 'sinta_articles_2503_to_3336.csv')
+"""
+
+import csv
+import hashlib
+import heapq
+import os
+import re
+import time
+
+from entities.article import COLUMNS, ArticleBatch
+from interfaces.metrics import metrics
+from interfaces.page_archive import PageArchive
+from interfaces.shard_leases import DEFAULT_LEASE_TIMEOUT, ShardLeases, default_worker_id
+from interfaces.writer import write_articles_to_csv
+from usecases.scraper import PAGE_DELAY, SITE_URL, fetch_page, get_article_key, login, make_article_key, make_driver
+
+RANGE_PATTERN = re.compile(r'_(\d+)_to_(\d+)')
+
+
+def run_shard_worker(leases, worker_id, fetch, max_shards=None, page_delay=PAGE_DELAY):
+    """
+    Core of a shard worker, independent of the browser
+
+    Shards are leased one at a time until none is left. The lease heartbeat
+    is renewed after every page; if it turns out the lease was taken over
+    (this worker was considered dead), the shard is abandoned.
+
+    Args:
+        leases: ShardLeases of the shared shard directory
+        worker_id: Unique id of this worker
+        fetch: Function page_num -> list of Article objects
+        max_shards: Stop after this many completed shards (None: until no shard is left)
+        page_delay: Pause between pages to avoid rate limiting (seconds)
+
+    Returns:
+        Dict with shards, pages, articles and lost (abandoned shards)
+    """
+    summary = {'shards': 0, 'pages': 0, 'articles': 0, 'lost': 0}
+    while max_shards is None or summary['shards'] < max_shards:
+        shard = leases.acquire(worker_id)
+        if shard is None:
+            break
+        print(f"Worker {worker_id}: shard {shard['id']} (pages {shard['start']}-{shard['end']}, "
+              f"attempt {shard['attempt']})")
+        tmp_file = f"{leases.output_file(shard)}.{worker_id}.tmp"
+        articles = ArticleBatch()
+        unique_keys = set()
+        lost = False
+        try:
+            with metrics.stage('scrape_shard') as stage:
+                for page_num in range(shard['start'], shard['end'] + 1):
+                    page_articles = fetch(page_num)
+                    added = 0
+                    for article in page_articles:
+                        key = get_article_key(article)
+                        if key not in unique_keys:
+                            unique_keys.add(key)
+                            articles.append(article)
+                            added += 1
+                    metrics.incr('articles_new', added)
+                    metrics.incr('articles_duplicate', len(page_articles) - added)
+                    summary['pages'] += 1
+                    if not leases.heartbeat(shard, worker_id, page=page_num):
+                        lost = True
+                        break
+                    # No delay after the shard's last page; the next request belongs to another shard
+                    if page_num < shard['end']:
+                        time.sleep(page_delay)
+                stage['rows'] = len(articles)
+            if not lost:
+                write_articles_to_csv(articles, tmp_file)
+                lost = not leases.complete(shard, worker_id, tmp_file, len(articles))
+        except BaseException:
+            # Hand the shard back right away instead of waiting for the lease to expire
+            leases.release(shard, worker_id)
+            raise
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+        if lost:
+            summary['lost'] += 1
+            metrics.incr('shards_lost')
+            print(f"Worker {worker_id}: lease on shard {shard['id']} was taken over, result discarded")
+            continue
+        summary['shards'] += 1
+        summary['articles'] += len(articles)
+        metrics.incr('shards_completed')
+        print(f"Worker {worker_id}: shard {shard['id']} done, {len(articles)} articles "
+              f"in {stage['wall_seconds']:.1f}s")
+    return summary
+
+
+def scrape_shards_with_login(shard_dir, email, password, worker_id=None, lease_timeout=DEFAULT_LEASE_TIMEOUT,
+                             archive=True, browser_profile='default', max_shards=None, site_url=SITE_URL,
+                             page_delay=PAGE_DELAY):
+    """
+    Shard worker with its own Selenium session: log in once, then scrape leased shards
+
+    Args:
+        shard_dir: Shared shard directory (see ShardLeases.plan)
+        email: Email for Sinta login
+        password: Password for Sinta login
+        worker_id: Unique worker id (default: hostname-pid)
+        lease_timeout: Seconds without heartbeat after which a lease counts as dead
+        archive: Keep the raw HTML in a per-worker archive under shard_dir/archive
+        browser_profile: Chrome profile from BROWSER_PROFILES
+        max_shards: Stop after this many shards (None: until no shard is left)
+        site_url: Base URL of the Sinta site (a local stub for load tests)
+        page_delay: Pause between pages to avoid rate limiting (seconds)
+
+    Returns:
+        Summary dict from run_shard_worker, or None if login failed
+    """
+    worker_id = worker_id or default_worker_id()
+    leases = ShardLeases(shard_dir, lease_timeout)
+    leases.load_plan()
+    # One archive per worker: PageArchive appends are not safe across processes
+    page_archive = PageArchive(os.path.join(shard_dir, 'archive', worker_id)) if archive else None
+    driver = make_driver(browser_profile)
+
+    try:
+        if not login(driver, email, password, site_url):
+            print("Login failed. Exiting.")
+            return None
+
+        def fetch(page_num):
+            print(f"Scraping page {page_num}...")
+            return fetch_page(driver, page_num, email, password, page_archive, site_url=site_url)
+
+        summary = run_shard_worker(leases, worker_id, fetch, max_shards=max_shards, page_delay=page_delay)
+        print(f"Worker {worker_id} finished: {summary['shards']} shards, {summary['pages']} pages, "
+              f"{summary['articles']} articles ({summary['lost']} shards lost)")
+        return summary
+
+    finally:
+        driver.quit()
+
+
+def page_range(csv_file):
+    """(start, end) page range from a sinta_articles_{start}_to_{end}.csv name, or None."""
+    match = RANGE_PATTERN.search(os.path.basename(csv_file))
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _read_rows(csv_file, order):
+    """Yield ((order, row number), row) for every well-formed row of a scraped CSV, in file order."""
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [column for column in COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"Missing columns in {csv_file}: {', '.join(missing)}")
+        positions = [header.index(column) for column in COLUMNS]
+        for row_num, row in enumerate(reader):
+            if len(row) == len(header):
+                yield (order, row_num), [row[position] for position in positions]
+
+
+def merge_scraped_files(input_files, output_file):
+    """
+    Streaming k-way merge of scraped CSV files with global deduplication
+
+    Inputs are merged in page order: by the start page of each (shard or
+    sinta_articles_{start}_to_{end}.csv) file, then row order, so the first
+    occurrence of every (title, year) key wins exactly as in a single run.
+    Files without a page range in their name keep their argument order.
+    Only one row per input and an 8-byte digest per unique key are kept in
+    memory; rows are written as they are merged.
+
+    Args:
+        input_files: List of CSV paths, or of (start page, path) tuples
+        output_file: Merged CSV path (written atomically)
+
+    Returns:
+        Dict with files, rows, articles and duplicates
+    """
+    ordered = []
+    for position, item in enumerate(input_files):
+        start, path = item if isinstance(item, tuple) else ((page_range(item) or (0, 0))[0], item)
+        ordered.append(((start, position), path))
+
+    seen = set()
+    summary = {'files': len(ordered), 'rows': 0, 'articles': 0, 'duplicates': 0}
+    tmp_file = f"{output_file}.tmp"
+    with metrics.stage('merge_shards') as stage:
+        try:
+            with open(tmp_file, 'w', newline='', encoding='utf-8') as out:
+                writer = csv.writer(out)
+                writer.writerow(COLUMNS)
+                for _, row in heapq.merge(*(_read_rows(path, order) for order, path in ordered), key=lambda item: item[0]):
+                    summary['rows'] += 1
+                    digest = hashlib.blake2b(make_article_key(row[0], row[3]).encode('utf-8'), digest_size=8).digest()
+                    if digest in seen:
+                        summary['duplicates'] += 1
+                        continue
+                    seen.add(digest)
+                    writer.writerow(row)
+                    summary['articles'] += 1
+            os.replace(tmp_file, output_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        stage['rows'] = summary['articles']
+    metrics.incr('articles_duplicate', summary['duplicates'])
+    print(f"Merged {summary['files']} files ({summary['rows']} rows) into {summary['articles']} unique articles "
+          f"(filtered out {summary['duplicates']} duplicates) in {stage['wall_seconds']:.2f}s")
+    print(f"All data saved to {output_file}")
+    return summary
+
+
+def merge_shards(shard_dir, output_file=None, allow_partial=False):
+    """
+    Merge the outputs of all completed shards of a shard directory
+
+    Args:
+        shard_dir: Shard directory (see ShardLeases.plan)
+        output_file: Merged CSV (default: sinta_articles_{start}_to_{end}.csv of the plan)
+        allow_partial: Merge even if some shards are not done yet
+
+    Returns:
+        str: Path to the merged CSV, or None if shards are still pending
+    """
+    leases = ShardLeases(shard_dir)
+    plan = leases.load_plan()
+    status = leases.status()
+    pending = [shard for shard in status if shard['state'] != 'done']
+    if pending and not allow_partial:
+        print(f"{len(pending)} of {len(status)} shards are not done yet "
+              f"(first: shard {pending[0]['id']}, pages {pending[0]['start']}-{pending[0]['end']})")
+        return None
+    output_file = output_file or f"sinta_articles_{plan['start_page']}_to_{plan['end_page']}.csv"
+    merge_scraped_files([(shard['start'], leases.output_file(shard)) for shard in status if shard['state'] == 'done'],
+                        output_file)
+    return output_file